@@ -0,0 +1,85 @@
+"""Benchmark the per-row ORM save path against the bulk loader (and COPY on PostgreSQL) on the football player table"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, Integer, String, create_engine
+from sqlalchemy.orm import Session
+
+from src.database.bulk import replace_rows
+from src.database.copy_loader import copy_replace_rows, supports_copy
+from src.database.db import Base
+from src.database.models.usports.football import FootballPlayerStats
+
+SCOPE = {"league": "m", "season_option": "regular"}
+
+
+def make_player_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic frame shaped like usports_fball_players output"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for column in FootballPlayerStats.__table__.columns:
+        if column.primary_key or column.name in SCOPE:
+            continue
+        if isinstance(column.type, Integer):
+            data[column.name] = rng.integers(0, 500, rows)
+        elif isinstance(column.type, Float):
+            data[column.name] = rng.random(rows) * 100
+        elif isinstance(column.type, String):
+            data[column.name] = [f"{column.name[:4]}{i}"[: column.type.length] for i in range(rows)]
+    return pd.DataFrame(data)
+
+
+def save_with_orm(session: Session, df: pd.DataFrame):
+    """The pre-bulk save path: one Series and one ORM object per row"""
+    session.query(FootballPlayerStats).filter_by(**SCOPE).delete()
+    df = df.copy()
+    df["league"] = SCOPE["league"]
+    df["season_option"] = SCOPE["season_option"]
+    for _, row in df.iterrows():
+        session.add(FootballPlayerStats(**row.to_dict()))
+
+
+def save_with_bulk(session: Session, df: pd.DataFrame):
+    replace_rows(session, FootballPlayerStats.__table__, df, SCOPE)  # type: ignore[arg-type]
+
+
+def save_with_copy(session: Session, df: pd.DataFrame):
+    copy_replace_rows(session, FootballPlayerStats.__table__, df, SCOPE)  # type: ignore[arg-type]
+
+
+def save_with_copy_binary(session: Session, df: pd.DataFrame):
+    copy_replace_rows(session, FootballPlayerStats.__table__, df, SCOPE, binary=True)  # type: ignore[arg-type]
+
+
+def run(url: str, rows: int, repeat: int):
+    engine = create_engine(url)
+    Base.metadata.create_all(engine, tables=[FootballPlayerStats.__table__])  # type: ignore[list-item]
+    df = make_player_frame(rows)
+
+    savers = [("orm iterrows", save_with_orm), ("bulk insert", save_with_bulk)]
+    with Session(engine) as session:
+        if supports_copy(session):
+            savers += [("copy text", save_with_copy), ("copy binary", save_with_copy_binary)]
+
+    print(f"Football player stats: {rows} rows x {len(df.columns)} columns, best of {repeat}")
+    for name, save in savers:
+        best = float("inf")
+        for _ in range(repeat):
+            with Session(engine) as session:
+                start = time.perf_counter()
+                save(session, df)
+                session.commit()
+                best = min(best, time.perf_counter() - start)
+        print(f"  {name:<14} {best * 1000:9.1f} ms  {rows / best:12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite://", help="Database URL (default: in-memory SQLite)")
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.url, args.rows, args.repeat)
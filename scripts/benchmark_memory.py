@@ -0,0 +1,124 @@
+"""Compare peak RSS of a full-season save with and without per-frame copies for league/season metadata.
+
+Both modes insert through the same chunked loader (bulk_insert, INSERT_CHUNK_ROWS
+rows per executemany), so the difference is the copy of every frame, not how
+rows are converted or batched.
+"""
+
+import argparse
+import resource
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Float, Integer, String, Table, create_engine, delete
+from sqlalchemy.orm import Session
+
+from src.database.bulk import bulk_insert, replace_rows, scope_filter
+from src.database.db import Base
+from src.pipelines.usports import (
+    BasketballPipeline,
+    FootballPipeline,
+    IceHockeyPipeline,
+    SoccerPipeline,
+    VolleyballPipeline,
+)
+
+PIPELINES = [BasketballPipeline, FootballPipeline, IceHockeyPipeline, SoccerPipeline, VolleyballPipeline]
+SCOPE = {"league": "m", "season_option": "regular"}
+MODES = ("copy", "copy-free")
+
+
+def make_frame(model, rows: int, seed: int = 0) -> pd.DataFrame:
+    """Synthetic frame with every non-scope column of `model`"""
+    rng = np.random.default_rng(seed)
+    data = {}
+    for column in model.__table__.columns:
+        if column.primary_key or column.name in SCOPE:
+            continue
+        if isinstance(column.type, Integer):
+            data[column.name] = rng.integers(0, 500, rows).astype(float)
+        elif isinstance(column.type, Float):
+            data[column.name] = rng.random(rows) * 100
+        elif isinstance(column.type, String):
+            # Conferences repeat across rows, names are unique
+            cardinality = 8 if column.name == "conference" else rows
+            data[column.name] = [f"{column.name[:4]}{i % cardinality}"[: column.type.length] for i in range(rows)]
+    return pd.DataFrame(data)
+
+
+def season_frames(rows: int) -> list[tuple[Table, pd.DataFrame]]:
+    """(table, frame) for the team and player tables of every sport"""
+    frames = []
+    for pipeline_class in PIPELINES:
+        for name in pipeline_class().written_tables():
+            if name.endswith("_standings"):
+                continue
+            model = next(m for m in Base.registry.mappers if m.local_table.name == name).class_
+            table_rows = rows if name.endswith("_player_stats") else max(1, rows // 20)
+            frames.append((model.__table__, make_frame(model, table_rows)))
+    return frames
+
+
+def save_with_copies(session: Session, table: Table, df: pd.DataFrame):
+    """The old save path: copy the frame and add metadata columns to it before inserting"""
+    session.execute(delete(table).where(*scope_filter(table, SCOPE)))
+    df = df.copy()
+    df["league"] = SCOPE["league"]
+    df["season_option"] = SCOPE["season_option"]
+    bulk_insert(session, table, df, {})
+
+
+def save_copy_free(session: Session, table: Table, df: pd.DataFrame):
+    """The current save path: metadata is attached per chunk as constants, df is never copied"""
+    replace_rows(session, table, df, SCOPE)
+
+
+def max_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def measure(mode: str, url: str, rows: int):
+    """Run one mode in this process and print its peak RSS"""
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    frames = season_frames(rows)
+    save = save_with_copies if mode == "copy" else save_copy_free
+
+    before = max_rss_mb()
+    with Session(engine) as session:
+        for table, df in frames:
+            save(session, table, df)
+        session.commit()
+    print(f"{before:.1f} {max_rss_mb():.1f}")
+
+
+def run(url: str, rows: int):
+    print(f"Full-season save of every sport's team and player tables, {rows} player rows per sport")
+    for mode in MODES:
+        # A fresh interpreter per mode, so one run's peak cannot hide the other's
+        output = subprocess.run(
+            [sys.executable, __file__, "--url", url, "--rows", str(rows), "--mode", mode],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        before, peak = float(output[-2]), float(output[-1])
+        print(f"  {mode:<10} peak RSS {peak:8.1f} MB  (+{peak - before:.1f} MB during save)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="sqlite://", help="Database URL (default: in-memory SQLite)")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--mode", choices=MODES, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    # As in the entry-point scripts
+    pd.set_option("mode.copy_on_write", True)
+    if args.mode:
+        measure(args.mode, args.url, args.rows)
+    else:
+        run(args.url, args.rows)
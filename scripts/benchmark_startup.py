@@ -0,0 +1,69 @@
+"""Measure interpreter startup and import cost of the pipeline entry points with `python -X importtime`"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Name -> python arguments; each runs in a fresh interpreter with an empty database URL
+SCENARIOS = {
+    "models only": ["-c", "import src.database.models.usports"],
+    "one sport": ["-c", "from src.pipelines.usports import BasketballPipeline"],
+    "update script": [str(ROOT / "scripts" / "update_all_usports_db.py"), "--help"],
+    # Same path as an off-season run: no sport matches, so nothing heavy is needed
+    "update, nothing to run": [str(ROOT / "scripts" / "update_all_usports_db.py"), "--only", "sport=none"],
+    "fetch script": [str(ROOT / "scripts" / "fetch_all_usports_data.py"), "--help"],
+}
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int]]:
+    """(module, self_us, cumulative_us) for every `import time:` line"""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        modules.append((name.rstrip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def measure(args: list[str]) -> tuple[float, list[tuple[str, int, int]]]:
+    """Wall seconds of one run and its import timings"""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))}
+    # A URL no driver can reach: importing must not connect to a database
+    env.setdefault("DATABASE_URL", "postgresql+psycopg://nobody@invalid.localdomain:1/none")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args], capture_output=True, text=True, env=env, cwd=ROOT, check=False
+    )
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr[-2000:]}")
+    return elapsed, parse_importtime(result.stderr)
+
+
+def run(scenarios: list[str], repeat: int, top: int):
+    for name in scenarios:
+        runs = [measure(SCENARIOS[name]) for _ in range(repeat)]
+        elapsed, modules = min(runs, key=lambda run: run[0])
+        # Top-level imports (no leading indentation) add up to the total import time
+        total_ms = sum(cumulative for module, _, cumulative in modules if not module.startswith("  ")) / 1000
+        print(f"{name}: {elapsed * 1000:.0f} ms wall, {total_ms:.0f} ms importing {len(modules)} modules")
+        for module, _, cumulative in sorted(modules, key=lambda m: m[2], reverse=True)[:top]:
+            print(f"  {cumulative / 1000:8.1f} ms  {module.strip()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("scenarios", nargs="*", metavar="SCENARIO", help=f"Any of {list(SCENARIOS)} (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario; the fastest is reported")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest imports to list per scenario")
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"Unknown scenarios {sorted(unknown)}")
+    run(args.scenarios or list(SCENARIOS), args.repeat, args.top)
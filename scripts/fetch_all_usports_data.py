@@ -1,69 +1,121 @@
 """Main script to fetch all USports data based on current season timing"""
 
+import argparse
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
-from src.pipelines.seasonal_logic import get_active_seasons_by_month
-from src.pipelines.usports import (
-    BasketballPipeline,
-    FootballPipeline,
-    IceHockeyPipeline,
-    SoccerPipeline,
-    VolleyballPipeline,
-)
-from src.pipelines.usports.base import BaseSportPipeline
-from src.utils.constants import BASKETBALL, FOOTBALL, ICE_HOCKEY, SOCCER, VOLLEYBALL
+import pandas as pd
+
+from src.config.settings import FETCH_WORKERS
+from src.pipelines.cache import frame_cache
+from src.pipelines.dag import IO
+from src.pipelines.job_filter import filter_jobs, parse_job_filter, sports_matching
+from src.pipelines.registry import registry
+from src.pipelines.runner import FetchedFrames, PipelineJob, build_fetch_dag, build_jobs, order_by_cost
+from src.pipelines.snapshots import COMPRESSIONS, CSV, OUTPUT_FORMATS, write_snapshot
+from src.utils.constants import PLAYER_STATS, STANDINGS, TEAM_STATS
+from src.utils.logger import configure_logfire
 
 DATA_DIR = Path(__file__).resolve().parent.parent / "data"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-SPORT_PIPELINES: dict[str, BaseSportPipeline] = {
-    BASKETBALL: BasketballPipeline(),
-    FOOTBALL: FootballPipeline(),
-    ICE_HOCKEY: IceHockeyPipeline(),
-    VOLLEYBALL: VolleyballPipeline(),
-    SOCCER: SoccerPipeline(),
-}
-
 
-def fetch_all_data():
-    """Fetch data for all active sports based on current month"""
+def fetch_all_data(
+    fetch_workers: int = FETCH_WORKERS,
+    output_dir: Path = DATA_DIR,
+    fmt: str = CSV,
+    compression: Optional[str] = None,
+    partitioned: bool = False,
+    only: Optional[list[str]] = None,
+):
+    """Fetch data for all active sports based on current month and write snapshots"""
     now = datetime.now()
     current_month_num = now.month
     current_month_name = now.strftime("%B")
-    active_seasons = get_active_seasons_by_month(current_month_num)
+    active_seasons = registry.active_seasons(current_month_num)
 
     print(f"🗓️  Current month: {current_month_name}\n")
     print(f"📊 Active seasons: {active_seasons}\n")
 
-    for sport, season_options in active_seasons.items():
-        if sport not in SPORT_PIPELINES:
-            print(f"\n⚠️  No pipeline for {sport}")
-            continue
-
-        pipeline = SPORT_PIPELINES[sport]
-
-        # Determine leagues for this sport
-        leagues = ["m", "w"] if sport != "football" else ["m"]
-
-        for league in leagues:
-            for season_option in season_options:
-                try:
-                    print(f"🔄 Fetching {sport} {league} {season_option}...")
-                    standings_df, team_stats_df, player_stats_df = pipeline.fetch_data(league, season_option)  # type: ignore
-
-                    # Save to CSV for inspection
-                    if standings_df is not None:
-                        standings_df.to_csv(DATA_DIR / f"{sport}_{league}_{season_option}_standings.csv", index=False)
-
-                    team_stats_df.to_csv(DATA_DIR / f"{sport}_{league}_{season_option}_teams.csv", index=False)
-                    player_stats_df.to_csv(DATA_DIR / f"{sport}_{league}_{season_option}_players.csv", index=False)
-
-                    print(f"✅ Saved {sport} {league} {season_option} to CSV")
-
-                except Exception as e:
-                    print(f"❌ Failed to fetch {sport} {league} {season_option}: {e}\n")
+    filters = [parse_job_filter(spec) for spec in only or []]
+    pipelines = registry.load_pipelines(sports_matching(active_seasons, filters))
+    jobs = order_by_cost(filter_jobs(build_jobs(active_seasons, pipelines), filters))
+    print(f"🔄 Fetching {len(jobs)} combinations with up to {fetch_workers} workers...")
+
+    def save(job: PipelineJob, frames: FetchedFrames):
+        standings_df, team_stats_df, player_stats_df = frames
+        tables = {STANDINGS: standings_df, TEAM_STATS: team_stats_df, PLAYER_STATS: player_stats_df}
+        for table, df in tables.items():
+            if df is not None:
+                write_snapshot(
+                    df, output_dir, job.sport, job.league, job.season_option, table, fmt, compression, partitioned
+                )
+        print(f"✅ Saved {job} to {fmt}")
+
+    outcome = build_fetch_dag(jobs, save).run({IO: fetch_workers})
+    for name, error in outcome.errors.items():
+        print(f"❌ {name} failed: {error}\n")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Maximum concurrent fetches (default: {FETCH_WORKERS})",
+    )
+    parser.add_argument("--format", choices=OUTPUT_FORMATS, default=CSV, help="Snapshot file format (default: csv)")
+    parser.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default=None,
+        help="Snapshot compression; CSV supports gzip only, Parquet defaults to snappy",
+    )
+    parser.add_argument(
+        "--partitioned",
+        action="store_true",
+        help="Write a sport=/league=/season=/table= partitioned dataset instead of flat files",
+    )
+    parser.add_argument("--output-dir", type=Path, default=DATA_DIR, help=f"Snapshot directory (default: {DATA_DIR})")
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="FILTER",
+        help="Only fetch matching combinations, e.g. sport=basketball,league=w (repeatable, any may match)",
+    )
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse frames fetched in the last CACHE_TTL_SECONDS, e.g. when re-running after a failure",
+    )
+    cache.add_argument("--no-cache", action="store_true", help="Neither read nor write the on-disk fetch cache")
+    cache.add_argument("--refresh", action="store_true", help="Ignore cached frames but store freshly fetched ones")
+    args = parser.parse_args()
+    if args.format == CSV and args.compression in ("snappy", "zstd"):
+        parser.error(f"{args.compression} compression is only supported for parquet")
+    for spec in args.only or []:
+        try:
+            parse_job_filter(spec)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
 
 
 if __name__ == "__main__":
-    fetch_all_data()
+    args = parse_args()
+    configure_logfire()
+    # Derived frames share memory with their source until a column is actually written
+    pd.set_option("mode.copy_on_write", True)
+    if args.cache or args.no_cache or args.refresh:
+        frame_cache.configure(enabled=not args.no_cache, refresh=args.refresh)
+    fetch_all_data(
+        fetch_workers=args.fetch_workers,
+        output_dir=args.output_dir,
+        fmt=args.format,
+        compression=args.compression,
+        partitioned=args.partitioned,
+        only=args.only,
+    )
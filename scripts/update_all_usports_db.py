@@ -1,74 +1,281 @@
 """Update database with all fetched USports data"""
 
+import argparse
+import asyncio
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Optional
 
-from src.database.db import Base, SessionLocal, engine
-from src.pipelines.seasonal_logic import get_active_seasons_by_month
-from src.pipelines.usports import (
-    BasketballPipeline,
-    FootballPipeline,
-    IceHockeyPipeline,
-    SoccerPipeline,
-    VolleyballPipeline,
+from src.config.settings import (
+    CPU_WORKERS,
+    DB_WORKERS,
+    FETCH_WORKERS,
+    PLAYER_LOAD_MODE,
+    STANDINGS_LOAD_MODE,
+    WRITE_MODE,
 )
-from src.pipelines.usports.base import BaseSportPipeline
-from src.utils.constants import (
-    BASKETBALL,
-    FOOTBALL,
-    ICE_HOCKEY,
-    SOCCER,
-    VOLLEYBALL,
-)
-from src.utils.logger import log
+from src.pipelines.job_filter import filter_jobs, parse_job_filter, sports_matching
+from src.pipelines.metrics import metrics
+from src.pipelines.registry import registry
+from src.utils.constants import LOAD_MODES, STANDINGS_LOAD_MODES, WRITE_MODES
+from src.utils.logger import configure_logfire, log
+
+if TYPE_CHECKING:
+    from src.pipelines.usports.base import BaseSportPipeline
+
+# pandas, SQLAlchemy, the usports client and the models are imported inside the
+# functions below, once there is something to update, so off-season and --help
+# runs start without them (see scripts/benchmark_startup.py).
+# pylint: disable=import-outside-toplevel
 
 
 def init_db():
-    """Initialize database tables"""
-    Base.metadata.create_all(bind=engine)
+    """Initialize the tables of every imported model"""
+    from src.database.db import Base, get_engine
 
+    Base.metadata.create_all(bind=get_engine())
 
-def update_all_databases():
-    """Update all sport databases based on current season timing"""
-    init_db()
 
-    current_month = datetime.now().month
-    active_seasons = get_active_seasons_by_month(current_month)
-    log.debug(f"🗓️  Active seasons for month {current_month}: {active_seasons}")
+def update_all_databases(  # pylint: disable=too-many-branches
+    fetch_workers: int = FETCH_WORKERS,
+    db_workers: int = DB_WORKERS,
+    player_load_mode: Optional[str] = None,
+    standings_load_mode: Optional[str] = None,
+    write_mode: Optional[str] = None,
+    force: bool = False,
+    snapshot_dir: Optional[Path] = None,
+    metrics_json: Optional[Path] = None,
+    metrics_prom: Optional[Path] = None,
+    use_async: bool = False,
+    cpu_workers: int = CPU_WORKERS,
+    only: Optional[list[str]] = None,
+):
+    """Update all sport databases based on current season timing.
 
-    SPORT_PIPELINES: dict[str, BaseSportPipeline] = {
-        BASKETBALL: BasketballPipeline(),
-        FOOTBALL: FootballPipeline(),
-        ICE_HOCKEY: IceHockeyPipeline(),
-        VOLLEYBALL: VolleyballPipeline(),
-        SOCCER: SoccerPipeline(),
-    }
+    Every combination runs as fetch -> normalize -> validate -> load in a DAG:
+    fetches on an I/O pool, normalization and validation on a CPU pool, and
+    up to db_workers loads at once, each in its own transaction; combinations
+    of the same sport share tables and are always written one at a time.
+    `only` filters (e.g. "sport=basketball,league=w") restrict the run. With use_async
+    the same work runs on a single asyncio event loop (PostgreSQL only).
+    With snapshot_dir, every combination saved in that directory is loaded
+    from local files instead, without any network calls.
+    Only the pipelines (with their usports modules and models) of sports
+    that will actually run are imported. Load and write modes left as None
+    keep each pipeline's own (by default the PLAYER_LOAD_MODE,
+    STANDINGS_LOAD_MODE and WRITE_MODE settings).
+    """
+    filters = [parse_job_filter(spec) for spec in only or []]
+    if snapshot_dir is not None:
+        from src.pipelines.snapshots import discover_snapshots
 
-    session = SessionLocal()
+        sports = sports_matching(dict.fromkeys(sport for sport, _, _ in discover_snapshots(snapshot_dir)), filters)
+    else:
+        current_month = datetime.now().month
+        active_seasons = registry.active_seasons(current_month)
+        log.debug(f"🗓️  Active seasons for month {current_month}: {active_seasons}")
+        sports = sports_matching(active_seasons, filters)
 
-    try:
-        for sport, season_options in active_seasons.items():
-            if sport not in SPORT_PIPELINES:
-                continue
+    if not sports:
+        log.info("😴 No active sports to update")
+        report_metrics(metrics_json, metrics_prom)
+        return
+
+    configure_logfire()
+    import pandas as pd
 
-            pipeline = SPORT_PIPELINES[sport]
-            leagues = ["m", "w"] if sport != FOOTBALL else ["m"]
+    # Derived frames (school normalization, dtype casts, column selection) share
+    # memory with their source until a column is actually written
+    pd.set_option("mode.copy_on_write", True)
+
+    from src.database.db import get_engine
+    from src.pipelines.dag import CPU, DB, IO
+    from src.pipelines.runner import (
+        build_jobs,
+        build_load_dag,
+        build_snapshot_jobs,
+        fetch_from_network,
+        order_by_cost,
+        snapshot_reader,
+    )
+
+    pipelines = registry.load_pipelines(sports)
+    configure_pipelines(pipelines.values(), player_load_mode, standings_load_mode, write_mode, force)
+
+    if snapshot_dir is not None:
+        jobs = build_snapshot_jobs(snapshot_dir, pipelines)
+        fetch = snapshot_reader(snapshot_dir)
+        log.info(f"📂 Loading {len(jobs)} combinations from snapshot {snapshot_dir}")
+    else:
+        jobs = build_jobs(active_seasons, pipelines)
+        fetch = fetch_from_network
+
+    jobs = order_by_cost(filter_jobs(jobs, filters))
+    if only:
+        log.info(f"🔎 {len(jobs)} combinations match {' or '.join(only)}")
+
+    # After the pipelines are imported, so their models are registered on Base
+    init_db()
+    engine = get_engine()
 
-            for league in leagues:
-                for season_option in season_options:
-                    try:
-                        pipeline.run_pipeline(session, league, season_option)  # type: ignore
-                    except Exception:
-                        session.rollback()
+    if use_async and engine.dialect.name != "postgresql":
+        log.warning(f"⚠️  The async runner needs PostgreSQL, running {engine.dialect.name} synchronously")
+        use_async = False
 
-        log.info("\n🎉 All active sports databases updated successfully!")
+    if db_workers > 1 and engine.dialect.name != "postgresql":
+        log.warning(f"⚠️  {engine.dialect.name} does not support concurrent writers, using --db-workers 1")
+        db_workers = 1
+
+    try:
+        if use_async:
+            from src.pipelines.async_runner import run_jobs
+
+            failed = len(asyncio.run(run_jobs(jobs, fetch_workers, db_workers, fetch, cpu_workers=cpu_workers)))
+        else:
+            outcome = build_load_dag(jobs, fetch).run({IO: fetch_workers, CPU: cpu_workers, DB: db_workers})
+            failed = len({name.rsplit("/", 1)[0] for name in outcome.errors})
+
+        if failed:
+            log.warning(f"\n⚠️  {failed} of {len(jobs)} combinations failed, see the errors above")
+        else:
+            log.info("\n🎉 All active sports databases updated successfully!")
 
     except Exception as e:
         log.error(f"\n💥 Database update failed: {e}")
-        session.rollback()
         raise
     finally:
-        session.close()
+        report_metrics(metrics_json, metrics_prom)
+
+
+def configure_pipelines(
+    pipelines: Iterable["BaseSportPipeline"],
+    player_load_mode: Optional[str] = None,
+    standings_load_mode: Optional[str] = None,
+    write_mode: Optional[str] = None,
+    force: bool = False,
+):
+    """Apply the run's options to every pipeline, overriding only the modes that were given"""
+    modes = {"player_load_mode": player_load_mode, "standings_load_mode": standings_load_mode, "write_mode": write_mode}
+    for pipeline in pipelines:
+        for name, mode in modes.items():
+            if mode is not None:
+                setattr(pipeline, name, mode)
+        pipeline.skip_unchanged = not force
+
+
+def report_metrics(metrics_json: Optional[Path] = None, metrics_prom: Optional[Path] = None):
+    """Log the per-stage summary and write any requested report files"""
+    log.info(f"\n📈 Pipeline metrics\n{metrics.summary_table()}")
+    if metrics_json:
+        metrics.write_json(metrics_json)
+    if metrics_prom:
+        metrics.write_prometheus(metrics_prom)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Maximum concurrent fetches (default: {FETCH_WORKERS})",
+    )
+    parser.add_argument(
+        "--db-workers",
+        type=int,
+        default=DB_WORKERS,
+        help=f"Maximum concurrent database writers, one sport at a time per table (default: {DB_WORKERS})",
+    )
+    parser.add_argument(
+        "--cpu-workers",
+        type=int,
+        default=CPU_WORKERS,
+        help=f"Threads for normalization and validation (default: {CPU_WORKERS})",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="FILTER",
+        help="Only run matching combinations, e.g. sport=basketball,league=w (repeatable, any may match)",
+    )
+    parser.add_argument(
+        "--player-load-mode",
+        choices=LOAD_MODES,
+        default=None,
+        help=f"How player stats tables are written; COPY modes need PostgreSQL (default: {PLAYER_LOAD_MODE} unless the pipeline sets its own)",
+    )
+    parser.add_argument(
+        "--standings-load-mode",
+        choices=STANDINGS_LOAD_MODES,
+        default=None,
+        help=f"insert deletes and reinserts standings, swap (opt-in) rebuilds them in a shadow table renamed into "
+        f"place on PostgreSQL (default: {STANDINGS_LOAD_MODE} unless the pipeline sets its own)",
+    )
+    parser.add_argument(
+        "--write-mode",
+        choices=WRITE_MODES,
+        default=None,
+        help=f"replace rewrites each slice, incremental upserts only changed rows (default: {WRITE_MODE} unless the pipeline sets its own)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Validate and write every slice even if its data is unchanged since the last load",
+    )
+    parser.add_argument(
+        "--async",
+        dest="use_async",
+        action="store_true",
+        help="Run fetches and writes on one asyncio event loop with the async psycopg driver (PostgreSQL only)",
+    )
+    cache = parser.add_mutually_exclusive_group()
+    cache.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse frames fetched in the last CACHE_TTL_SECONDS, e.g. when re-running after a failure",
+    )
+    cache.add_argument("--no-cache", action="store_true", help="Neither read nor write the on-disk fetch cache")
+    cache.add_argument("--refresh", action="store_true", help="Ignore cached frames but store freshly fetched ones")
+    parser.add_argument(
+        "--from-snapshot",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Load every combination saved by fetch_all_usports_data.py in DIR instead of fetching",
+    )
+    parser.add_argument("--metrics-json", type=Path, default=None, help="Write stage metrics as JSON to this path")
+    parser.add_argument(
+        "--metrics-prom",
+        type=Path,
+        default=None,
+        help="Write stage metrics in Prometheus textfile format to this path",
+    )
+    args = parser.parse_args()
+    for spec in args.only or []:
+        try:
+            parse_job_filter(spec)
+        except ValueError as e:
+            parser.error(str(e))
+    return args
 
 
 if __name__ == "__main__":
-    update_all_databases()
+    args = parse_args()
+    if args.cache or args.no_cache or args.refresh:
+        from src.pipelines.cache import frame_cache
+
+        frame_cache.configure(enabled=not args.no_cache, refresh=args.refresh)
+    update_all_databases(
+        fetch_workers=args.fetch_workers,
+        db_workers=args.db_workers,
+        player_load_mode=args.player_load_mode,
+        standings_load_mode=args.standings_load_mode,
+        write_mode=args.write_mode,
+        force=args.force,
+        snapshot_dir=args.from_snapshot,
+        metrics_json=args.metrics_json,
+        metrics_prom=args.metrics_prom,
+        use_async=args.use_async,
+        cpu_workers=args.cpu_workers,
+        only=args.only,
+    )
@@ -0,0 +1,67 @@
+"""Vectorized DataFrame -> table loaders that bypass ORM object construction"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pandas import DataFrame
+from sqlalchemy import Table, delete, insert
+from sqlalchemy.orm import Session
+
+from src.utils.logger import log
+
+# Rows converted and sent per executemany, so Python-side parameters never hold a whole wide frame
+INSERT_CHUNK_ROWS = 5000
+
+
+@dataclass(frozen=True)
+class LoadResult:
+    """Row counts written for one table slice"""
+
+    inserted: int = 0
+    updated: int = 0
+    deleted: int = 0
+
+    def __str__(self) -> str:
+        return f"+{self.inserted} ~{self.updated} -{self.deleted}"
+
+
+def scope_filter(table: Table, scope: dict[str, Any]) -> list:
+    """WHERE clauses selecting the league/season slice described by `scope`"""
+    return [table.c[col] == value for col, value in scope.items()]
+
+
+def load_columns(df: DataFrame, table: Table, constants: dict[str, Any]) -> list[str]:
+    """Frame columns that map onto `table`, excluding those supplied as constants"""
+    columns = [col for col in df.columns if col in table.c and col not in constants]
+    ignored = set(df.columns) - set(columns) - set(constants)
+    if ignored:
+        log.debug(f"Ignoring columns not in {table.name}: {ignored}")
+    return columns
+
+
+def frame_to_records(df: DataFrame, table: Table, constants: dict[str, Any]) -> list[dict[str, Any]]:
+    """Convert a frame into executemany parameter dicts for `table`.
+
+    Columns are converted once each (NaN/NA -> None, numpy scalars -> Python
+    objects) rather than row by row. Columns the table does not have are
+    dropped, and `constants` (e.g. league/season_option) are added to every row.
+    """
+    columns = load_columns(df, table, constants)
+    values = [df[col].to_numpy(dtype=object, na_value=None) for col in columns]
+    return [{**dict(zip(columns, row)), **constants} for row in zip(*values)]
+
+
+def bulk_insert(session: Session, table: Table, df: DataFrame, constants: dict[str, Any]) -> int:
+    """Insert every row of df with one executemany per chunk, returning the row count"""
+    for start in range(0, len(df), INSERT_CHUNK_ROWS):
+        session.execute(insert(table), frame_to_records(df.iloc[start : start + INSERT_CHUNK_ROWS], table, constants))
+    return len(df)
+
+
+def replace_rows(session: Session, table: Table, df: DataFrame, scope: dict[str, Any]) -> LoadResult:
+    """Delete the slice of `table` matching `scope`, then bulk insert df in its place.
+
+    The scope values double as constant columns on the inserted rows.
+    """
+    deleted = session.execute(delete(table).where(*scope_filter(table, scope))).rowcount  # type: ignore[attr-defined]
+    return LoadResult(inserted=bulk_insert(session, table, df, scope), deleted=deleted)
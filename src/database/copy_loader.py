@@ -0,0 +1,93 @@
+"""PostgreSQL COPY FROM STDIN load path (psycopg 3) for large tables"""
+
+from itertools import repeat
+from typing import Any, Callable, Iterator, Optional
+
+from pandas import DataFrame
+from psycopg import sql
+from sqlalchemy import Float, Integer, Table
+from sqlalchemy.orm import Session
+
+from src.database.bulk import LoadResult, load_columns
+from src.utils.logger import log
+
+
+def supports_copy(session: Session) -> bool:
+    """COPY needs a PostgreSQL engine driven by synchronous psycopg 3 (async sessions use inserts)"""
+    dialect = session.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg" and not dialect.is_async
+
+
+def _pg_type(table: Table, column: str) -> str:
+    """Postgres type name for binary COPY"""
+    column_type = table.c[column].type
+    if isinstance(column_type, Integer):
+        return "int4"
+    if isinstance(column_type, Float):
+        return "float8"
+    return "text"
+
+
+def _python_caster(table: Table, column: str) -> Optional[Callable[[Any], Any]]:
+    """Integer columns often arrive as float64 (NaN present), which COPY would reject as '3.0'"""
+    column_type = table.c[column].type
+    if isinstance(column_type, Integer):
+        return int
+    if isinstance(column_type, Float):
+        return float
+    return None
+
+
+def _frame_rows(df: DataFrame, table: Table, columns: list[str], constants: dict[str, Any]) -> Iterator[tuple]:
+    """Column-wise conversion of df to COPY rows, with constants appended to each row"""
+    values = []
+    for col in columns:
+        array = df[col].to_numpy(dtype=object, na_value=None)
+        caster = _python_caster(table, col)
+        values.append([None if v is None else caster(v) for v in array] if caster else array)
+    values.extend(repeat(value, len(df)) for value in constants.values())
+    return zip(*values)
+
+
+def copy_replace_rows(
+    session: Session, table: Table, df: DataFrame, scope: dict[str, Any], binary: bool = False
+) -> LoadResult:
+    """Stream df into a temp staging table with COPY, then swap the scoped slice of `table`.
+
+    The delete and the INSERT ... SELECT from staging run in the session's
+    current transaction, so readers see either the old or the new slice.
+    """
+    columns = load_columns(df, table, scope)
+    all_columns = columns + list(scope)
+    staging = f"{table.name}_staging"
+
+    names = {
+        "staging": sql.Identifier(staging),
+        "target": sql.Identifier(table.name),
+        "cols": sql.SQL(", ").join(map(sql.Identifier, all_columns)),
+        "scope": sql.SQL(" AND ").join(sql.SQL("{} = %s").format(sql.Identifier(col)) for col in scope),
+    }
+    create = sql.SQL("CREATE TEMP TABLE {staging} ON COMMIT DROP AS SELECT {cols} FROM {target} WITH NO DATA")
+    copy_from = sql.SQL("COPY {staging} ({cols}) FROM STDIN" + (" (FORMAT BINARY)" if binary else ""))
+    delete = sql.SQL("DELETE FROM {target} WHERE {scope}")
+    swap = sql.SQL("INSERT INTO {target} ({cols}) SELECT {cols} FROM {staging}")
+    drop = sql.SQL("DROP TABLE {staging}")
+
+    # Raw psycopg connection bound to the session's transaction
+    connection = session.connection().connection.driver_connection
+    with connection.cursor() as cursor:  # type: ignore[union-attr]
+        cursor.execute(create.format(**names))
+
+        with cursor.copy(copy_from.format(**names)) as copy:
+            if binary:
+                copy.set_types([_pg_type(table, col) for col in all_columns])
+            for row in _frame_rows(df, table, columns, scope):
+                copy.write_row(row)
+
+        cursor.execute(delete.format(**names), list(scope.values()))
+        deleted = cursor.rowcount
+        cursor.execute(swap.format(**names))
+        cursor.execute(drop.format(**names))
+
+    log.debug(f"COPY loaded {len(df)} rows into {table.name} ({'binary' if binary else 'text'})")
+    return LoadResult(inserted=len(df), deleted=deleted)
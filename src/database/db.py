@@ -1,20 +1,106 @@
-import logfire
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, Optional
 
-from src.config.settings import DATABASE_URL
+from sqlalchemy import Engine, create_engine, make_url
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
-# Configure Logfire once at startup
-logfire.configure(environment="pipeline", service_name="pipeline")
+from src.config.settings import (
+    DATABASE_URL,
+    DB_LOCK_TIMEOUT_MS,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_STATEMENT_TIMEOUT_MS,
+)
+from src.utils.logger import configure_logfire
 
-# https://docs.sqlalchemy.org/en/20/tutorial/data_select.html
-engine = create_engine(DATABASE_URL, echo=False)
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-# Instrument SQLAlchemy for automatic query tracking
-logfire.instrument_sqlalchemy(engine=engine)
 
-SessionLocal = sessionmaker(bind=engine)
+def _engine_options(url: str) -> dict[str, Any]:
+    """Pool and timeout policy; concurrent loaders each check out their own connection"""
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if url.startswith("postgresql"):
+        timeouts = f"-c statement_timeout={DB_STATEMENT_TIMEOUT_MS} -c lock_timeout={DB_LOCK_TIMEOUT_MS}"
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            # A slow or stuck slice fails fast instead of holding locks on everyone else
+            connect_args={"options": timeouts},
+        )
+    return options
+
+
+# Bound to the engine by get_engine(), so importing models never needs a database
+SessionLocal = sessionmaker()
+
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def get_engine() -> Engine:
+    """The process-wide engine, created (with Logfire instrumentation) on first use"""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            import logfire
+
+            configure_logfire()
+            # https://docs.sqlalchemy.org/en/20/tutorial/data_select.html
+            _engine = create_engine(DATABASE_URL, echo=False, **_engine_options(DATABASE_URL))
+            # Instrument SQLAlchemy for automatic query tracking
+            logfire.instrument_sqlalchemy(engine=_engine)
+            SessionLocal.configure(bind=_engine)
+        return _engine
+
+
+def __getattr__(name: str) -> Any:
+    # `from src.database.db import engine` keeps working, creating the engine at that point
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Base(DeclarativeBase):
     pass
+
+
+@contextmanager
+def transaction() -> Iterator[Session]:
+    """Short transaction on its own pooled connection, e.g. one sport/league/season slice.
+
+    Commits on success, rolls back and re-raises on failure, so a failed slice
+    never leaves locks or partial writes behind for the others.
+    """
+    get_engine()
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def async_url(url: str) -> str:
+    """Same database through psycopg's async driver (the only async driver the project depends on)"""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "postgresql":
+        raise ValueError(f"The async runner needs PostgreSQL, got {parsed.get_backend_name()}")
+    return parsed.set(drivername="postgresql+psycopg").render_as_string(hide_password=False)
+
+
+def create_async_session_factory(url: str = DATABASE_URL) -> "async_sessionmaker[AsyncSession]":
+    """Async engine with the same pool and timeout policy as `engine`; created on demand"""
+    import logfire
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    configure_logfire()
+    async_engine = create_async_engine(async_url(url), echo=False, **_engine_options(url))
+    logfire.instrument_sqlalchemy(engine=async_engine.sync_engine)
+    return async_sessionmaker(bind=async_engine, expire_on_commit=False)
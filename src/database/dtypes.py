@@ -0,0 +1,120 @@
+"""Cast fetched frames to the tightest dtypes their ORM columns allow, before they are written"""
+
+from functools import lru_cache
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import BigInteger, Integer, Numeric, SmallInteger, String, Table
+
+from src.utils.logger import log
+
+# Low-cardinality strings repeated on every row of a slice
+CATEGORICAL_COLUMNS = frozenset({"conference", "league", "season_option"})
+
+
+class ColumnDtype(NamedTuple):
+    dtype: str
+    max_length: Optional[int] = None
+
+
+class DtypeError(ValueError):
+    """Values that do not fit the column they are written to"""
+
+    def __init__(self, table: str, problems: list[str]):
+        self.problems = problems
+        super().__init__(f"{table}: " + "; ".join(problems))
+
+
+@lru_cache(maxsize=None)
+def column_dtypes(table: Table) -> dict[str, ColumnDtype]:
+    """Target dtype per column, compiled once per table.
+
+    Integer columns map to nullable Int16/Int32/Int64 by SQL width. Float
+    columns stay float64: the database stores double precision, so float32
+    would change the values written. Short repeated strings become categoricals.
+    """
+    dtypes = {}
+    for column in table.c:
+        if column.primary_key:
+            continue
+        column_type = column.type
+        if isinstance(column_type, SmallInteger):
+            dtypes[column.name] = ColumnDtype("Int16")
+        elif isinstance(column_type, BigInteger):
+            dtypes[column.name] = ColumnDtype("Int64")
+        elif isinstance(column_type, Integer):
+            dtypes[column.name] = ColumnDtype("Int32")
+        elif isinstance(column_type, Numeric):
+            dtypes[column.name] = ColumnDtype("float64")
+        elif isinstance(column_type, String):
+            dtype = "category" if column.name in CATEGORICAL_COLUMNS else "object"
+            dtypes[column.name] = ColumnDtype(dtype, column_type.length)
+    return dtypes
+
+
+def _integer_column(series: pd.Series, dtype: str) -> tuple[Optional[pd.Series], Optional[str]]:
+    numeric = pd.to_numeric(series, errors="coerce")
+    if (numeric.isna() & series.notna()).any():
+        return None, "non-numeric values"
+
+    values = numeric.to_numpy(dtype=float, na_value=np.nan)
+    # Averages stored as integers (e.g. attendance) arrive fractional; round them as PostgreSQL would on insert
+    fractional = ~np.isnan(values) & (values % 1 != 0)
+    if fractional.any():
+        log.debug(f"Rounding {int(fractional.sum())} fractional {series.name} values (e.g. {values[fractional][0]:g})")
+        values = np.rint(values)
+        numeric = pd.Series(values, index=series.index)
+
+    info = np.iinfo(dtype.lower())
+    overflow = (values < info.min) | (values > info.max)
+    if overflow.any():
+        return None, f"{int(overflow.sum())} values overflow {dtype} (e.g. {values[overflow][0]:g})"
+    return numeric.astype(dtype), None
+
+
+def normalize_dtypes(df: pd.DataFrame, table: Table) -> pd.DataFrame:
+    """Return a copy of df cast to the dtypes `table` stores, raising DtypeError for values that do not fit.
+
+    Columns the table does not have are left alone. Integer stats scraped as
+    float64/object become nullable integers, with fractional values rounded to
+    the nearest integer as the database would. Overflows, non-numeric values
+    and strings longer than their column are rejected rather than coerced, so
+    an upstream data error fails the load instead of being written. df itself
+    is not modified.
+    """
+    df = df.copy(deep=False)
+    problems = []
+    for column, target in column_dtypes(table).items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+
+        if target.dtype.startswith("Int"):
+            if series.dtype == target.dtype:
+                continue
+            cast, problem = _integer_column(series, target.dtype)
+            if problem:
+                problems.append(f"{column}: {problem}")
+            else:
+                df[column] = cast
+        elif target.dtype == "float64":
+            if series.dtype == target.dtype:
+                continue
+            numeric = pd.to_numeric(series, errors="coerce")
+            if (numeric.isna() & series.notna()).any():
+                problems.append(f"{column}: non-numeric values")
+            else:
+                df[column] = numeric.astype("float64")
+        else:
+            if target.max_length is not None:
+                too_long = series.dropna().astype(str).str.len() > target.max_length
+                if too_long.any():
+                    problems.append(f"{column}: {int(too_long.sum())} values longer than {target.max_length}")
+                    continue
+            if target.dtype == "category" and not isinstance(series.dtype, pd.CategoricalDtype):
+                df[column] = series.astype("category")
+
+    if problems:
+        raise DtypeError(table.name, problems)
+    return df
@@ -0,0 +1,104 @@
+"""Diff-based incremental load: write only the rows that changed since the last run"""
+
+from collections import defaultdict
+from typing import Any, Optional
+
+from pandas import DataFrame
+from sqlalchemy import Table, UniqueConstraint, delete, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.database.bulk import LoadResult, frame_to_records, load_columns, scope_filter
+from src.utils.logger import log
+
+# Dialects with INSERT ... ON CONFLICT DO UPDATE
+UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def natural_key(table: Table) -> Optional[list[str]]:
+    """Columns of the table's first UniqueConstraint, e.g. (league, season_option, team_name)"""
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return [column.name for column in constraint.columns]
+    return None
+
+
+def incremental_upsert(
+    session: Session, table: Table, df: DataFrame, scope: dict[str, Any], key: Optional[list[str]] = None
+) -> LoadResult:
+    """Diff df against the stored `scope` slice and write only the differences.
+
+    Tables with a natural key get INSERT ... ON CONFLICT DO UPDATE for new and
+    changed rows and a DELETE for rows that disappeared. Tables without one
+    (player stats) are diffed on full row content, so a changed row is counted
+    as one delete plus one insert. `key` overrides the table's natural key.
+    """
+    columns = load_columns(df, table, scope)
+    records = frame_to_records(df, table, scope)
+    stored = session.execute(
+        select(table.c.id, *(table.c[col] for col in columns)).where(*scope_filter(table, scope))
+    ).all()
+
+    key = key or natural_key(table)
+    if key is None or session.get_bind().dialect.name not in UPSERT_INSERTS:
+        return _content_diff(session, table, columns, records, stored)
+    return _keyed_upsert(session, table, key, columns, records, stored)
+
+
+def _keyed_upsert(
+    session: Session, table: Table, key: list[str], columns: list[str], records: list[dict], stored: list
+) -> LoadResult:
+    key_columns = [col for col in key if col in columns]
+    stored_by_key = {tuple(getattr(row, col) for col in key_columns): row for row in stored}
+
+    new_by_key: dict[tuple, dict] = {}
+    for record in records:
+        new_by_key[tuple(record[col] for col in key_columns)] = record
+    if len(new_by_key) < len(records):
+        log.warning(f"{table.name}: {len(records) - len(new_by_key)} duplicate {key} rows, keeping the last")
+
+    inserted, updated = [], []
+    for row_key, record in new_by_key.items():
+        existing = stored_by_key.get(row_key)
+        if existing is None:
+            inserted.append(record)
+        elif any(getattr(existing, col) != record[col] for col in columns):
+            updated.append(record)
+
+    removed_ids = [row.id for row_key, row in stored_by_key.items() if row_key not in new_by_key]
+
+    changed = inserted + updated
+    if changed:
+        stmt = UPSERT_INSERTS[session.get_bind().dialect.name](table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=key, set_={col: stmt.excluded[col] for col in columns if col not in key}
+        )
+        session.execute(stmt, changed)
+    if removed_ids:
+        session.execute(delete(table).where(table.c.id.in_(removed_ids)))
+
+    return LoadResult(inserted=len(inserted), updated=len(updated), deleted=len(removed_ids))
+
+
+def _content_diff(session: Session, table: Table, columns: list[str], records: list[dict], stored: list) -> LoadResult:
+    # Multiset of stored row contents -> ids, so duplicate rows are matched one to one
+    stored_ids: dict[tuple, list[int]] = defaultdict(list)
+    for row in stored:
+        stored_ids[tuple(row)[1:]].append(row.id)
+
+    inserted = []
+    for record in records:
+        ids = stored_ids.get(tuple(record[col] for col in columns))
+        if ids:
+            ids.pop()
+        else:
+            inserted.append(record)
+
+    removed_ids = [row_id for ids in stored_ids.values() for row_id in ids]
+
+    if removed_ids:
+        session.execute(delete(table).where(table.c.id.in_(removed_ids)))
+    if inserted:
+        session.execute(insert(table), inserted)
+
+    return LoadResult(inserted=len(inserted), deleted=len(removed_ids))
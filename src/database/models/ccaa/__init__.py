@@ -0,0 +1,23 @@
+from .basketball import CCAABasketballPlayerStats, CCAABasketballStandings, CCAABasketballTeamStats
+from .football import CCAAFootballPlayerStats, CCAAFootballStandings, CCAAFootballTeamStats
+from .ice_hockey import CCAAIceHockeyPlayerStats, CCAAIceHockeyStandings, CCAAIceHockeyTeamStats
+from .soccer import CCAASoccerPlayerStats, CCAASoccerStandings, CCAASoccerTeamStats
+from .volleyball import CCAAVolleyballPlayerStats, CCAAVolleyballStandings, CCAAVolleyballTeamStats
+
+__all__ = [
+    "CCAABasketballStandings",
+    "CCAABasketballTeamStats",
+    "CCAABasketballPlayerStats",
+    "CCAAFootballStandings",
+    "CCAAFootballTeamStats",
+    "CCAAFootballPlayerStats",
+    "CCAAIceHockeyStandings",
+    "CCAAIceHockeyTeamStats",
+    "CCAAIceHockeyPlayerStats",
+    "CCAASoccerStandings",
+    "CCAASoccerTeamStats",
+    "CCAASoccerPlayerStats",
+    "CCAAVolleyballStandings",
+    "CCAAVolleyballTeamStats",
+    "CCAAVolleyballPlayerStats",
+]
@@ -0,0 +1,29 @@
+"""CCAA tables as column-for-column copies of the USports ones (same upstream stats platform)"""
+
+from src.database.db import Base
+
+TABLE_PREFIX = "ccaa_"
+
+
+def _prefixed(name: str) -> str:
+    """uq_basketball_standings_team -> uq_ccaa_basketball_standings_team; names derived from the new table stay"""
+    kind, _, rest = name.partition("_")
+    if rest.startswith(TABLE_PREFIX):
+        return name
+    return f"{kind}_{TABLE_PREFIX}{rest}" if rest else f"{TABLE_PREFIX}{name}"
+
+
+def college_model(class_name: str, usports_model: type[Base], module: str) -> type[Base]:
+    """Declarative model for `ccaa_<usports table>` with the same columns, constraints and indexes.
+
+    Explicit constraint and index names are prefixed too, since PostgreSQL
+    requires index names to be unique per schema.
+    """
+    source = usports_model.__table__  # type: ignore[attr-defined]
+    table = source.to_metadata(Base.metadata, name=f"{TABLE_PREFIX}{source.name}")
+    for item in [*table.constraints, *table.indexes]:
+        if isinstance(item.name, str):
+            item.name = _prefixed(item.name)
+
+    docstring = f"CCAA counterpart of {usports_model.__name__}: {usports_model.__doc__}"
+    return type(class_name, (Base,), {"__table__": table, "__doc__": docstring, "__module__": module})
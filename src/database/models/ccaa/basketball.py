@@ -0,0 +1,8 @@
+"""CCAA basketball tables"""
+
+from src.database.models.ccaa.base import college_model
+from src.database.models.usports.basketball import BasketballPlayerStats, BasketballStandings, BasketballTeamStats
+
+CCAABasketballStandings = college_model("CCAABasketballStandings", BasketballStandings, __name__)
+CCAABasketballTeamStats = college_model("CCAABasketballTeamStats", BasketballTeamStats, __name__)
+CCAABasketballPlayerStats = college_model("CCAABasketballPlayerStats", BasketballPlayerStats, __name__)
@@ -0,0 +1,8 @@
+"""CCAA football tables"""
+
+from src.database.models.ccaa.base import college_model
+from src.database.models.usports.football import FootballPlayerStats, FootballStandings, FootballTeamStats
+
+CCAAFootballStandings = college_model("CCAAFootballStandings", FootballStandings, __name__)
+CCAAFootballTeamStats = college_model("CCAAFootballTeamStats", FootballTeamStats, __name__)
+CCAAFootballPlayerStats = college_model("CCAAFootballPlayerStats", FootballPlayerStats, __name__)
@@ -0,0 +1,8 @@
+"""CCAA ice hockey tables"""
+
+from src.database.models.ccaa.base import college_model
+from src.database.models.usports.ice_hockey import IceHockeyPlayerStats, IceHockeyStandings, IceHockeyTeamStats
+
+CCAAIceHockeyStandings = college_model("CCAAIceHockeyStandings", IceHockeyStandings, __name__)
+CCAAIceHockeyTeamStats = college_model("CCAAIceHockeyTeamStats", IceHockeyTeamStats, __name__)
+CCAAIceHockeyPlayerStats = college_model("CCAAIceHockeyPlayerStats", IceHockeyPlayerStats, __name__)
@@ -0,0 +1,8 @@
+"""CCAA soccer tables"""
+
+from src.database.models.ccaa.base import college_model
+from src.database.models.usports.soccer import SoccerPlayerStats, SoccerStandings, SoccerTeamStats
+
+CCAASoccerStandings = college_model("CCAASoccerStandings", SoccerStandings, __name__)
+CCAASoccerTeamStats = college_model("CCAASoccerTeamStats", SoccerTeamStats, __name__)
+CCAASoccerPlayerStats = college_model("CCAASoccerPlayerStats", SoccerPlayerStats, __name__)
@@ -0,0 +1,8 @@
+"""CCAA volleyball tables"""
+
+from src.database.models.ccaa.base import college_model
+from src.database.models.usports.volleyball import VolleyballPlayerStats, VolleyballStandings, VolleyballTeamStats
+
+CCAAVolleyballStandings = college_model("CCAAVolleyballStandings", VolleyballStandings, __name__)
+CCAAVolleyballTeamStats = college_model("CCAAVolleyballTeamStats", VolleyballTeamStats, __name__)
+CCAAVolleyballPlayerStats = college_model("CCAAVolleyballPlayerStats", VolleyballPlayerStats, __name__)
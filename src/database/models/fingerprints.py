@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, UniqueConstraint, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.db import Base
+
+
+class TableFingerprint(Base):
+    """Content hash of the last frame loaded for each sport/league/season/table"""
+
+    __tablename__ = "table_fingerprints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    sport: Mapped[str] = mapped_column(String(20), nullable=False)
+    league: Mapped[str] = mapped_column(String(1), nullable=False)
+    season_option: Mapped[str] = mapped_column(String(20), nullable=False)
+    table_name: Mapped[str] = mapped_column(String(20), nullable=False)
+    fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (
+        UniqueConstraint("sport", "league", "season_option", "table_name", name="uq_table_fingerprint_slice"),
+    )
@@ -0,0 +1,122 @@
+"""Shadow-table swap for small whole-table reloads (standings) on PostgreSQL"""
+
+import re
+from typing import Any
+
+from pandas import DataFrame
+from sqlalchemy import MetaData, Table, and_, func, insert, not_, select, text
+from sqlalchemy.orm import Session
+
+from src.database.bulk import LoadResult, bulk_insert, replace_rows, scope_filter
+from src.utils.logger import log
+
+# "CREATE [UNIQUE] INDEX <name> ON <table> USING ..." minus the names, to pair an index with its copy
+_INDEX_NAMES = re.compile(r"INDEX \S+ ON \S+ ")
+
+# PostgreSQL identifier limit
+_MAX_NAME = 63
+
+_BLOCKERS = """
+SELECT 'view ' || CAST(r.ev_class AS regclass)
+  FROM pg_depend d JOIN pg_rewrite r ON r.oid = d.objid
+ WHERE d.refobjid = CAST(:t AS regclass) AND r.ev_class <> CAST(:t AS regclass)
+UNION
+SELECT 'trigger ' || tgname FROM pg_trigger WHERE tgrelid = CAST(:t AS regclass) AND NOT tgisinternal
+UNION
+SELECT 'foreign key ' || conname FROM pg_constraint WHERE confrelid = CAST(:t AS regclass)
+UNION
+SELECT 'identity column ' || attname FROM pg_attribute WHERE attrelid = CAST(:t AS regclass) AND attidentity <> ''
+UNION
+SELECT 'row level security' FROM pg_class WHERE oid = CAST(:t AS regclass) AND relrowsecurity
+"""
+
+_INDEXES = """
+SELECT c.relname, CAST(i.indexrelid AS regclass)::text, pg_get_indexdef(i.indexrelid)
+  FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+ WHERE i.indrelid = CAST(:t AS regclass)
+"""
+
+_GRANTS = """
+SELECT CASE WHEN a.grantee = 0 THEN 'PUBLIC' ELSE quote_ident(r.rolname) END, a.privilege_type, a.is_grantable
+  FROM pg_class c CROSS JOIN LATERAL aclexplode(c.relacl) a LEFT JOIN pg_roles r ON r.oid = a.grantee
+ WHERE c.oid = CAST(:t AS regclass)
+"""
+
+
+def supports_swap(session: Session) -> bool:
+    return session.get_bind().dialect.name == "postgresql"
+
+
+def swap_blockers(session: Session, table: Table) -> list[str]:
+    """Objects tied to the live table that a rename-and-drop would break or silently lose"""
+    live = session.get_bind().dialect.identifier_preparer.format_table(table)
+    return list(session.scalars(text(_BLOCKERS), {"t": live}))
+
+
+def _sibling(table: Table, suffix: str) -> str:
+    return f"{table.name[: _MAX_NAME - len(suffix) - 2]}__{suffix}"
+
+
+def _indexes(session: Session, qualified: str) -> list[tuple[str, str, str]]:
+    """(name, qualified name, definition without names) of every index on a table"""
+    rows = session.execute(text(_INDEXES), {"t": qualified}).all()
+    return [(name, regclass, _INDEX_NAMES.sub("INDEX ON ", definition)) for name, regclass, definition in rows]
+
+
+def swap_replace_rows(session: Session, table: Table, df: DataFrame, scope: dict[str, Any]) -> LoadResult:
+    """Replace the `scope` slice by building a full copy of `table` with df in it and renaming it into place.
+
+    The shadow table (CREATE TABLE ... LIKE, so the same columns, defaults,
+    constraints and indexes) receives the other slices' rows and df, then
+    takes the live table's name, index names, id sequence and grants, and the
+    old table is dropped instead of deleted from row by row. Everything runs
+    in the session's transaction: readers keep reading the untouched live
+    table and only wait on the final rename while it commits; other writers
+    are locked out from the start. Tables with views, triggers, referencing
+    foreign keys, identity columns or row level security would lose them, so
+    they fall back to delete + insert.
+    """
+    blockers = swap_blockers(session, table)
+    if blockers:
+        log.debug(f"{table.name} has {', '.join(blockers)}; replacing rows in place instead of swapping")
+        return replace_rows(session, table, df, scope)
+
+    preparer = session.get_bind().dialect.identifier_preparer
+    shadow_table = table.to_metadata(MetaData(), name=_sibling(table, "shadow"))
+    live, shadow = preparer.format_table(table), preparer.format_table(shadow_table)
+    old = preparer.quote(_sibling(table, "old"))
+
+    def execute(sql: str, **params):
+        return session.execute(text(sql), params)
+
+    execute(f"LOCK TABLE {live} IN EXCLUSIVE MODE")
+    execute(f"CREATE TABLE {shadow} (LIKE {live} INCLUDING ALL)")
+    # LIKE copies the id default, so shadow rows draw from the live sequence; hand the sequence over before the drop
+    for column in table.primary_key.columns:
+        sequence = execute("SELECT pg_get_serial_sequence(:t, :c)", t=live, c=column.name).scalar()
+        if sequence is not None:
+            execute(f"ALTER SEQUENCE {sequence} OWNED BY {shadow}.{preparer.quote(column.name)}")
+    for grantee, privilege, grantable in execute(_GRANTS, t=live).all():
+        execute(f"GRANT {privilege} ON {shadow} TO {grantee}{' WITH GRANT OPTION' if grantable else ''}")
+
+    in_scope = and_(*scope_filter(table, scope))
+    deleted = session.scalar(select(func.count()).select_from(table).where(in_scope)) or 0
+    session.execute(insert(shadow_table).from_select(list(table.c.keys()), select(table).where(not_(in_scope))))
+    inserted = bulk_insert(session, shadow_table, df, scope)
+    execute(f"ANALYZE {shadow}")
+
+    live_names = {definition: name for name, _, definition in _indexes(session, live)}
+    renames = [
+        (regclass, live_names[definition])
+        for _, regclass, definition in _indexes(session, shadow)
+        if definition in live_names
+    ]
+
+    execute(f"ALTER TABLE {live} RENAME TO {old}")
+    execute(f"ALTER TABLE {shadow} RENAME TO {preparer.quote(table.name)}")
+    execute(f"DROP TABLE {preparer.quote_schema(table.schema) + '.' if table.schema else ''}{old}")
+    # Renaming a primary key or unique index renames its constraint too
+    for regclass, name in renames:
+        execute(f"ALTER INDEX {regclass} RENAME TO {preparer.quote(name)}")
+
+    return LoadResult(inserted=inserted, deleted=deleted)
@@ -0,0 +1,156 @@
+"""Asyncio runner: fetches and writes for every combination on one event loop with backpressure"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from usports.base.types import LeagueType, SeasonType
+
+from src.config.settings import CPU_WORKERS
+from src.database.db import create_async_session_factory
+from src.pipelines.runner import FetchedFrames, PipelineJob, fetch_from_network
+from src.pipelines.usports.base import BaseSportPipeline
+from src.utils.logger import log
+
+
+class AsyncPipelineAdapter:
+    """Async facade over an existing sport pipeline.
+
+    The usports fetches are blocking and normalization and validation are
+    CPU-bound, so all three run in executors and never stall the event loop.
+    Only the database work goes through `AsyncSession.run_sync`, which runs
+    the pipeline's sync code against the async psycopg connection without a
+    thread per task.
+    """
+
+    def __init__(self, pipeline: BaseSportPipeline):
+        self.pipeline = pipeline
+
+    async def fetch(
+        self, league: LeagueType, season_option: SeasonType, executor: Optional[ThreadPoolExecutor] = None
+    ) -> FetchedFrames:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.pipeline.fetch, league, season_option)
+
+    async def load(
+        self,
+        session: AsyncSession,
+        league: LeagueType,
+        season_option: SeasonType,
+        frames: FetchedFrames,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ):
+        """Normalize and validate in `executor`, then write in its own transaction (rolled back on failure).
+
+        Like `BaseSportPipeline.load`, but the fingerprint check and the write
+        are separate transactions, as in the sync DAG.
+        """
+        pipeline = self.pipeline
+        loop = asyncio.get_running_loop()
+        try:
+            prepared = await loop.run_in_executor(executor, pipeline.prepare, league, season_option, *frames)
+            async with session.begin():
+                unchanged = await session.run_sync(
+                    lambda sync_session: pipeline.unchanged(sync_session, league, season_option, prepared)
+                )
+            if unchanged:
+                return
+
+            validated = await loop.run_in_executor(executor, pipeline.validate, league, season_option, prepared)
+            async with session.begin():
+                await session.run_sync(
+                    lambda sync_session: pipeline.write(sync_session, league, season_option, validated)
+                )
+        except Exception as e:
+            pipeline.log_failure(league, season_option, e)
+            raise
+
+    async def run_pipeline(self, session: AsyncSession, league: LeagueType, season_option: SeasonType):
+        frames = await self.fetch(league, season_option)
+        await self.load(session, league, season_option, frames)
+
+
+async def run_jobs(
+    jobs: list[PipelineJob],
+    fetch_workers: int,
+    db_workers: int,
+    fetch: Callable[[PipelineJob], FetchedFrames] = fetch_from_network,
+    session_factory: Optional[async_sessionmaker[AsyncSession]] = None,
+    cpu_workers: int = CPU_WORKERS,
+) -> list[PipelineJob]:
+    """Fetch and load every job on the running event loop and return the jobs that failed.
+
+    At most `fetch_workers` fetches are in flight and at most `db_workers`
+    fetched combinations wait for a writer, so a slow database throttles the
+    fetches instead of piling frames up in memory. Normalization and
+    validation run on `cpu_workers` threads. Writers take per-table locks in
+    sorted order; loads of the same sport never write concurrently. As in the
+    DAG, a combination that fails to fetch or load is logged and returned
+    while the others carry on.
+    """
+    if not jobs:
+        return []
+
+    owns_engine = session_factory is None
+    session_factory = session_factory or create_async_session_factory()
+    fetch_workers, db_workers = max(1, fetch_workers), max(1, db_workers)
+    fetched: asyncio.Queue[Optional[tuple[PipelineJob, FetchedFrames]]] = asyncio.Queue(maxsize=db_workers)
+    fetch_slots = asyncio.Semaphore(fetch_workers)
+    table_locks: dict[str, asyncio.Lock] = {}
+    failed: list[PipelineJob] = []
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=fetch_workers, thread_name_prefix="fetch")
+    cpu_executor = ThreadPoolExecutor(max_workers=max(1, cpu_workers), thread_name_prefix="cpu")
+
+    async def fetch_job(job: PipelineJob):
+        async with fetch_slots:
+            try:
+                frames = await loop.run_in_executor(executor, fetch, job)
+            # Like a failed DAG node: whatever one combination raises (httpx, parser, file errors), the others go on
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                log.error(f"❌ Failed to fetch {job}: {str(e)[:500]}")
+                failed.append(job)
+                return
+        await fetched.put((job, frames))
+
+    async def write():
+        while (item := await fetched.get()) is not None:
+            job, frames = item
+            held: list[asyncio.Lock] = []
+            try:
+                for name in sorted(job.pipeline.written_tables()):
+                    lock = table_locks.setdefault(name, asyncio.Lock())
+                    await lock.acquire()
+                    held.append(lock)
+                async with session_factory() as session:
+                    await AsyncPipelineAdapter(job.pipeline).load(
+                        session, job.league, job.season_option, frames, cpu_executor
+                    )
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                # The pipeline already logged the failure; keep going with the other loads
+                log.debug(f"{job} write failed: {e}")
+                failed.append(job)
+            finally:
+                for lock in reversed(held):
+                    lock.release()
+
+    async def fetch_all(writers: int):
+        await asyncio.gather(*(fetch_job(job) for job in jobs))
+        for _ in range(writers):
+            await fetched.put(None)
+
+    try:
+        # A task that dies anyway cancels the rest and raises here, instead of leaving fetchers blocked on a full queue
+        async with asyncio.TaskGroup() as group:
+            for _ in range(db_workers):
+                group.create_task(write())
+            group.create_task(fetch_all(db_workers))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        cpu_executor.shutdown(wait=False, cancel_futures=True)
+        if owns_engine:
+            await session_factory.kw["bind"].dispose()
+
+    return failed
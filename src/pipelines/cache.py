@@ -0,0 +1,131 @@
+"""On-disk cache of raw fetched frames, keyed by usports function and arguments"""
+
+import hashlib
+import os
+import pickle
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from pandas import DataFrame, read_pickle
+
+from src.config.settings import CACHE_DIR, CACHE_ENABLED, CACHE_MAX_MB, CACHE_TTL_SECONDS
+from src.utils.logger import log
+
+
+def _describe(call: Callable[[], DataFrame]) -> tuple[str, str]:
+    """Readable name and full cache key for a zero-argument fetch callable"""
+    func, args, keywords = call, (), {}
+    if isinstance(call, partial):
+        func, args, keywords = call.func, call.args, call.keywords
+
+    name = getattr(func, "__name__", type(func).__name__)
+    key = f"{func.__module__}.{getattr(func, '__qualname__', name)}{args!r}{sorted(keywords.items())!r}"
+    return name, key
+
+
+def _call(call: Callable[[], DataFrame]) -> DataFrame:
+    return call()
+
+
+class FrameCache:
+    """Pickled DataFrames on disk with a TTL and size-bounded LRU eviction.
+
+    Entry age is the file's mtime (time written); recency is its atime, which
+    is bumped explicitly on every hit so eviction works on noatime mounts.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl_seconds: int, max_bytes: int, enabled: bool = True):
+        self.directory = Path(directory)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        # Ignore existing entries but still write fresh ones
+        self.refresh = False
+        self._evict_lock = threading.Lock()
+
+    def configure(self, enabled: Optional[bool] = None, refresh: Optional[bool] = None):
+        """Apply --no-cache / --refresh style overrides"""
+        if enabled is not None:
+            self.enabled = enabled
+        if refresh is not None:
+            self.refresh = refresh
+
+    def path_for(self, call: Callable[[], DataFrame]) -> Path:
+        name, key = _describe(call)
+        return self.directory / f"{name}-{hashlib.sha1(key.encode()).hexdigest()[:16]}.pkl"
+
+    def fetch(
+        self,
+        call: Callable[[], DataFrame],
+        invoke: Optional[Callable[[Callable[[], DataFrame]], DataFrame]] = None,
+    ) -> DataFrame:
+        """Return the cached frame for `call` if fresh, otherwise call it (through `invoke`, if given) and cache it"""
+        invoke = invoke or _call
+        if not self.enabled:
+            return invoke(call)
+
+        path = self.path_for(call)
+        if not self.refresh:
+            cached = self._read(path)
+            if cached is not None:
+                return cached
+
+        df = invoke(call)
+        if isinstance(df, DataFrame):
+            self._write(path, df)
+        return df
+
+    def clear(self):
+        for entry in self.directory.glob("*.pkl"):
+            entry.unlink(missing_ok=True)
+
+    def _read(self, path: Path) -> Optional[DataFrame]:
+        try:
+            stat = path.stat()
+            if time.time() - stat.st_mtime > self.ttl_seconds:
+                return None
+            df = read_pickle(path)
+            os.utime(path, (time.time(), stat.st_mtime))
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError, ImportError) as e:
+            if not isinstance(e, FileNotFoundError):
+                log.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+                path.unlink(missing_ok=True)
+            return None
+
+        log.debug(f"📦 Cache hit {path.name}")
+        return df
+
+    def _write(self, path: Path, df: DataFrame):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+            df.to_pickle(tmp)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning(f"Could not write cache entry {path.name}: {e}")
+            return
+        self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        with self._evict_lock:
+            entries = []
+            for entry in self.directory.glob("*.pkl"):
+                try:
+                    entries.append((entry.stat().st_atime, entry.stat().st_size, entry))
+                except FileNotFoundError:
+                    continue
+
+            total = sum(size for _, size, _ in entries)
+            for _, size, entry in sorted(entries, key=lambda item: item[0]):
+                if total <= self.max_bytes:
+                    break
+                entry.unlink(missing_ok=True)
+                total -= size
+                log.debug(f"🗑️  Evicted cache entry {entry.name}")
+
+
+frame_cache = FrameCache(CACHE_DIR, CACHE_TTL_SECONDS, CACHE_MAX_MB * 1024 * 1024, enabled=CACHE_ENABLED)
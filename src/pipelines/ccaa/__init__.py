@@ -0,0 +1,35 @@
+"""CCAA pipelines; specs listed here are picked up by src.pipelines.registry like the USports ones"""
+
+from src.config.settings import CCAA_FIXTURES_DIR
+from src.pipelines.registry import PipelineSpec
+from src.utils.constants import (
+    BASKETBALL,
+    FOOTBALL,
+    ICE_HOCKEY,
+    PLAYER_STATS,
+    SOCCER,
+    STANDINGS,
+    TEAM_STATS,
+    VOLLEYBALL,
+)
+
+
+def _spec(sport: str, class_name: str, teams: tuple[int, int], players: tuple[int, int], **options) -> PipelineSpec:
+    return PipelineSpec(
+        f"ccaa_{sport}",
+        f"src.pipelines.ccaa.sports:{class_name}",
+        expected_rows={STANDINGS: teams, TEAM_STATS: teams, PLAYER_STATS: players},
+        calendar=sport,
+        # Scheduled runs need recorded frames; snapshot loads work either way
+        enabled=bool(CCAA_FIXTURES_DIR),
+        **options,
+    )
+
+
+PIPELINES = (
+    _spec(BASKETBALL, "CCAABasketballPipeline", (5, 60), (30, 1000)),
+    _spec(FOOTBALL, "CCAAFootballPipeline", (3, 20), (50, 1500), leagues=("m",), cost=1.5),
+    _spec(ICE_HOCKEY, "CCAAIceHockeyPipeline", (3, 20), (30, 600)),
+    _spec(VOLLEYBALL, "CCAAVolleyballPipeline", (5, 60), (30, 800)),
+    _spec(SOCCER, "CCAASoccerPipeline", (5, 60), (50, 1500)),
+)
@@ -0,0 +1,50 @@
+from functools import partial
+from typing import Optional
+
+from pandas import DataFrame
+from usports.base.types import LeagueType, SeasonType
+
+from src.config.settings import CCAA_FIXTURES_DIR
+from src.pipelines.ccaa.source import read_recorded
+from src.pipelines.seasonal_logic import REGULAR
+from src.pipelines.usports.base import BaseSportPipeline
+from src.utils.constants import PLAYER_STATS, STANDINGS, TEAM_STATS
+from src.utils.schools import CCAA_COLLEGES
+from src.validations.ccaa import validate_ccaa_data
+
+
+class CollegePipeline(BaseSportPipeline):
+    """Generic CCAA pipeline: a subclass only names its sport and `tables`.
+
+    Fetching and validation are generic, and saving is the base class's
+    table-driven engine, so every CCAA sport shares the concurrent fetch
+    stage and bulk-load path of the USports pipelines.
+    """
+
+    # USports sport whose columns and rules this CCAA sport shares, e.g. "basketball"
+    sport: str
+    school_index = CCAA_COLLEGES
+
+    def __init__(self, fixtures_dir: Optional[str] = None):
+        super().__init__(f"ccaa_{self.sport}")
+        self.fixtures_dir = fixtures_dir or CCAA_FIXTURES_DIR
+
+    def fetch_data(self, league: LeagueType, season_option: SeasonType):
+        """Read recorded CCAA frames (no CCAA client library exists yet)"""
+        if not self.fixtures_dir:
+            raise RuntimeError(f"{self.sport_name} needs CCAA_FIXTURES_DIR pointing at recorded frames")
+
+        def recorded(table: str):
+            return partial(read_recorded, self.fixtures_dir, self.sport_name, league, season_option, table)
+
+        return self.fetch_tables(
+            league,
+            season_option,
+            standings=recorded(STANDINGS) if season_option == REGULAR else None,
+            teams=recorded(TEAM_STATS),
+            players=recorded(PLAYER_STATS),
+        )
+
+    def validate_data(self, standings_df: DataFrame, team_stats_df: DataFrame, player_stats_df: DataFrame):
+        """Validate against the sport's USports schema and the CCAA college index"""
+        validate_ccaa_data(self.sport, standings_df, team_stats_df, player_stats_df)
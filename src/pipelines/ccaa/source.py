@@ -0,0 +1,18 @@
+"""Where CCAA frames come from: recorded fixtures in the snapshot layout, read without any network calls"""
+
+from pathlib import Path
+
+from pandas import DataFrame
+
+from src.pipelines.snapshots import read_snapshot
+
+
+def read_recorded(directory: str, sport: str, league: str, season_option: str, table: str) -> DataFrame:
+    """One recorded frame, e.g. ccaa_basketball_m_regular_players.csv (flat or partitioned, CSV or Parquet).
+
+    A module-level function over plain strings, so frame cache keys stay stable across runs.
+    """
+    df = read_snapshot(Path(directory), sport, league, season_option, table)
+    if df is None:
+        raise FileNotFoundError(f"No recorded {sport} {league} {season_option} {table} frame in {directory}")
+    return df
@@ -0,0 +1,48 @@
+"""CCAA sport pipelines, one small subclass per sport"""
+
+from src.database.models.ccaa import (
+    CCAABasketballPlayerStats,
+    CCAABasketballStandings,
+    CCAABasketballTeamStats,
+    CCAAFootballPlayerStats,
+    CCAAFootballStandings,
+    CCAAFootballTeamStats,
+    CCAAIceHockeyPlayerStats,
+    CCAAIceHockeyStandings,
+    CCAAIceHockeyTeamStats,
+    CCAASoccerPlayerStats,
+    CCAASoccerStandings,
+    CCAASoccerTeamStats,
+    CCAAVolleyballPlayerStats,
+    CCAAVolleyballStandings,
+    CCAAVolleyballTeamStats,
+)
+from src.pipelines.ccaa.base import CollegePipeline
+from src.pipelines.tables import stats_tables
+from src.utils.constants import BASKETBALL, FOOTBALL, ICE_HOCKEY, SOCCER, VOLLEYBALL
+
+
+class CCAABasketballPipeline(CollegePipeline):
+    sport = BASKETBALL
+    tables = stats_tables(CCAABasketballStandings, CCAABasketballTeamStats, CCAABasketballPlayerStats)
+
+
+class CCAAFootballPipeline(CollegePipeline):
+    sport = FOOTBALL
+    leagues = ("m",)
+    tables = stats_tables(CCAAFootballStandings, CCAAFootballTeamStats, CCAAFootballPlayerStats)
+
+
+class CCAAIceHockeyPipeline(CollegePipeline):
+    sport = ICE_HOCKEY
+    tables = stats_tables(CCAAIceHockeyStandings, CCAAIceHockeyTeamStats, CCAAIceHockeyPlayerStats)
+
+
+class CCAASoccerPipeline(CollegePipeline):
+    sport = SOCCER
+    tables = stats_tables(CCAASoccerStandings, CCAASoccerTeamStats, CCAASoccerPlayerStats)
+
+
+class CCAAVolleyballPipeline(CollegePipeline):
+    sport = VOLLEYBALL
+    tables = stats_tables(CCAAVolleyballStandings, CCAAVolleyballTeamStats, CCAAVolleyballPlayerStats)
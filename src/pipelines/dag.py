@@ -0,0 +1,165 @@
+"""Small DAG executor: nodes run on named worker pools as soon as their dependencies finish"""
+
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from src.utils.logger import log
+
+# Worker pools: network/file I/O, CPU-bound frame work, database writes
+IO = "io"
+CPU = "cpu"
+DB = "db"
+
+
+@dataclass(frozen=True)
+class Node:
+    """One unit of work; `func` is called with its dependencies' results, in `deps` order"""
+
+    name: str
+    func: Callable[..., Any]
+    deps: tuple[str, ...] = ()
+    pool: str = CPU
+    retries: int = 0
+    # Names no two running nodes may hold at once (e.g. the tables a load writes)
+    resources: tuple[str, ...] = ()
+
+
+@dataclass
+class DagResult:
+    results: dict[str, Any] = field(default_factory=dict)
+    errors: dict[str, BaseException] = field(default_factory=dict)
+    # Nodes never run because a dependency failed
+    skipped: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors and not self.skipped
+
+
+class Dag:
+    """Dependency graph of nodes, built up front and then run once.
+
+    Nodes must be added after their dependencies, so insertion order is a
+    topological order. Ready nodes are started in insertion order once their
+    pool has an idle worker and none of their resources are held, so a node
+    never holds resources while queued; a failed node is retried with
+    exponential backoff and, once out of retries, every node downstream of it
+    is skipped while independent branches carry on. Errors of a `no_retry`
+    type (deterministic failures that would only happen again) fail their
+    node on the first attempt.
+    """
+
+    def __init__(self, no_retry: tuple[type[BaseException], ...] = ()):
+        self.nodes: dict[str, Node] = {}
+        self.no_retry = no_retry
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def add(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        deps: tuple[str, ...] = (),
+        pool: str = CPU,
+        retries: int = 0,
+        resources: tuple[str, ...] = (),
+    ) -> str:
+        if name in self.nodes:
+            raise ValueError(f"Duplicate DAG node {name}")
+        unknown = [dep for dep in deps if dep not in self.nodes]
+        if unknown:
+            raise ValueError(f"{name} depends on unknown nodes {unknown}")
+        self.nodes[name] = Node(name, func, tuple(deps), pool, retries, tuple(sorted(resources)))
+        return name
+
+    def run(self, workers: dict[str, int], retry_delay: float = 1.0) -> DagResult:
+        """Execute every node and return the results, errors and skipped nodes"""
+        result = DagResult()
+        waiting = {name: set(node.deps) for name, node in self.nodes.items()}
+        dependents: dict[str, list[str]] = defaultdict(list)
+        for node in self.nodes.values():
+            for dep in node.deps:
+                dependents[dep].append(node.name)
+
+        ready = [name for name, deps in waiting.items() if not deps]
+        not_before: dict[str, float] = {}
+        attempts: dict[str, int] = defaultdict(int)
+        running: dict[Future, str] = {}
+        held: set[str] = set()
+        busy: dict[str, int] = defaultdict(int)
+
+        capacity = {node.pool: max(1, workers.get(node.pool, 1)) for node in self.nodes.values()}
+        executors = {
+            pool: ThreadPoolExecutor(max_workers=size, thread_name_prefix=pool) for pool, size in capacity.items()
+        }
+        try:
+            while ready or running:
+                now = time.monotonic()
+                for name in list(ready):
+                    node = self.nodes[name]
+                    backing_off = not_before.get(name, 0.0) > now
+                    if backing_off or busy[node.pool] >= capacity[node.pool] or not held.isdisjoint(node.resources):
+                        continue
+                    ready.remove(name)
+                    busy[node.pool] += 1
+                    held.update(node.resources)
+                    args = [result.results[dep] for dep in node.deps]
+                    running[executors[node.pool].submit(node.func, *args)] = name
+
+                timeout = self._next_retry(ready, not_before, now)
+                if not running:
+                    # Only backed-off retries left
+                    time.sleep(timeout or 0.0)
+                    continue
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    name = running.pop(future)
+                    node = self.nodes[name]
+                    busy[node.pool] -= 1
+                    held.difference_update(node.resources)
+                    error = future.exception()
+                    if error is None:
+                        result.results[name] = future.result()
+                        for dependent in dependents[name]:
+                            waiting[dependent].discard(name)
+                            if not waiting[dependent]:
+                                ready.append(dependent)
+                        continue
+
+                    attempts[name] += 1
+                    if attempts[name] <= node.retries and not isinstance(error, self.no_retry):
+                        delay = retry_delay * 2 ** (attempts[name] - 1)
+                        log.warning(f"🔁 {name} failed ({str(error)[:200]}), retry {attempts[name]} in {delay:.1f}s")
+                        not_before[name] = time.monotonic() + delay
+                        ready.append(name)
+                    else:
+                        log.error(f"❌ {name} failed: {str(error)[:500]}")
+                        result.errors[name] = error
+                        result.skipped.extend(self._downstream(name, dependents))
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        return result
+
+    @staticmethod
+    def _next_retry(ready: list[str], not_before: dict[str, float], now: float) -> Optional[float]:
+        """How long to wait before a backed-off node becomes runnable, if any are pending"""
+        delays = [not_before[name] - now for name in ready if not_before.get(name, 0.0) > now]
+        return max(0.0, min(delays)) if delays else None
+
+    @staticmethod
+    def _downstream(name: str, dependents: dict[str, list[str]]) -> list[str]:
+        found: list[str] = []
+        stack = list(dependents[name])
+        while stack:
+            node = stack.pop()
+            if node not in found:
+                found.append(node)
+                stack.extend(dependents[node])
+        return found
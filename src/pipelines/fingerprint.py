@@ -0,0 +1,80 @@
+"""Stable content fingerprints for fetched frames, used to skip unchanged slices"""
+
+import hashlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.database.models.fingerprints import TableFingerprint
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    """SHA-256 of a frame's content, independent of column order, row order and dtype width.
+
+    Numeric columns are compared as float64 (so 3 == 3.0 across runs), everything
+    else as strings, and missing values are normalized before hashing.
+    """
+    columns = sorted(df.columns)
+    normalized = pd.DataFrame(
+        {
+            col: (
+                df[col].astype("float64")
+                if pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])
+                else df[col].astype("string").fillna("<NA>")
+            )
+            for col in columns
+        }
+    )
+    row_hashes = np.sort(pd.util.hash_pandas_object(normalized, index=False).to_numpy())
+
+    digest = hashlib.sha256()
+    digest.update("\x1f".join(map(str, columns)).encode())
+    digest.update(row_hashes.tobytes())
+    return digest.hexdigest()
+
+
+def frame_fingerprints(frames: dict[str, Optional[pd.DataFrame]]) -> dict[str, tuple[str, int]]:
+    """Fingerprint and row count for every frame that was fetched"""
+    return {table: (frame_fingerprint(df), len(df)) for table, df in frames.items() if df is not None}
+
+
+def fingerprints_unchanged(
+    session: Session, sport: str, league: str, season_option: str, fingerprints: dict[str, tuple[str, int]]
+) -> bool:
+    """True when every table's fingerprint matches the one stored by the last load"""
+    stored = _stored_fingerprints(session, sport, league, season_option)
+    return bool(fingerprints) and all(
+        table in stored and stored[table].fingerprint == fingerprint for table, (fingerprint, _) in fingerprints.items()
+    )
+
+
+def store_fingerprints(
+    session: Session, sport: str, league: str, season_option: str, fingerprints: dict[str, tuple[str, int]]
+):
+    """Record fingerprints in the session; they commit together with the data they describe"""
+    stored = _stored_fingerprints(session, sport, league, season_option)
+    for table, (fingerprint, row_count) in fingerprints.items():
+        if table in stored:
+            stored[table].fingerprint = fingerprint
+            stored[table].row_count = row_count
+        else:
+            session.add(
+                TableFingerprint(
+                    sport=sport,
+                    league=league,
+                    season_option=season_option,
+                    table_name=table,
+                    fingerprint=fingerprint,
+                    row_count=row_count,
+                )
+            )
+
+
+def _stored_fingerprints(session: Session, sport: str, league: str, season_option: str) -> dict[str, TableFingerprint]:
+    rows = session.scalars(
+        select(TableFingerprint).filter_by(sport=sport, league=league, season_option=season_option)
+    ).all()
+    return {row.table_name: row for row in rows}
@@ -0,0 +1,38 @@
+"""--only filters (`sport=basketball,league=w`) over sport/league/season jobs; imports nothing heavy"""
+
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from src.pipelines.runner import PipelineJob
+
+# --only keys -> PipelineJob attribute
+FILTER_KEYS = {"sport": "sport", "league": "league", "season": "season_option"}
+
+
+def parse_job_filter(spec: str) -> dict[str, set[str]]:
+    """Parse `sport=basketball,league=w` (repeat a key to allow several values) into key -> allowed values"""
+    job_filter: dict[str, set[str]] = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        key, sep, value = part.partition("=")
+        if not sep or key not in FILTER_KEYS or not value:
+            raise ValueError(f"Invalid filter {part!r}, expected one of {sorted(FILTER_KEYS)} as key=value")
+        job_filter.setdefault(key, set()).add(value)
+    return job_filter
+
+
+def sports_matching(sports: Iterable[str], filters: list[dict[str, set[str]]]) -> list[str]:
+    """Sports some filter could match, so pipelines for the others are never imported"""
+    if not filters:
+        return list(sports)
+    return [sport for sport in sports if any(sport in f.get("sport", {sport}) for f in filters)]
+
+
+def filter_jobs(jobs: list["PipelineJob"], filters: list[dict[str, set[str]]]) -> list["PipelineJob"]:
+    """Jobs matching any of the filters (every key of a filter must match); all jobs when there are none"""
+    if not filters:
+        return jobs
+    return [
+        job
+        for job in jobs
+        if any(all(getattr(job, FILTER_KEYS[key]) in values for key, values in f.items()) for f in filters)
+    ]
@@ -0,0 +1,192 @@
+"""Per-stage timing and throughput metrics for pipeline runs, queryable without logfire"""
+
+import bisect
+import json
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+# Stage names
+FETCH = "fetch"
+VALIDATE = "validate"
+SAVE = "save"
+
+ALL_TABLES = "all"
+
+# Upper bounds (seconds) of the fetch attempt latency histogram buckets; +Inf is implicit
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+@dataclass
+class StageMetric:
+    """Wall time and volume of one stage for one sport/league/season/table"""
+
+    sport: str
+    league: str
+    season_option: str
+    stage: str
+    table: str
+    seconds: float = 0.0
+    rows: int = 0
+    bytes: int = 0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def key(self) -> tuple[str, str, str, str, str]:
+        return self.sport, self.league, self.season_option, self.stage, self.table
+
+
+@dataclass
+class LatencyHistogram:
+    """Attempt counts per latency bucket, plus the running sum, for one host and outcome"""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total_seconds: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total_seconds += seconds
+
+    def cumulative(self) -> list[int]:
+        running, result = 0, []
+        for count in self.counts:
+            running += count
+            result.append(running)
+        return result
+
+
+class MetricsCollector:
+    """Thread-safe accumulator; repeated records for the same key (e.g. retries) are summed"""
+
+    def __init__(self):
+        self._metrics: dict[tuple, StageMetric] = {}
+        # (host, outcome) -> latency of every upstream fetch attempt
+        self._attempts: dict[tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        sport: str,
+        league: str,
+        season_option: str,
+        stage: str,
+        table: str = ALL_TABLES,
+        seconds: float = 0.0,
+        rows: int = 0,
+        nbytes: int = 0,
+    ):
+        metric = StageMetric(sport, league, season_option, stage, table)
+        with self._lock:
+            metric = self._metrics.setdefault(metric.key, metric)
+            metric.seconds += seconds
+            metric.rows += rows
+            metric.bytes += nbytes
+
+    def record_attempt(self, host: str, outcome: str, seconds: float = 0.0):
+        """One upstream fetch attempt (including failed and rejected ones)"""
+        with self._lock:
+            self._attempts.setdefault((host, outcome), LatencyHistogram()).observe(seconds)
+
+    def metrics(self) -> list[StageMetric]:
+        with self._lock:
+            return sorted(self._metrics.values(), key=lambda m: m.key)
+
+    def attempts(self) -> dict[tuple[str, str], LatencyHistogram]:
+        with self._lock:
+            return {key: LatencyHistogram(list(h.counts), h.total_seconds) for key, h in sorted(self._attempts.items())}
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+            self._attempts.clear()
+
+    def summary_table(self) -> str:
+        """Fixed-width table of every stage plus per-stage totals"""
+        header = (
+            f"{'sport':<12}{'league':<7}{'season':<14}{'stage':<10}{'table':<10}"
+            f"{'seconds':>9}{'rows':>8}{'rows/s':>11}{'KiB':>9}"
+        )
+        lines = [header, "-" * len(header)]
+        totals: dict[str, StageMetric] = defaultdict(lambda: StageMetric("", "", "", "", ""))
+
+        for m in self.metrics():
+            lines.append(
+                f"{m.sport:<12}{m.league:<7}{m.season_option:<14}{m.stage:<10}{m.table:<10}"
+                f"{m.seconds:>9.3f}{m.rows:>8}{m.rows_per_second:>11,.0f}{m.bytes / 1024:>9.1f}"
+            )
+            total = totals[m.stage]
+            total.seconds += m.seconds
+            total.rows += m.rows
+            total.bytes += m.bytes
+
+        lines.append("-" * len(header))
+        for stage, total in totals.items():
+            lines.append(
+                f"{'TOTAL':<33}{stage:<10}{'':<10}"
+                f"{total.seconds:>9.3f}{total.rows:>8}{total.rows_per_second:>11,.0f}{total.bytes / 1024:>9.1f}"
+            )
+
+        attempts = self.attempts()
+        if attempts:
+            lines += ["", f"{'fetch attempts':<40}{'outcome':<14}{'count':>7}{'mean s':>9}"]
+            for (host, outcome), histogram in attempts.items():
+                mean = histogram.total_seconds / histogram.count
+                lines.append(f"{host:<40}{outcome:<14}{histogram.count:>7}{mean:>9.3f}")
+        return "\n".join(lines)
+
+    def write_json(self, path: Path):
+        records = [{**asdict(m), "rows_per_second": round(m.rows_per_second, 1)} for m in self.metrics()]
+        for (host, outcome), histogram in self.attempts().items():
+            records.append(
+                {
+                    "stage": "fetch_attempt",
+                    "host": host,
+                    "outcome": outcome,
+                    "count": histogram.count,
+                    "seconds": round(histogram.total_seconds, 3),
+                    "buckets": dict(zip([*map(str, LATENCY_BUCKETS), "+Inf"], histogram.cumulative())),
+                }
+            )
+        path.write_text(json.dumps(records, indent=2))
+
+    def write_prometheus(self, path: Path):
+        """node_exporter textfile-collector format"""
+        series = {
+            "northscore_pipeline_stage_seconds": ("Wall time spent in a pipeline stage", "seconds"),
+            "northscore_pipeline_stage_rows": ("Rows processed by a pipeline stage", "rows"),
+            "northscore_pipeline_stage_bytes": ("In-memory size of frames processed by a pipeline stage", "bytes"),
+        }
+        lines = []
+        for name, (help_text, attribute) in series.items():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge"]
+            for m in self.metrics():
+                labels = (
+                    f'sport="{m.sport}",league="{m.league}",season="{m.season_option}",'
+                    f'stage="{m.stage}",table="{m.table}"'
+                )
+                lines.append(f"{name}{{{labels}}} {getattr(m, attribute)}")
+
+        name = "northscore_fetch_attempt_seconds"
+        lines += [f"# HELP {name} Latency of upstream fetch attempts by host and outcome", f"# TYPE {name} histogram"]
+        for (host, outcome), histogram in self.attempts().items():
+            labels = f'host="{host}",outcome="{outcome}"'
+            for bound, count in zip([*map(str, LATENCY_BUCKETS), "+Inf"], histogram.cumulative()):
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total_seconds}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+        # Write then rename so the collector never reads a partial file
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text("\n".join(lines) + "\n")
+        tmp.replace(path)
+
+
+metrics = MetricsCollector()
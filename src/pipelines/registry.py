@@ -0,0 +1,155 @@
+"""Registry of sport pipelines: metadata up front, pipeline modules imported only when a sport runs.
+
+Built-in pipeline packages and any installed plugin expose `PipelineSpec`s; plugins
+advertise them through the "northscore.pipelines" entry point group, e.g. in the
+plugin's pyproject.toml:
+
+    [project.entry-points."northscore.pipelines"]
+    my_sport = "my_package.pipelines:PIPELINES"
+
+An entry point may resolve to a spec, an iterable of specs, or a callable returning either.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Optional
+
+from src.pipelines.seasonal_logic import CHAMPIONSHIP, PLAYOFFS, REGULAR, get_active_seasons_by_month
+from src.utils.constants import PLAYER_STATS, STANDINGS, TEAM_STATS
+from src.utils.logger import log
+
+# Type-only: importing usports (or a pipeline) here would load it on every run, even one with nothing to do
+if TYPE_CHECKING:
+    from usports.base.types import LeagueType, SeasonType
+
+    from src.pipelines.usports.base import BaseSportPipeline
+
+ENTRY_POINT_GROUP = "northscore.pipelines"
+
+# Packages shipped with the project, registered before any entry point
+BUILTIN_PLUGINS = ("src.pipelines.usports", "src.pipelines.ccaa")
+
+# Share of a regular season's rows a playoff or championship slice usually has
+SEASON_COST_WEIGHTS = {REGULAR: 1.0, PLAYOFFS: 0.3, CHAMPIONSHIP: 0.1}
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """Everything the scripts and scheduler need to know about a pipeline without importing it"""
+
+    # Job/table prefix, e.g. "basketball" or "ccaa_basketball"
+    sport: str
+    # "module:Class" of the BaseSportPipeline subclass
+    target: str
+    leagues: "tuple[LeagueType, ...]" = ("m", "w")
+    season_types: "tuple[SeasonType, ...]" = (REGULAR, PLAYOFFS, CHAMPIONSHIP)
+    tables: tuple[str, ...] = (STANDINGS, TEAM_STATS, PLAYER_STATS)
+    # Table -> (min, max) rows of a regular season slice; warnings only, never failures
+    expected_rows: Mapping[str, tuple[int, int]] = field(default_factory=dict)
+    # Sport whose calendar in seasonal_logic decides when this pipeline runs (defaults to `sport`)
+    calendar: Optional[str] = None
+    # Relative cost of one row compared to other sports (wider tables, slower upstream pages)
+    cost: float = 1.0
+    # False keeps the sport out of scheduled runs (e.g. no data source configured); snapshot loads still work
+    enabled: bool = True
+
+    @property
+    def calendar_sport(self) -> str:
+        return self.calendar or self.sport
+
+    def cost_hint(self, season_option: "SeasonType") -> float:
+        """Rough relative cost of one league/season of this sport, for longest-first scheduling"""
+        rows = sum(high for _, high in self.expected_rows.values()) or 1
+        return self.cost * rows * SEASON_COST_WEIGHTS.get(season_option, 1.0)
+
+    def load(self) -> "type[BaseSportPipeline]":
+        module, _, name = self.target.partition(":")
+        return getattr(import_module(module), name)
+
+    def create(self) -> "BaseSportPipeline":
+        pipeline = self.load()()
+        pipeline.leagues = self.leagues
+        pipeline.expected_rows = self.expected_rows
+        return pipeline
+
+
+class PipelineRegistry:
+    """Specs by sport, discovered once from the built-in packages and installed entry points"""
+
+    def __init__(self, builtin_plugins: Iterable[str] = BUILTIN_PLUGINS, group: str = ENTRY_POINT_GROUP):
+        self.builtin_plugins = tuple(builtin_plugins)
+        self.group = group
+        self._specs: dict[str, PipelineSpec] = {}
+        self._discovered = False
+        self._lock = threading.RLock()
+
+    def register(self, spec: PipelineSpec):
+        with self._lock:
+            existing = self._specs.get(spec.sport)
+            if existing is not None and existing != spec:
+                log.warning(f"⚠️  Pipeline {spec.target} for {spec.sport} ignored, {existing.target} is registered")
+                return
+            self._specs[spec.sport] = spec
+
+    def _register_plugin(self, plugin: Any, source: str):
+        if callable(plugin) and not isinstance(plugin, PipelineSpec):
+            plugin = plugin()
+        specs = [plugin] if isinstance(plugin, PipelineSpec) else list(plugin)
+        for spec in specs:
+            if not isinstance(spec, PipelineSpec):
+                raise TypeError(f"{source} provided {spec!r}, expected PipelineSpec")
+            self.register(spec)
+
+    def discover(self):
+        """Register built-in specs, then every installed plugin's (a broken plugin is logged and skipped)"""
+        with self._lock:
+            if self._discovered:
+                return
+            for module in self.builtin_plugins:
+                self._register_plugin(getattr(import_module(module), "PIPELINES"), module)
+            for entry_point in entry_points(group=self.group):
+                try:
+                    self._register_plugin(entry_point.load(), entry_point.value)
+                except Exception as e:
+                    log.error(f"❌ Pipeline plugin {entry_point.name} ({entry_point.value}) failed to load: {e}")
+            self._discovered = True
+
+    def specs(self) -> list[PipelineSpec]:
+        self.discover()
+        return list(self._specs.values())
+
+    def get(self, sport: str) -> Optional[PipelineSpec]:
+        self.discover()
+        return self._specs.get(sport)
+
+    def active_seasons(self, month: int) -> "dict[str, list[SeasonType]]":
+        """Season types each registered sport runs in `month`, following its calendar sport"""
+        calendar = get_active_seasons_by_month(month)
+        active = {}
+        for spec in self.specs():
+            if not spec.enabled:
+                continue
+            seasons = [season for season in calendar.get(spec.calendar_sport, []) if season in spec.season_types]
+            if seasons:
+                active[spec.sport] = seasons
+        return active
+
+    def load_pipelines(self, sports: Iterable[str]) -> dict[str, "BaseSportPipeline"]:
+        """Pipeline instances for `sports`, importing only those sports' modules"""
+        pipelines = {}
+        for sport in sports:
+            spec = self.get(sport)
+            if spec is None:
+                log.warning(f"⚠️  No pipeline for {sport}")
+                continue
+            pipelines[sport] = spec.create()
+        return pipelines
+
+    def cost_hint(self, sport: str, season_option: "SeasonType") -> float:
+        spec = self.get(sport)
+        return spec.cost_hint(season_option) if spec is not None else 1.0
+
+
+registry = PipelineRegistry()
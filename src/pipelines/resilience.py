@@ -0,0 +1,235 @@
+"""Timeouts, jittered retries and per-host circuit breaking around upstream fetch calls"""
+
+import http.client
+import random
+import socket
+import threading
+import time
+import urllib.error
+from functools import partial
+from typing import Callable, Optional
+
+from pandas import DataFrame
+
+from src.config.settings import (
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    FETCH_ATTEMPTS,
+    FETCH_BACKOFF_MAX_SECONDS,
+    FETCH_BACKOFF_SECONDS,
+    FETCH_TIMEOUT_SECONDS,
+)
+from src.pipelines.metrics import metrics
+from src.utils.logger import log
+
+# HTTP clients whose transport errors do not derive from OSError; each is only needed to classify its own errors
+try:
+    import httpx  # what usports fetches with
+except ImportError:
+    httpx = None
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Top-level package of a fetch function -> host it scrapes (breaker key)
+SOURCE_HOSTS = {"usports": "universitysport.prestosports.com"}
+
+# Attempt outcomes
+OK = "ok"
+ERROR = "error"
+TIMEOUT = "timeout"
+REJECTED = "circuit_open"
+
+
+class FetchTimeoutError(TimeoutError):
+    """An upstream call did not return within its timeout"""
+
+
+class CircuitOpenError(RuntimeError):
+    """The host's breaker is open, so the call was not attempted"""
+
+
+def host_of(call: Callable[[], DataFrame]) -> str:
+    """Host a zero-argument fetch callable talks to, from the package of its function (else its module)"""
+    func = call.func if isinstance(call, partial) else call
+    module = getattr(func, "__module__", None) or "unknown"
+    return SOURCE_HOSTS.get(module.split(".")[0], module)
+
+
+def _status_code(error: BaseException) -> Optional[int]:
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def is_transient(error: BaseException) -> bool:
+    """Whether a failed call may succeed if repeated: timeouts, connection errors and 5xx responses.
+
+    Anything else (a parse error, a KeyError in a table parser, a 4xx) fails
+    the same way every time, so it is neither retried nor held against the host.
+    """
+    status = _status_code(error)
+    if status is not None:
+        return status >= 500
+    if isinstance(
+        error, (TimeoutError, ConnectionError, socket.gaierror, http.client.HTTPException, urllib.error.URLError)
+    ):
+        return True
+    # Connect/read/pool timeouts, refused connections and dropped or malformed responses
+    if httpx is not None and isinstance(error, httpx.TransportError):
+        return True
+    return requests is not None and isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one host.
+
+    Closed: calls go through. After `threshold` consecutive failures it opens
+    and rejects calls for `reset_seconds`; then a single trial call is let
+    through (half-open) and its outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, host: str, threshold: int, reset_seconds: float):
+        self.host = host
+        self.threshold = threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self.opened_at is not None
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._trial_running or time.monotonic() - self.opened_at < self.reset_seconds:
+                return False
+            self._trial_running = True
+            return True
+
+    def succeeded(self):
+        with self._lock:
+            if self.opened_at is not None:
+                log.info(f"🟢 {self.host} is responding again, closing its circuit breaker")
+            self.failures = 0
+            self.opened_at = None
+            self._trial_running = False
+
+    def release(self):
+        """End a call that says nothing about the host's health, letting the next trial through"""
+        with self._lock:
+            self._trial_running = False
+
+    def failed(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_running or (self.opened_at is None and self.failures >= self.threshold):
+                log.warning(
+                    f"🔴 {self.host} failed {self.failures} times in a row, pausing calls for {self.reset_seconds:g}s"
+                )
+                self.opened_at = time.monotonic()
+            self._trial_running = False
+
+
+def _call_with_timeout(call: Callable[[], DataFrame], timeout: float) -> DataFrame:
+    """Run `call` on a daemon thread and give up waiting after `timeout` seconds.
+
+    A thread cannot be killed, so a timed-out call is abandoned and finishes
+    (or hangs) in the background without blocking interpreter exit.
+    """
+    outcome: dict[str, object] = {}
+
+    def run():
+        try:
+            outcome["result"] = call()
+        except BaseException as e:  # re-raised in the caller's thread
+            outcome["error"] = e
+
+    worker = threading.Thread(target=run, name="fetch-call", daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise FetchTimeoutError(f"no response within {timeout:g}s")
+    if "error" in outcome:
+        raise outcome["error"]  # type: ignore[misc]
+    return outcome["result"]  # type: ignore[return-value]
+
+
+class ResilientFetcher:
+    """Calls upstream fetch functions with a timeout, retries and a circuit breaker per host.
+
+    Every attempt's outcome and latency are recorded in `metrics`. Only
+    transient failures (see `is_transient`) are retried and count towards the
+    breaker; retries back off exponentially with full jitter, so concurrent
+    fetches that failed together do not retry in lockstep.
+    """
+
+    def __init__(
+        self,
+        timeout: float = FETCH_TIMEOUT_SECONDS,
+        attempts: int = FETCH_ATTEMPTS,
+        backoff: float = FETCH_BACKOFF_SECONDS,
+        max_backoff: float = FETCH_BACKOFF_MAX_SECONDS,
+        breaker_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        breaker_reset: float = BREAKER_RESET_SECONDS,
+    ):
+        self.timeout = timeout
+        self.attempts = max(1, attempts)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset = breaker_reset
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(host, self.breaker_threshold, self.breaker_reset)
+            return self._breakers[host]
+
+    def delay(self, attempt: int) -> float:
+        """Full-jitter backoff before retry number `attempt` (1-based)"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def __call__(self, call: Callable[[], DataFrame]) -> DataFrame:
+        host = host_of(call)
+        breaker = self.breaker(host)
+        name = getattr(call.func if isinstance(call, partial) else call, "__name__", host)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if not breaker.allow():
+                metrics.record_attempt(host, REJECTED)
+                raise CircuitOpenError(f"{host} circuit breaker is open, not calling {name}")
+
+            start = time.perf_counter()
+            try:
+                df = _call_with_timeout(call, self.timeout)
+            except Exception as e:
+                outcome = TIMEOUT if isinstance(e, FetchTimeoutError) else ERROR
+                metrics.record_attempt(host, outcome, time.perf_counter() - start)
+                if not is_transient(e):
+                    breaker.release()
+                    raise
+                breaker.failed()
+                if attempt == self.attempts:
+                    raise
+                delay = self.delay(attempt)
+                log.warning(f"🔁 {name} attempt {attempt}/{self.attempts} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+            else:
+                metrics.record_attempt(host, OK, time.perf_counter() - start)
+                breaker.succeeded()
+                return df
+
+
+upstream = ResilientFetcher()
@@ -0,0 +1,169 @@
+"""Job planning and the fetch/load DAGs shared by the update and fetch scripts"""
+
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Optional
+
+from pandas import DataFrame
+from usports.base.types import LeagueType, SeasonType
+
+from src.config.settings import FETCH_RETRIES, LOAD_RETRIES
+from src.database.db import transaction
+from src.database.dtypes import DtypeError
+from src.pipelines.dag import CPU, DB, IO, Dag
+from src.pipelines.metrics import FETCH, metrics
+from src.pipelines.registry import registry
+from src.pipelines.snapshots import discover_snapshots, read_snapshot
+from src.pipelines.usports.base import BaseSportPipeline
+from src.pipelines.validation import PreparedFrames, ValidatedFrames
+from src.utils.constants import PLAYER_STATS, STANDINGS, TEAM_STATS
+from src.validations.schema import SchemaValidationError
+
+FetchedFrames = tuple[Optional[DataFrame], DataFrame, DataFrame]
+TABLES = (STANDINGS, TEAM_STATS, PLAYER_STATS)
+# Deterministic failures: the same frames are rejected the same way on every attempt
+NOT_RETRYABLE = (DtypeError, SchemaValidationError)
+
+
+@dataclass(frozen=True)
+class PipelineJob:
+    """One sport/league/season combination to run"""
+
+    sport: str
+    league: LeagueType
+    season_option: SeasonType
+    pipeline: BaseSportPipeline
+
+    def __str__(self) -> str:
+        return f"{self.sport} {self.league} {self.season_option}"
+
+
+def build_jobs(
+    active_seasons: dict[str, list[SeasonType]], pipelines: dict[str, BaseSportPipeline]
+) -> list[PipelineJob]:
+    """Expand active seasons into an ordered list of jobs (sports without a loaded pipeline are skipped)"""
+    jobs = []
+    for sport, season_options in active_seasons.items():
+        if sport not in pipelines:
+            continue
+
+        for league in pipelines[sport].leagues:
+            for season_option in season_options:
+                jobs.append(PipelineJob(sport, league, season_option, pipelines[sport]))
+
+    return jobs
+
+
+def order_by_cost(jobs: list[PipelineJob]) -> list[PipelineJob]:
+    """Most expensive combinations first (registry cost hints), so short ones fill the gaps at the end of a run"""
+    return sorted(jobs, key=lambda job: registry.cost_hint(job.sport, job.season_option), reverse=True)
+
+
+def build_snapshot_jobs(snapshot_dir: Path, pipelines: dict[str, BaseSportPipeline]) -> list[PipelineJob]:
+    """One job per combination found in a fetch_all_usports_data.py output directory (and a loaded pipeline)"""
+    jobs = []
+    for sport, league, season_option in discover_snapshots(snapshot_dir):
+        if sport not in pipelines:
+            continue
+        jobs.append(PipelineJob(sport, league, season_option, pipelines[sport]))  # type: ignore[arg-type]
+
+    return jobs
+
+
+def fetch_from_network(job: PipelineJob) -> FetchedFrames:
+    return job.pipeline.fetch(job.league, job.season_option)
+
+
+def snapshot_reader(snapshot_dir: Path) -> Callable[[PipelineJob], FetchedFrames]:
+    """Fetch function that reads a job's frames from local snapshot files instead of the network"""
+
+    def read_table(job: PipelineJob, table: str) -> Optional[DataFrame]:
+        start = time.perf_counter()
+        df = read_snapshot(snapshot_dir, job.sport, job.league, job.season_option, table)
+        if df is not None:
+            metrics.record(
+                job.sport,
+                job.league,
+                job.season_option,
+                FETCH,
+                table,
+                seconds=time.perf_counter() - start,
+                rows=len(df),
+                nbytes=int(df.memory_usage(deep=True).sum()),
+            )
+        return df
+
+    def read(job: PipelineJob) -> FetchedFrames:
+        frames = {table: read_table(job, table) for table in TABLES}
+        standings_df, team_stats_df, player_stats_df = frames[STANDINGS], frames[TEAM_STATS], frames[PLAYER_STATS]
+        if team_stats_df is None or player_stats_df is None:
+            raise FileNotFoundError(f"Incomplete snapshot for {job} in {snapshot_dir}")
+        return standings_df, team_stats_df, player_stats_df
+
+    return read
+
+
+def _validate_unless_unchanged(job: PipelineJob, prepared: PreparedFrames) -> Optional[ValidatedFrames]:
+    """None when the slice matches its last load, so the load node has nothing to write"""
+    with transaction() as session:
+        if job.pipeline.unchanged(session, job.league, job.season_option, prepared):
+            return None
+    return job.pipeline.validate(job.league, job.season_option, prepared)
+
+
+def _write(job: PipelineJob, validated: Optional[ValidatedFrames]):
+    if validated is not None:
+        with transaction() as session:
+            job.pipeline.write(session, job.league, job.season_option, validated)
+
+
+def build_load_dag(
+    jobs: list[PipelineJob],
+    fetch: Callable[[PipelineJob], FetchedFrames] = fetch_from_network,
+    fetch_retries: int = FETCH_RETRIES,
+    load_retries: int = LOAD_RETRIES,
+) -> Dag:
+    """fetch (I/O) -> normalize (CPU) -> validate (CPU) -> load (DB) for every job.
+
+    Each load runs in its own transaction and holds the tables its pipeline
+    writes, so loads of different sports overlap while one sport's loads
+    never write the same table at once.
+    """
+    dag = Dag(no_retry=NOT_RETRYABLE)
+    for job in jobs:
+        pipeline, league, season_option = job.pipeline, job.league, job.season_option
+        fetched = dag.add(f"{job}/fetch", partial(fetch, job), pool=IO, retries=fetch_retries)
+        prepared = dag.add(
+            f"{job}/normalize",
+            lambda frames, pipeline=pipeline, league=league, season_option=season_option: pipeline.prepare(
+                league, season_option, *frames
+            ),
+            deps=(fetched,),
+            pool=CPU,
+        )
+        validated = dag.add(f"{job}/validate", partial(_validate_unless_unchanged, job), deps=(prepared,), pool=CPU)
+        dag.add(
+            f"{job}/load",
+            partial(_write, job),
+            deps=(validated,),
+            pool=DB,
+            retries=load_retries,
+            resources=tuple(pipeline.written_tables()),
+        )
+    return dag
+
+
+def build_fetch_dag(
+    jobs: list[PipelineJob],
+    save: Callable[[PipelineJob, FetchedFrames], None],
+    fetch: Callable[[PipelineJob], FetchedFrames] = fetch_from_network,
+    fetch_retries: int = FETCH_RETRIES,
+) -> Dag:
+    """fetch -> save for every job, both on the I/O pool"""
+    dag = Dag(no_retry=NOT_RETRYABLE)
+    for job in jobs:
+        fetched = dag.add(f"{job}/fetch", partial(fetch, job), pool=IO, retries=fetch_retries)
+        dag.add(f"{job}/save", partial(save, job), deps=(fetched,), pool=IO)
+    return dag
@@ -1,11 +1,10 @@
-from usports.base.constants import (
-    BASKETBALL,
-    FOOTBALL,
-    ICE_HOCKEY,
-    SOCCER,
-    VOLLEYBALL,
-)
-from usports.base.types import SeasonType
+from typing import TYPE_CHECKING
+
+# Same values as usports.base.constants, without importing usports before any sport runs
+from src.utils.constants import BASKETBALL, FOOTBALL, ICE_HOCKEY, SOCCER, VOLLEYBALL
+
+if TYPE_CHECKING:
+    from usports.base.types import SeasonType
 
 # Season type constants
 REGULAR = "regular"
@@ -13,7 +12,7 @@ PLAYOFFS = "playoffs"
 CHAMPIONSHIP = "championship"
 
 
-def get_active_seasons_by_month(month: int) -> dict[str, list[SeasonType]]:
+def get_active_seasons_by_month(month: int) -> "dict[str, list[SeasonType]]":
     """Get active sports seasons for a given month"""
 
     # October - Fall sports regular season
@@ -0,0 +1,109 @@
+"""Read/write local snapshots of fetched frames in CSV or Parquet, flat or partitioned"""
+
+import importlib.util
+import re
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+CSV = "csv"
+PARQUET = "parquet"
+OUTPUT_FORMATS = (CSV, PARQUET)
+
+COMPRESSIONS = ("snappy", "gzip", "zstd")
+# pandas compresses CSV with zstd only through the zstandard package, which is not a dependency; gzip is stdlib
+_CSV_EXTENSIONS = {None: "", "gzip": ".gz"}
+
+
+def _require_pyarrow():
+    if importlib.util.find_spec("pyarrow") is None:
+        raise ImportError("Parquet snapshots need pyarrow: poetry run pip install pyarrow")
+
+
+def snapshot_path(
+    base_dir: Path,
+    sport: str,
+    league: str,
+    season_option: str,
+    table: str,
+    fmt: str = CSV,
+    compression: Optional[str] = None,
+    partitioned: bool = False,
+) -> Path:
+    """Flat: basketball_m_regular_players.csv; partitioned: sport=basketball/league=m/season=regular/table=players/"""
+    extension = ".parquet" if fmt == PARQUET else ".csv" + _CSV_EXTENSIONS[compression]
+    if partitioned:
+        return (
+            base_dir
+            / f"sport={sport}"
+            / f"league={league}"
+            / f"season={season_option}"
+            / f"table={table}"
+            / ("part-0" + extension)
+        )
+    return base_dir / f"{sport}_{league}_{season_option}_{table}{extension}"
+
+
+def write_snapshot(
+    df: pd.DataFrame,
+    base_dir: Path,
+    sport: str,
+    league: str,
+    season_option: str,
+    table: str,
+    fmt: str = CSV,
+    compression: Optional[str] = None,
+    partitioned: bool = False,
+) -> Path:
+    """Write one fetched frame; Parquet keeps dtypes, CSV stays human readable"""
+    if fmt == CSV and compression not in _CSV_EXTENSIONS:
+        raise ValueError(f"CSV snapshots support compression {[c for c in _CSV_EXTENSIONS if c]}, not {compression}")
+
+    path = snapshot_path(base_dir, sport, league, season_option, table, fmt, compression, partitioned)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    if fmt == PARQUET:
+        _require_pyarrow()
+        df.to_parquet(path, index=False, engine="pyarrow", compression=compression or "snappy")
+    else:
+        df.to_csv(path, index=False, compression=compression)
+    return path
+
+
+def find_snapshot(base_dir: Path, sport: str, league: str, season_option: str, table: str) -> Optional[Path]:
+    """Locate a snapshot file for one table in any supported format and layout"""
+    for partitioned in (True, False):
+        for fmt, compression in ((PARQUET, None), (CSV, None), (CSV, "gzip")):
+            path = snapshot_path(base_dir, sport, league, season_option, table, fmt, compression, partitioned)
+            if path.exists():
+                return path
+    return None
+
+
+def read_snapshot(base_dir: Path, sport: str, league: str, season_option: str, table: str) -> Optional[pd.DataFrame]:
+    """Read one table back, or None if it was never written (e.g. standings outside the regular season)"""
+    path = find_snapshot(base_dir, sport, league, season_option, table)
+    if path is None:
+        return None
+    if path.suffix == ".parquet":
+        _require_pyarrow()
+        return pd.read_parquet(path, engine="pyarrow")
+    return pd.read_csv(path)
+
+
+_FLAT_NAME = re.compile(r"^(?P<sport>.+)_(?P<league>[mw])_(?P<season>[a-z]+)_(?P<table>[a-z]+)\.(?:csv|parquet)")
+_PARTITION = re.compile(r"sport=(?P<sport>[^/]+)/league=(?P<league>[^/]+)/season=(?P<season>[^/]+)/table=")
+
+
+def discover_snapshots(base_dir: Path) -> list[tuple[str, str, str]]:
+    """Every (sport, league, season_option) combination with at least one snapshot file, sorted"""
+    combinations = set()
+    for path in base_dir.rglob("*"):
+        if not path.is_file():
+            continue
+        relative = path.relative_to(base_dir).as_posix()
+        match = _PARTITION.match(relative) or _FLAT_NAME.match(relative)
+        if match:
+            combinations.add((match["sport"], match["league"], match["season"]))
+    return sorted(combinations)
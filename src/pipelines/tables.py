@@ -0,0 +1,60 @@
+"""Declarative description of the tables a pipeline writes, so one save engine serves every sport"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import Table
+from sqlalchemy.orm import DeclarativeBase
+from usports.base.types import LeagueType, SeasonType
+
+from src.database.incremental import natural_key
+from src.pipelines.seasonal_logic import REGULAR
+from src.utils.constants import PLAYER_STATS, STANDINGS, TEAM_STATS
+
+LEAGUE_SCOPE = ("league",)
+SEASON_SCOPE = ("league", "season_option")
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    """One table a pipeline saves: which frame feeds it, how its slice is scoped and keyed, how it is loaded"""
+
+    # Frame key (STANDINGS, TEAM_STATS or PLAYER_STATS) of the ValidatedFrames field written here
+    frame: str
+    model: type[DeclarativeBase]
+    # Columns identifying a row in incremental upserts (must be a unique constraint); None finds the table's own
+    natural_key: Optional[tuple[str, ...]] = None
+    # Columns selecting the slice one load replaces, filled from the job's league/season_option
+    scope: tuple[str, ...] = SEASON_SCOPE
+    # Saved only for regular season loads (the slice is the whole season, e.g. standings)
+    regular_season_only: bool = False
+    # Large table written with the pipeline's player_load_mode (COPY on PostgreSQL)
+    bulk: bool = False
+    # Small table reloaded with the pipeline's standings_load_mode (shadow table swap on PostgreSQL)
+    swap: bool = False
+
+    @property
+    def table(self) -> Table:
+        return self.model.__table__  # type: ignore[return-value]
+
+    @property
+    def key_columns(self) -> Optional[list[str]]:
+        return list(self.natural_key) if self.natural_key is not None else natural_key(self.table)
+
+    def applies_to(self, season_option: SeasonType) -> bool:
+        return not self.regular_season_only or season_option == REGULAR
+
+    def scope_for(self, league: LeagueType, season_option: SeasonType) -> dict[str, str]:
+        values = {"league": league, "season_option": season_option}
+        return {column: values[column] for column in self.scope}
+
+
+def stats_tables(
+    standings: type[DeclarativeBase], team_stats: type[DeclarativeBase], player_stats: type[DeclarativeBase]
+) -> tuple[TableSpec, ...]:
+    """The standings / team stats / player stats layout every USports and CCAA sport uses"""
+    return (
+        TableSpec(STANDINGS, standings, scope=LEAGUE_SCOPE, regular_season_only=True, swap=True),
+        TableSpec(TEAM_STATS, team_stats),
+        TableSpec(PLAYER_STATS, player_stats, bulk=True),
+    )
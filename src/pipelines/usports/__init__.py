@@ -1,7 +1,75 @@
-from .basketball import BasketballPipeline
-from .football import FootballPipeline
-from .ice_hockey import IceHockeyPipeline
-from .soccer import SoccerPipeline
-from .volleyball import VolleyballPipeline
+"""USports pipelines, registered by spec and each imported (with its usports module and models) on first use"""
+
+from typing import TYPE_CHECKING, Any
+
+from src.pipelines.registry import PipelineSpec
+from src.utils.constants import (
+    BASKETBALL,
+    FOOTBALL,
+    ICE_HOCKEY,
+    PLAYER_STATS,
+    SOCCER,
+    STANDINGS,
+    TEAM_STATS,
+    VOLLEYBALL,
+)
+
+if TYPE_CHECKING:
+    from .basketball import BasketballPipeline
+    from .football import FootballPipeline
+    from .ice_hockey import IceHockeyPipeline
+    from .soccer import SoccerPipeline
+    from .volleyball import VolleyballPipeline
+
+
+def _rows(teams: tuple[int, int], players: tuple[int, int]) -> dict[str, tuple[int, int]]:
+    return {STANDINGS: teams, TEAM_STATS: teams, PLAYER_STATS: players}
+
+
+PIPELINES = (
+    PipelineSpec(
+        BASKETBALL,
+        "src.pipelines.usports.basketball:BasketballPipeline",
+        expected_rows=_rows((10, 60), (50, 1000)),
+    ),
+    PipelineSpec(
+        FOOTBALL,
+        "src.pipelines.usports.football:FootballPipeline",
+        leagues=("m",),
+        expected_rows=_rows((10, 30), (100, 2500)),
+        # Widest player table, with passing, rushing, receiving and defensive columns
+        cost=1.5,
+    ),
+    PipelineSpec(
+        ICE_HOCKEY,
+        "src.pipelines.usports.ice_hockey:IceHockeyPipeline",
+        expected_rows=_rows((10, 40), (50, 1200)),
+    ),
+    PipelineSpec(
+        VOLLEYBALL,
+        "src.pipelines.usports.volleyball:VolleyballPipeline",
+        expected_rows=_rows((10, 50), (50, 800)),
+    ),
+    PipelineSpec(
+        SOCCER,
+        "src.pipelines.usports.soccer:SoccerPipeline",
+        expected_rows=_rows((10, 60), (100, 1800)),
+    ),
+)
+
+# Pipeline class name -> its spec, for lazy attribute access
+_TARGETS = {spec.target.partition(":")[2]: spec for spec in PIPELINES}
 
 __all__ = ["BasketballPipeline", "FootballPipeline", "IceHockeyPipeline", "VolleyballPipeline", "SoccerPipeline"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _TARGETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    pipeline_class = _TARGETS[name].load()
+    globals()[name] = pipeline_class
+    return pipeline_class
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_TARGETS])
@@ -1,18 +1,72 @@
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 import logfire
 from pandas import DataFrame
-from sqlalchemy.orm import Session
+from sqlalchemy import Table
+from sqlalchemy.orm import DeclarativeBase, Session
 from usports.base.types import LeagueType, SeasonType
 
+from src.config.settings import PLAYER_LOAD_MODE, STANDINGS_LOAD_MODE, WRITE_MODE
+from src.database.bulk import LoadResult, replace_rows
+from src.database.copy_loader import copy_replace_rows, supports_copy
+from src.database.db import Base
+from src.database.dtypes import normalize_dtypes
+from src.database.incremental import incremental_upsert
+from src.database.swap import supports_swap, swap_replace_rows
+from src.pipelines.cache import frame_cache
+from src.pipelines.fingerprint import fingerprints_unchanged, frame_fingerprints, store_fingerprints
+from src.pipelines.metrics import FETCH, SAVE, VALIDATE, metrics
+from src.pipelines.resilience import upstream
+from src.pipelines.seasonal_logic import REGULAR
+from src.pipelines.tables import TableSpec
+from src.pipelines.validation import PreparedFrames, ValidatedFrames, mark_validated, validation_cache
+from src.utils.constants import COPY_BINARY, INCREMENTAL, INSERT, PLAYER_STATS, STANDINGS, SWAP, TEAM_STATS
 from src.utils.logger import log
+from src.utils.schools import USPORTS_SCHOOLS, SchoolIndex
+
+FetchCall = Callable[[], DataFrame]
+
+# Frame key -> column holding the school name
+SCHOOL_COLUMNS = {STANDINGS: "team_name", TEAM_STATS: "team_name", PLAYER_STATS: "school"}
+
+# Table name suffix -> frame key, so save metrics line up with fetch metrics
+_TABLE_KEYS = {"standings": STANDINGS, "team_stats": TEAM_STATS, "player_stats": PLAYER_STATS}
+
+
+def _timed_call(call: FetchCall) -> tuple[DataFrame, float]:
+    start = time.perf_counter()
+    df = frame_cache.fetch(call, upstream)
+    return df, time.perf_counter() - start
 
 
 class BaseSportPipeline(ABC):
     """Base class for all sport pipelines"""
 
+    # How player stats tables are written: "insert", "copy" or "copy_binary"
+    player_load_mode: str = PLAYER_LOAD_MODE
+    # How standings tables are reloaded: "insert" or "swap"
+    standings_load_mode: str = STANDINGS_LOAD_MODE
+    # "replace" rewrites each slice, "incremental" writes only inserted/updated/deleted rows
+    write_mode: str = WRITE_MODE
+    # Skip validation and writes when every fetched frame matches the last loaded fingerprint
+    skip_unchanged: bool = True
+    # Leagues the sport is played in
+    leagues: tuple[LeagueType, ...] = ("m", "w")
+    # Table -> (min, max) rows of a regular season slice, set from the registry spec; outliers are logged
+    expected_rows: Mapping[str, tuple[int, int]] = MappingProxyType({})
+    # Canonical names and aliases of the schools this pipeline's frames may contain
+    school_index: SchoolIndex = USPORTS_SCHOOLS
+    # Tables save_to_database writes, in order (see src/pipelines/tables.py)
+    tables: tuple[TableSpec, ...] = ()
+
     def __init__(self, sport_name: str):
         self.sport_name = sport_name
+        # Seconds spent fetching each table, keyed by (league, season_option)
+        self.fetch_timings: dict[tuple[LeagueType, SeasonType], dict[str, float]] = {}
 
     @abstractmethod
     def fetch_data(self, league: LeagueType, season_option: SeasonType):
@@ -24,62 +78,303 @@ class BaseSportPipeline(ABC):
         """Validate fetched data"""
         pass
 
-    @abstractmethod
     def save_to_database(
         self,
         session: Session,
-        standings_df: DataFrame,
+        frames: ValidatedFrames,
+        league: LeagueType,
+        season_option: SeasonType,
+    ):
+        """Save validated data to every table in `tables`; never validates again"""
+        dfs = {STANDINGS: frames.standings, TEAM_STATS: frames.team_stats, PLAYER_STATS: frames.player_stats}
+        # Swapped tables last: their rename locks readers out until commit, so keep that window short
+        for spec in sorted(self.tables, key=lambda spec: spec.swap):
+            df = dfs[spec.frame]
+            if df is None or df.empty or not spec.applies_to(season_option):
+                continue
+            scope = spec.scope_for(league, season_option)
+            with logfire.span(
+                "save_{table} for {scope} with {records} records", table=spec.frame, scope=scope, records=len(df)
+            ):
+                self.save_table(
+                    session,
+                    spec.model,
+                    df,
+                    load_mode=self.load_mode_for(spec),
+                    key=spec.key_columns,
+                    **scope,
+                )
+
+    def load_mode_for(self, spec: TableSpec) -> str:
+        if spec.bulk:
+            return self.player_load_mode
+        return self.standings_load_mode if spec.swap else INSERT
+
+    def normalize_schools(
+        self, standings_df: Optional[DataFrame], team_stats_df: DataFrame, player_stats_df: DataFrame
+    ) -> tuple[Optional[DataFrame], DataFrame, DataFrame]:
+        """Replace school aliases with canonical names, one vectorized pass per frame"""
+        normalized = []
+        for key, df in ((STANDINGS, standings_df), (TEAM_STATS, team_stats_df), (PLAYER_STATS, player_stats_df)):
+            column = SCHOOL_COLUMNS[key]
+            if df is not None and column in df.columns:
+                df = df.assign(**{column: self.school_index.normalize(df[column])})
+            normalized.append(df)
+        return tuple(normalized)  # type: ignore[return-value]
+
+    def written_tables(self) -> list[str]:
+        """Tables a load of this pipeline writes to (table_fingerprints rows are per slice and not included)"""
+        if self.tables:
+            return sorted(spec.table.name for spec in self.tables)
+        prefix = f"{self.sport_name}_"
+        return sorted(name for name in Base.metadata.tables if name.startswith(prefix))
+
+    def fetch_tables(
+        self,
+        league: LeagueType,
+        season_option: SeasonType,
+        standings: Optional[FetchCall],
+        teams: FetchCall,
+        players: FetchCall,
+    ) -> tuple[Optional[DataFrame], DataFrame, DataFrame]:
+        """Fetch standings, team and player tables concurrently.
+
+        Each argument is a zero-argument callable (usually a functools.partial
+        over a usports function, which also serves as its cache key). Pass
+        standings=None to skip standings.
+        """
+        calls = {STANDINGS: standings, TEAM_STATS: teams, PLAYER_STATS: players}
+        calls = {table: call for table, call in calls.items() if call is not None}
+
+        with ThreadPoolExecutor(max_workers=len(calls), thread_name_prefix=f"{self.sport_name}-fetch") as executor:
+            futures = {table: executor.submit(_timed_call, call) for table, call in calls.items()}
+            results = {table: future.result() for table, future in futures.items()}
+
+        for table, (df, seconds) in results.items():
+            metrics.record(
+                self.sport_name,
+                league,
+                season_option,
+                FETCH,
+                table,
+                seconds=seconds,
+                rows=len(df),
+                nbytes=int(df.memory_usage(deep=True).sum()),
+            )
+
+        timings = {table: round(seconds, 3) for table, (_, seconds) in results.items()}
+        self.fetch_timings[(league, season_option)] = timings
+        log.debug(f"⏱️  {self.sport_name} {league} {season_option} fetch timings: {timings}")
+        logfire.info("Fetch timings", sport=self.sport_name, league=league, season=season_option, **timings)
+
+        standings_df = results[STANDINGS][0] if STANDINGS in results else None
+        return standings_df, results[TEAM_STATS][0], results[PLAYER_STATS][0]
+
+    def fetch(self, league: LeagueType, season_option: SeasonType):
+        """Fetch stage: network only, safe to run concurrently across combinations"""
+        with logfire.span(
+            "fetch_data for {sport} {league} {season}",
+            sport=self.sport_name,
+            league=league,
+            season=season_option,
+        ):
+            standings_df, team_stats_df, player_stats_df = self.fetch_data(league, season_option)  # type: ignore
+            logfire.info(
+                "Data fetched",
+                teams=len(team_stats_df),
+                players=len(player_stats_df),
+                standings=len(standings_df) if standings_df is not None else 0,
+            )
+
+        return standings_df, team_stats_df, player_stats_df
+
+    def prepare(
+        self,
+        league: LeagueType,
+        season_option: SeasonType,
+        standings_df: Optional[DataFrame],
         team_stats_df: DataFrame,
         player_stats_df: DataFrame,
+    ) -> PreparedFrames:
+        """Normalize stage: canonical school names and content fingerprints, CPU only"""
+        log.info(f"\n🔄 Loading {self.sport_name} {league} {season_option} pipeline...")
+
+        # Canonical school names first, so an upstream alias neither fails validation nor looks like new data
+        standings_df, team_stats_df, player_stats_df = self.normalize_schools(
+            standings_df, team_stats_df, player_stats_df
+        )
+        frames = {STANDINGS: standings_df, TEAM_STATS: team_stats_df, PLAYER_STATS: player_stats_df}
+        self.check_row_counts(league, season_option, frames)
+        return PreparedFrames(standings_df, team_stats_df, player_stats_df, frame_fingerprints(frames))
+
+    def check_row_counts(self, league: LeagueType, season_option: SeasonType, frames: dict[str, Optional[DataFrame]]):
+        """Warn about tables far outside their expected size (playoff slices are only checked against the maximum)"""
+        for table, (low, high) in self.expected_rows.items():
+            df = frames.get(table)
+            if df is None:
+                continue
+            if len(df) > high or (season_option == REGULAR and len(df) < low):
+                log.warning(
+                    f"⚠️  {self.sport_name} {league} {season_option} {table}: {len(df)} rows, expected {low}-{high}"
+                )
+                logfire.warn(
+                    "Unexpected row count",
+                    sport=self.sport_name,
+                    league=league,
+                    season=season_option,
+                    table=table,
+                    rows=len(df),
+                )
+
+    def unchanged(
+        self, session: Session, league: LeagueType, season_option: SeasonType, prepared: PreparedFrames
+    ) -> bool:
+        """Whether the slice is identical to the last load and can skip validation and writes"""
+        if not self.skip_unchanged or not fingerprints_unchanged(
+            session, self.sport_name, league, season_option, prepared.fingerprints
+        ):
+            return False
+
+        log.info(f"⏭️  {self.sport_name} {league} {season_option} unchanged since last load, skipped\n")
+        logfire.info(f"{self.sport_name} pipeline skipped", league=league, season=season_option)
+        return True
+
+    def write(self, session: Session, league: LeagueType, season_option: SeasonType, validated: ValidatedFrames):
+        """Save stage: data and fingerprints are staged in `session`; the caller commits"""
+        with logfire.span(
+            "save_to_database for {sport} {league} {season}",
+            sport=self.sport_name,
+            league=league,
+            season=season_option,
+        ):
+            # Staged in the session so they commit with the data
+            store_fingerprints(session, self.sport_name, league, season_option, validated.fingerprints)
+            self.save_to_database(session, validated, league, season_option)
+
+        log.info(f"✅ {self.sport_name} {league} {season_option} pipeline completed successfully\n")
+        logfire.info(f"{self.sport_name} pipeline completed", league=league, season=season_option)
+
+    def load(
+        self,
+        session: Session,
         league: LeagueType,
         season_option: SeasonType,
+        standings_df: Optional[DataFrame],
+        team_stats_df: DataFrame,
+        player_stats_df: DataFrame,
     ):
-        """Save validated data to database"""
-        pass
+        """Normalize, validate and save already fetched data in one go.
 
-    def run_pipeline(self, session: Session, league: LeagueType, season_option: SeasonType):
-        """Complete pipeline execution"""
+        Writes are staged in `session` and never committed here; the caller owns
+        the transaction (see `src.database.db.transaction`).
+        """
         with logfire.span(f"{self.sport_name} pipeline"):
             try:
-                log.info(f"\n🔄 Running {self.sport_name} {league} {season_option} pipeline...")
+                prepared = self.prepare(league, season_option, standings_df, team_stats_df, player_stats_df)
 
-                # 1. Fetch data
-                with logfire.span(
-                    "fetch_data for {sport} {league} {season}",
-                    sport=self.sport_name,
-                    league=league,
-                    season=season_option,
-                ):
-                    standings_df, team_stats_df, player_stats_df = self.fetch_data(league, season_option)  # type: ignore
-                    logfire.info(
-                        "Data fetched",
-                        teams=len(team_stats_df),
-                        players=len(player_stats_df),
-                        standings=len(standings_df) if standings_df is not None else 0,
-                    )
-
-                # 2. Validate data
-                with logfire.span(
-                    "validate_data for {sport} {league} {season}",
-                    sport=self.sport_name,
-                    league=league,
-                    season=season_option,
-                ):
-                    self.validate_data(standings_df, team_stats_df, player_stats_df)
+                # 0. Short-circuit slices identical to the last load
+                if self.unchanged(session, league, season_option, prepared):
+                    return
 
-                # 3. Save to database
-                with logfire.span(
-                    "save_to_database for {sport} {league} {season}",
-                    sport=self.sport_name,
-                    league=league,
-                    season=season_option,
-                ):
-                    self.save_to_database(session, standings_df, team_stats_df, player_stats_df, league, season_option)
+                # 1. Validate data (exactly once per content; the result is the save's input)
+                validated = self.validate(league, season_option, prepared)
 
-                log.info(f"✅ {self.sport_name} {league} {season_option} pipeline completed successfully\n")
-                logfire.info(f"{self.sport_name} pipeline completed", league=league, season=season_option)
+                # 2. Save to database
+                self.write(session, league, season_option, validated)
 
             except Exception as e:
-                log.error(f"❌ {self.sport_name} {league} {season_option} pipeline failed: {str(e)[:500]}...\n")
-                logfire.error(f"{self.sport_name} pipeline failed", league=league, season=season_option, error=str(e))
+                self.log_failure(league, season_option, e)
                 raise
+
+    def log_failure(self, league: LeagueType, season_option: SeasonType, error: BaseException):
+        log.error(f"❌ {self.sport_name} {league} {season_option} pipeline failed: {str(error)[:500]}...\n")
+        logfire.error(f"{self.sport_name} pipeline failed", league=league, season=season_option, error=str(error))
+
+    def validate(self, league: LeagueType, season_option: SeasonType, prepared: PreparedFrames) -> ValidatedFrames:
+        """Run validate_data unless this exact content already passed during the run"""
+        standings_df, team_stats_df, player_stats_df, fingerprints = prepared
+        if validation_cache.passed(self.sport_name, fingerprints):
+            log.debug(f"{self.sport_name} {league} {season_option} content already validated")
+        else:
+            with logfire.span(
+                "validate_data for {sport} {league} {season}",
+                sport=self.sport_name,
+                league=league,
+                season=season_option,
+            ):
+                start = time.perf_counter()
+                self.validate_data(standings_df, team_stats_df, player_stats_df)
+                metrics.record(
+                    self.sport_name,
+                    league,
+                    season_option,
+                    VALIDATE,
+                    seconds=time.perf_counter() - start,
+                    rows=sum(rows for _, rows in fingerprints.values()),
+                )
+            validation_cache.add(self.sport_name, fingerprints)
+
+        return mark_validated(prepared)
+
+    def save_table(
+        self,
+        session: Session,
+        model: type[DeclarativeBase],
+        df: DataFrame,
+        load_mode: str = INSERT,
+        key: Optional[list[str]] = None,
+        **scope,
+    ) -> LoadResult:
+        """Replace the league/season slice of a model's table with the rows in df.
+
+        `scope` (league and optionally season_option) selects the slice and is
+        attached to every written row, so df needs no metadata columns. In
+        incremental write mode only the differences are written, matched on
+        `key` (default: the table's unique constraint); otherwise swap and
+        COPY load modes fall back to the insert path on non-PostgreSQL engines.
+        """
+        table: Table = model.__table__  # type: ignore[assignment]
+        # Tightest dtypes the columns allow: less memory and faster serialization in every loader
+        df = normalize_dtypes(df, table)
+        start = time.perf_counter()
+        if self.write_mode == INCREMENTAL:
+            result = incremental_upsert(session, table, df, scope, key)
+        elif load_mode == SWAP and supports_swap(session):
+            result = swap_replace_rows(session, table, df, scope)
+        elif load_mode not in (INSERT, SWAP) and supports_copy(session):
+            result = copy_replace_rows(session, table, df, scope, binary=load_mode == COPY_BINARY)
+        else:
+            if load_mode != INSERT:
+                log.debug(f"{load_mode} needs PostgreSQL, using inserts for {table.name}")
+            result = replace_rows(session, table, df, scope)
+
+        seconds = time.perf_counter() - start
+
+        table_key = _TABLE_KEYS.get(table.name.removeprefix(f"{self.sport_name}_"), table.name)
+        # Standings are scoped by league only and are only saved for the regular season
+        season_option = scope.get("season_option", REGULAR)
+        metrics.record(self.sport_name, scope["league"], season_option, SAVE, table_key, seconds, len(df))
+
+        counts = f"{result.inserted} inserted, {result.updated} updated, {result.deleted} deleted"
+        log.info(f"💾 {table.name} {'/'.join(scope.values())}: {counts} in {seconds:.3f}s")
+        logfire.info(
+            "Table saved",
+            table=table.name,
+            inserted=result.inserted,
+            updated=result.updated,
+            deleted=result.deleted,
+            **scope,
+        )
+        return result
+
+    def run_pipeline(self, session: Session, league: LeagueType, season_option: SeasonType):
+        """Complete pipeline execution"""
+        try:
+            standings_df, team_stats_df, player_stats_df = self.fetch(league, season_option)
+        except Exception as e:
+            log.error(f"❌ {self.sport_name} {league} {season_option} fetch failed: {str(e)[:500]}...\n")
+            logfire.error(f"{self.sport_name} fetch failed", league=league, season=season_option, error=str(e))
+            raise
+
+        self.load(session, league, season_option, standings_df, team_stats_df, player_stats_df)
+        session.commit()
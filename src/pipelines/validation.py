@@ -0,0 +1,78 @@
+"""Proof that a sport/league/season's frames passed validation, and a run-wide cache of passed content"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import NamedTuple, Optional
+
+from pandas import DataFrame
+
+Fingerprints = dict[str, tuple[str, int]]
+
+
+class PreparedFrames(NamedTuple):
+    """Normalized frames and their fingerprints, not yet validated"""
+
+    standings: Optional[DataFrame]
+    team_stats: DataFrame
+    player_stats: DataFrame
+    fingerprints: Fingerprints
+
+
+# Handed to ValidatedFrames only by mark_validated, so nothing else can construct one
+_VALIDATED = object()
+
+
+@dataclass(frozen=True)
+class ValidatedFrames:
+    """Frames that passed `validate_data`, as handed to `save_to_database`.
+
+    Only `mark_validated` (called by `BaseSportPipeline.validate` once the
+    frames passed) can create these; constructing one directly raises
+    TypeError, so a save method taking one never needs to validate again.
+    """
+
+    standings: Optional[DataFrame]
+    team_stats: DataFrame
+    player_stats: DataFrame
+    fingerprints: Fingerprints = field(repr=False)
+    _token: object = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self._token is not _VALIDATED:
+            raise TypeError("ValidatedFrames are created by BaseSportPipeline.validate, not directly")
+
+
+def mark_validated(prepared: PreparedFrames) -> ValidatedFrames:
+    """Wrap frames that just passed validation"""
+    return ValidatedFrames(*prepared, _token=_VALIDATED)
+
+
+class ValidationCache:
+    """Content (sport + frame fingerprints) already known to pass validation.
+
+    Validation is a pure function of the frames, so identical content never
+    needs checking twice, whichever league/season or retry it arrives with.
+    """
+
+    def __init__(self):
+        self._passed: set[tuple] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(sport: str, fingerprints: Fingerprints) -> tuple:
+        return (sport, *sorted((table, fingerprint) for table, (fingerprint, _) in fingerprints.items()))
+
+    def passed(self, sport: str, fingerprints: Fingerprints) -> bool:
+        with self._lock:
+            return self.key(sport, fingerprints) in self._passed
+
+    def add(self, sport: str, fingerprints: Fingerprints):
+        with self._lock:
+            self._passed.add(self.key(sport, fingerprints))
+
+    def clear(self):
+        with self._lock:
+            self._passed.clear()
+
+
+validation_cache = ValidationCache()
@@ -6,6 +6,27 @@ ICE_HOCKEY = "ice_hockey"
 SOCCER = "soccer"
 VOLLEYBALL = "volleyball"
 
+# Table keys used for fetched frames, timings and snapshot file names
+STANDINGS = "standings"
+TEAM_STATS = "teams"
+PLAYER_STATS = "players"
+
+# Player stats load modes (see src/database/copy_loader.py)
+INSERT = "insert"
+COPY_TEXT = "copy"
+COPY_BINARY = "copy_binary"
+LOAD_MODES = (INSERT, COPY_TEXT, COPY_BINARY)
+
+# Standings load modes: row inserts, or a shadow table swapped in by rename (see src/database/swap.py)
+SWAP = "swap"
+STANDINGS_LOAD_MODES = (INSERT, SWAP)
+
+# Slice write modes (see src/database/incremental.py)
+REPLACE = "replace"
+INCREMENTAL = "incremental"
+WRITE_MODES = (REPLACE, INCREMENTAL)
+
+# Canonical school names, as stored in the stats tables
 VALID_USPORTS_SCHOOLS = [
     "Acadia",
     "Alberta",
@@ -67,3 +88,119 @@ VALID_USPORTS_SCHOOLS = [
     "Winnipeg",
     "York",
 ]
+
+# Other spellings seen upstream -> canonical name. Case, accents, punctuation and
+# spacing are normalized before lookup, so "Montréal" or "Queens" need no entry.
+USPORTS_SCHOOL_ALIASES = {
+    "TMU": "Toronto Metropolitan",
+    "Ryerson": "Toronto Metropolitan",
+    "UOIT": "Ontario Tech",
+    "St. Francis Xavier": "StFX",
+    "Royal Military College": "RMC",
+    "Wilfrid Laurier": "Laurier",
+    "Fraser Valley": "UFV",
+    "Prince Edward Island": "UPEI",
+    "New Brunswick": "UNB",
+    "Northern British Columbia": "UNBC",
+    "Memorial University": "Memorial",
+    "Bishops": "Bishop's",
+}
+
+# Canonical CCAA college names, as stored in the ccaa_* tables, grouped by conference for maintenance
+VALID_CCAA_COLLEGES = [
+    # ACAC
+    "Ambrose",
+    "Briercrest",
+    "Concordia Edmonton",
+    "Keyano",
+    "King's Edmonton",
+    "Lakeland",
+    "Lethbridge",
+    "Medicine Hat",
+    "NAIT",
+    "Northwestern Polytechnic",
+    "Olds",
+    "Portage",
+    "Red Deer Polytechnic",
+    "SAIT",
+    "Saskatchewan Polytechnic",
+    # PACWEST
+    "Camosun",
+    "Capilano",
+    "College of the Rockies",
+    "Columbia Bible",
+    "Douglas",
+    "Langara",
+    "Okanagan College",
+    "VIU",
+    # MCAC
+    "Assiniboine",
+    "Canadian Mennonite",
+    "Providence",
+    "Red River",
+    "Saint-Boniface",
+    # OCAA
+    "Algonquin",
+    "Boreal",
+    "Cambrian",
+    "Canadore",
+    "Centennial",
+    "Conestoga",
+    "Durham",
+    "Fanshawe",
+    "Fleming",
+    "George Brown",
+    "Georgian",
+    "Humber",
+    "La Cite",
+    "Lambton",
+    "Loyalist",
+    "Mohawk",
+    "Niagara",
+    "Redeemer",
+    "Sault",
+    "Seneca",
+    "Sheridan",
+    "St. Clair",
+    "St. Lawrence",
+    # RSEQ
+    "Ahuntsic",
+    "Champlain St. Lawrence",
+    "Dawson",
+    "Edouard-Montpetit",
+    "Francois-Xavier-Garneau",
+    "John Abbott",
+    "Limoilou",
+    "Montmorency",
+    "Sainte-Foy",
+    "Vanier",
+    # ACAA
+    "Crandall",
+    "Holland",
+    "Mount Saint Vincent",
+    "NSCC",
+    "Sainte-Anne",
+    "UNB Saint John",
+]
+
+# Other spellings seen upstream -> canonical college name (normalized like USPORTS_SCHOOL_ALIASES)
+CCAA_COLLEGE_ALIASES = {
+    "Concordia University of Edmonton": "Concordia Edmonton",
+    "The King's University": "King's Edmonton",
+    "Grande Prairie Regional College": "Northwestern Polytechnic",
+    "GPRC": "Northwestern Polytechnic",
+    "Red Deer College": "Red Deer Polytechnic",
+    "Sask Polytech": "Saskatchewan Polytechnic",
+    "Vancouver Island University": "VIU",
+    "Red River College Polytechnic": "Red River",
+    "RRC Polytech": "Red River",
+    "Universite de Saint-Boniface": "Saint-Boniface",
+    "College Boreal": "Boreal",
+    "College La Cite": "La Cite",
+    "Redeemer University": "Redeemer",
+    "Nova Scotia Community College": "NSCC",
+    "MSVU": "Mount Saint Vincent",
+    "UNBSJ": "UNB Saint John",
+    "Holland College": "Holland",
+    "Cegep Garneau": "Francois-Xavier-Garneau",
+}
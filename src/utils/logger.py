@@ -1,4 +1,5 @@
 import logging
+import threading
 
 from src.config.settings import LOG_LEVEL
 
@@ -21,3 +22,18 @@ for module in logger_blocklist:
     logging.getLogger(module).setLevel(logging.WARNING)
 
 log = logging.getLogger("pipeline")
+
+_logfire_lock = threading.Lock()
+_logfire_configured = False
+
+
+def configure_logfire():
+    """Configure Logfire once per process; entry points call this, importing modules never does"""
+    global _logfire_configured
+    with _logfire_lock:
+        if _logfire_configured:
+            return
+        import logfire
+
+        logfire.configure(environment="pipeline", service_name="pipeline")
+        _logfire_configured = True
@@ -0,0 +1,70 @@
+"""Frozen school-name index: alias normalization and vectorized membership checks"""
+
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from src.utils.constants import (
+    CCAA_COLLEGE_ALIASES,
+    USPORTS_SCHOOL_ALIASES,
+    VALID_CCAA_COLLEGES,
+    VALID_USPORTS_SCHOOLS,
+)
+
+
+def _match_keys(names: pd.Series) -> pd.Series:
+    """Case, accent, punctuation and whitespace insensitive lookup keys, computed column-wise"""
+    return (
+        names.astype("string")
+        .str.normalize("NFKD")
+        .str.encode("ascii", errors="ignore")
+        .str.decode("ascii")
+        .str.casefold()
+        .str.replace(r"[^\w\s]", "", regex=True)
+        .str.split()
+        .str.join(" ")
+    )
+
+
+class SchoolIndex:
+    """Canonical school names and every accepted alias.
+
+    Built once at import; lookups are hash-map and categorical operations over
+    whole columns, never a scan of the name list per row.
+    """
+
+    def __init__(self, canonical: list[str], aliases: dict[str, str], label: str = "school"):
+        unknown = set(aliases.values()) - set(canonical)
+        if unknown:
+            raise ValueError(f"Aliases point at unknown schools: {unknown}")
+
+        # What a name is called in validation messages, e.g. "U SPORTS school"
+        self.label = label
+        self.names: tuple[str, ...] = tuple(canonical)
+        self.dtype = pd.CategoricalDtype(categories=self.names)
+        spellings = pd.Series([*canonical, *aliases], dtype="string")
+        targets = [*canonical, *aliases.values()]
+        self._lookup = MappingProxyType(dict(zip(_match_keys(spellings), targets)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def normalize(self, names: pd.Series) -> pd.Series:
+        """Map every alias/spelling to its canonical name; unknown names are returned unchanged"""
+        if names.empty:
+            return names
+        canonical = _match_keys(names).map(self._lookup)
+        return canonical.where(canonical.notna(), names).astype(object)
+
+    def categorical(self, names: pd.Series) -> pd.Series:
+        """Canonical names as a categorical over every known school (unknowns become NaN)"""
+        return self.normalize(names).astype(self.dtype)
+
+    def is_known(self, names: pd.Series) -> np.ndarray:
+        """Boolean mask of names that resolve to a known school"""
+        return self.categorical(names).cat.codes.to_numpy() >= 0
+
+
+USPORTS_SCHOOLS = SchoolIndex(VALID_USPORTS_SCHOOLS, USPORTS_SCHOOL_ALIASES, label="U SPORTS school")
+CCAA_COLLEGES = SchoolIndex(VALID_CCAA_COLLEGES, CCAA_COLLEGE_ALIASES, label="CCAA college")
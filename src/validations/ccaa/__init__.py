@@ -0,0 +1,23 @@
+"""CCAA validation: each sport's USports rules, checked against the CCAA college index"""
+
+from functools import lru_cache
+from importlib import import_module
+from typing import Optional
+
+import pandas as pd
+
+from src.utils.schools import CCAA_COLLEGES
+from src.validations.schema import SportSchema
+
+
+@lru_cache(maxsize=None)
+def ccaa_schema(sport: str) -> SportSchema:
+    """The USports schema of `sport` (e.g. "basketball"), renamed and rebound to CCAA colleges"""
+    usports_schema = getattr(import_module(f"src.validations.usports.{sport}"), f"{sport.upper()}_SCHEMA")
+    return usports_schema.for_organization("CCAA", CCAA_COLLEGES)
+
+
+def validate_ccaa_data(
+    sport: str, standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
+):
+    ccaa_schema(sport).validate(standings_df, team_stats_df, player_stats_df)
@@ -0,0 +1,217 @@
+"""Declarative frame schemas compiled once per sport and checked with vectorized masks"""
+
+from dataclasses import dataclass, field, replace
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Integer, Numeric
+from sqlalchemy.orm import DeclarativeBase
+
+from src.utils.logger import log
+from src.utils.schools import USPORTS_SCHOOLS, SchoolIndex
+
+# Columns set by the loader from the slice scope, never present in fetched frames
+SCOPE_COLUMNS = frozenset({"id", "league", "season_option"})
+PERCENTAGE_RANGE = (0.0, 100.0)
+# Integer stats that can legitimately go below zero (net yardage, lost-yardage longest plays, +/-)
+SIGNED_MARKERS = ("plus_minus", "margin", "differential", "yards", "longest")
+MAX_EXAMPLES = 5
+
+
+@dataclass(frozen=True)
+class Violation:
+    """One rule broken by one or more rows of a frame column"""
+
+    frame: str
+    column: str
+    rule: str
+    rows: int
+    examples: tuple = ()
+
+    def __str__(self) -> str:
+        examples = f", e.g. {list(self.examples)}" if self.examples else ""
+        return f"{self.frame}.{self.column}: {self.rule} ({self.rows} rows{examples})"
+
+
+class SchemaValidationError(ValueError):
+    """Every violation found in a sport/league/season's frames"""
+
+    def __init__(self, violations: list[Violation]):
+        self.violations = violations
+        details = "\n".join(f"  - {violation}" for violation in violations)
+        super().__init__(f"{len(violations)} validation errors:\n{details}")
+
+
+def _examples(values: pd.Series) -> tuple:
+    return tuple(values.drop_duplicates().head(MAX_EXAMPLES).tolist())
+
+
+@dataclass(frozen=True)
+class FrameSchema:
+    """Rules for one fetched table, derived from its expected columns and ORM model"""
+
+    name: str
+    columns: tuple[str, ...]
+    numeric: tuple[str, ...] = ()
+    required: tuple[str, ...] = ()
+    # column -> inclusive (low, high); either bound may be -inf/inf
+    ranges: dict[str, tuple[float, float]] = field(default_factory=dict)
+    allowed: dict[str, frozenset] = field(default_factory=dict)
+    school_column: Optional[str] = None
+    school_index: SchoolIndex = field(default=USPORTS_SCHOOLS, compare=False)
+
+    @classmethod
+    def from_model(
+        cls,
+        name: str,
+        model: type[DeclarativeBase],
+        expected_columns: list[str],
+        school_column: Optional[str] = None,
+        allowed: Optional[dict[str, set]] = None,
+        ranges: Optional[dict[str, tuple[float, float]]] = None,
+    ) -> "FrameSchema":
+        """Numeric and non-null rules come from the model; `ranges` overrides the derived bounds"""
+        columns = tuple(dict.fromkeys(expected_columns))
+        table_columns = model.__table__.c  # type: ignore[attr-defined]
+        modelled = [table_columns[c] for c in columns if c in table_columns and c not in SCOPE_COLUMNS]
+
+        numeric = tuple(c.name for c in modelled if isinstance(c.type, (Integer, Numeric)))
+        derived_ranges = {}
+        for column in modelled:
+            if column.name not in numeric:
+                continue
+            if "percentage" in column.name:
+                derived_ranges[column.name] = PERCENTAGE_RANGE
+            elif isinstance(column.type, Integer) and not any(marker in column.name for marker in SIGNED_MARKERS):
+                derived_ranges[column.name] = (0.0, np.inf)
+        derived_ranges.update(ranges or {})
+
+        return cls(
+            name=name,
+            columns=columns,
+            numeric=numeric,
+            required=tuple(c.name for c in modelled if not c.nullable),
+            ranges=derived_ranges,
+            allowed={column: frozenset(values) for column, values in (allowed or {}).items()},
+            school_column=school_column,
+        )
+
+    def check(self, df: pd.DataFrame) -> list[Violation]:
+        """Every violation in df; each rule is one vectorized pass over the frame"""
+        violations = []
+        present = set(df.columns)
+
+        missing = [c for c in self.columns if c not in present]
+        if missing:
+            violations.append(Violation(self.name, ",".join(missing), "missing column", len(df)))
+        extra = present - set(self.columns)
+        if extra:
+            log.warning(f"{self.name} has extra columns: {extra}")
+
+        required = [c for c in self.required if c in present]
+        if required:
+            null_counts = df[required].isna().to_numpy().sum(axis=0)
+            for column, count in zip(required, null_counts):
+                if count:
+                    violations.append(Violation(self.name, column, "null in non-nullable column", int(count)))
+
+        numeric_columns = [c for c in self.numeric if c in present]
+        if numeric_columns:
+            raw = df[numeric_columns]
+            values = raw.apply(pd.to_numeric, errors="coerce")
+            not_numeric = (values.isna() & raw.notna()).to_numpy()
+            for i in np.flatnonzero(not_numeric.any(axis=0)):
+                column = numeric_columns[i]
+                bad = raw[column][not_numeric[:, i]]
+                violations.append(Violation(self.name, column, "not numeric", len(bad), _examples(bad)))
+
+            range_columns = [c for c in numeric_columns if c in self.ranges]
+            if range_columns:
+                array = values[range_columns].to_numpy(dtype=float, na_value=np.nan)
+                low = np.array([self.ranges[c][0] for c in range_columns])
+                high = np.array([self.ranges[c][1] for c in range_columns])
+                # NaN compares False on both sides, so nulls are left to the nullability rule
+                out_of_range = (array < low) | (array > high)
+                for i in np.flatnonzero(out_of_range.any(axis=0)):
+                    column = range_columns[i]
+                    low_i, high_i = self.ranges[column]
+                    bad = values[column][out_of_range[:, i]]
+                    rule = f"outside [{low_i:g}, {high_i:g}]"
+                    violations.append(Violation(self.name, column, rule, len(bad), _examples(bad)))
+
+        for column, values_allowed in self.allowed.items():
+            if column in present:
+                bad = df[column][~df[column].isin(values_allowed)]
+                if not bad.empty:
+                    rule = f"not one of {sorted(values_allowed)}"
+                    violations.append(Violation(self.name, column, rule, len(bad), _examples(bad)))
+
+        if self.school_column in present:
+            schools = df[self.school_column]
+            bad = schools[~self.school_index.is_known(schools)]
+            if not bad.empty:
+                rule = f"unknown {self.school_index.label}"
+                violations.append(Violation(self.name, self.school_column, rule, len(bad), _examples(bad)))
+
+        return violations
+
+
+@dataclass(frozen=True)
+class SportSchema:
+    """Schemas for a sport's standings, team stats and player stats, plus cross-frame references"""
+
+    standings: FrameSchema
+    team_stats: FrameSchema
+    player_stats: FrameSchema
+
+    def validate(
+        self,
+        standings_df: Optional[pd.DataFrame],
+        team_stats_df: Optional[pd.DataFrame],
+        player_stats_df: Optional[pd.DataFrame],
+    ):
+        """Check every frame and raise one SchemaValidationError listing all violations"""
+        violations = []
+        for schema, df in (
+            (self.standings, standings_df),
+            (self.team_stats, team_stats_df),
+            (self.player_stats, player_stats_df),
+        ):
+            if df is None or df.empty:
+                continue
+            found = schema.check(df)
+            violations.extend(found)
+            if not found:
+                log.debug(f"✅ {schema.name} validation passed")
+
+        violations.extend(self._check_references(team_stats_df, player_stats_df))
+
+        if violations:
+            raise SchemaValidationError(violations)
+
+    def for_organization(self, prefix: str, school_index: SchoolIndex) -> "SportSchema":
+        """Same rules for another organization's copy of these tables, e.g. CCAA, checked against its own names"""
+        return SportSchema(
+            *(
+                replace(schema, name=f"{prefix} {schema.name}", school_index=school_index)
+                for schema in (self.standings, self.team_stats, self.player_stats)
+            )
+        )
+
+    def _check_references(
+        self, team_stats_df: Optional[pd.DataFrame], player_stats_df: Optional[pd.DataFrame]
+    ) -> list[Violation]:
+        """Every player's school must have a team stats row in the same slice"""
+        team_column, player_column = self.team_stats.school_column, self.player_stats.school_column
+        if team_stats_df is None or team_stats_df.empty or player_stats_df is None or player_stats_df.empty:
+            return []
+        if team_column not in team_stats_df.columns or player_column not in player_stats_df.columns:
+            return []
+
+        schools = player_stats_df[player_column]
+        bad = schools[~schools.isin(team_stats_df[team_column].unique())]
+        if bad.empty:
+            return []
+        rule = f"not in {self.team_stats.name}.{team_column}"
+        return [Violation(self.player_stats.name, player_column, rule, len(bad), _examples(bad))]
@@ -2,8 +2,8 @@ from typing import Optional
 
 import pandas as pd
 
-from src.utils.logger import log
-from src.validations.common_validations import validate_columns, validate_school_column
+from src.database.models.usports.basketball import BasketballPlayerStats, BasketballStandings, BasketballTeamStats
+from src.validations.schema import FrameSchema, SportSchema
 
 EXPECTED_BASKETBALL_STANDINGS_COLUMNS = [
     "team_name",
@@ -91,22 +91,21 @@ EXPECTED_BASKETBALL_PLAYERS_COLUMNS = [
 ]
 
 
+BASKETBALL_SCHEMA = SportSchema(
+    standings=FrameSchema.from_model(
+        "Basketball Standings", BasketballStandings, EXPECTED_BASKETBALL_STANDINGS_COLUMNS, school_column="team_name"
+    ),
+    team_stats=FrameSchema.from_model(
+        "Basketball Team Stats", BasketballTeamStats, EXPECTED_BASKETBALL_TEAM_STATS_COLUMNS, school_column="team_name"
+    ),
+    player_stats=FrameSchema.from_model(
+        "Basketball Player Stats", BasketballPlayerStats, EXPECTED_BASKETBALL_PLAYERS_COLUMNS, school_column="school"
+    ),
+)
+
+
 def validate_basketball_data(
     standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
 ):
     """Validate basketball data using expected test data columns"""
-
-    if standings_df is not None:
-        validate_columns(standings_df, EXPECTED_BASKETBALL_STANDINGS_COLUMNS, "Basketball Standings")
-        validate_school_column(standings_df, "team_name")
-        log.debug("✅ Basketball standings validation passed")
-
-    if team_stats_df is not None and not team_stats_df.empty:
-        validate_columns(team_stats_df, EXPECTED_BASKETBALL_TEAM_STATS_COLUMNS, "Basketball Team Stats")
-        validate_school_column(team_stats_df, "team_name")
-        log.debug("✅ Basketball team stats validation passed")
-
-    if player_stats_df is not None and not player_stats_df.empty:
-        validate_columns(player_stats_df, EXPECTED_BASKETBALL_PLAYERS_COLUMNS, "Basketball Player Stats")
-        validate_school_column(player_stats_df, "school")
-        log.debug("✅ Basketball player stats validation passed")
+    BASKETBALL_SCHEMA.validate(standings_df, team_stats_df, player_stats_df)
@@ -2,8 +2,8 @@ from typing import Optional
 
 import pandas as pd
 
-from src.utils.logger import log
-from src.validations.common_validations import validate_columns, validate_school_column
+from src.database.models.usports.football import FootballPlayerStats, FootballStandings, FootballTeamStats
+from src.validations.schema import FrameSchema, SportSchema
 
 EXPECTED_FOOTBALL_STANDINGS_COLUMNS = [
     "team_name",
@@ -178,24 +178,25 @@ EXPECTED_FOOTBALL_PLAYERS_COLUMNS = [
 ]
 
 
+FOOTBALL_SCHEMA = SportSchema(
+    standings=FrameSchema.from_model(
+        "Football Standings", FootballStandings, EXPECTED_FOOTBALL_STANDINGS_COLUMNS, school_column="team_name"
+    ),
+    team_stats=FrameSchema.from_model(
+        "Football Team Stats", FootballTeamStats, EXPECTED_FOOTBALL_TEAM_STATS_COLUMNS, school_column="team_name"
+    ),
+    # Football players need lastname_initials, first_name, school added
+    player_stats=FrameSchema.from_model(
+        "Football Player Stats",
+        FootballPlayerStats,
+        ["lastname_initials", "first_name", "school"] + EXPECTED_FOOTBALL_PLAYERS_COLUMNS,
+        school_column="school",
+    ),
+)
+
+
 def validate_football_data(
     standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
 ):
     """Validate football data using exact test data column expectations"""
-
-    if standings_df is not None and not standings_df.empty:
-        validate_columns(standings_df, EXPECTED_FOOTBALL_STANDINGS_COLUMNS, "Football Standings")
-        validate_school_column(standings_df, "team_name")
-        log.debug("✅ Football standings validation passed")
-
-    if team_stats_df is not None and not team_stats_df.empty:
-        validate_columns(team_stats_df, EXPECTED_FOOTBALL_TEAM_STATS_COLUMNS, "Football Team Stats")
-        validate_school_column(team_stats_df, "team_name")
-        log.debug("✅ Football team stats validation passed")
-
-    if player_stats_df is not None and not player_stats_df.empty:
-        # Note: Football players need lastname_initials, first_name, school added
-        expected_with_names = ["lastname_initials", "first_name", "school"] + EXPECTED_FOOTBALL_PLAYERS_COLUMNS
-        validate_columns(player_stats_df, expected_with_names, "Football Player Stats")
-        validate_school_column(player_stats_df, "school")
-        log.debug("✅ Football player stats validation passed")
+    FOOTBALL_SCHEMA.validate(standings_df, team_stats_df, player_stats_df)
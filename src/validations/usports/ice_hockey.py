@@ -2,8 +2,8 @@ from typing import Optional
 
 import pandas as pd
 
-from src.utils.logger import log
-from src.validations.common_validations import validate_columns, validate_school_column
+from src.database.models.usports.ice_hockey import IceHockeyPlayerStats, IceHockeyStandings, IceHockeyTeamStats
+from src.validations.schema import FrameSchema, SportSchema
 
 EXPECTED_ICE_HOCKEY_STANDINGS_COLUMNS = [
     "team_name",
@@ -72,31 +72,25 @@ EXPECTED_ICE_HOCKEY_PLAYERS_COLUMNS = [
 ]
 
 
+ICE_HOCKEY_SCHEMA = SportSchema(
+    standings=FrameSchema.from_model(
+        "Ice Hockey Standings", IceHockeyStandings, EXPECTED_ICE_HOCKEY_STANDINGS_COLUMNS, school_column="team_name"
+    ),
+    team_stats=FrameSchema.from_model(
+        "Ice Hockey Team Stats", IceHockeyTeamStats, EXPECTED_ICE_HOCKEY_TEAM_STATS_COLUMNS, school_column="team_name"
+    ),
+    player_stats=FrameSchema.from_model(
+        "Ice Hockey Player Stats",
+        IceHockeyPlayerStats,
+        EXPECTED_ICE_HOCKEY_PLAYERS_COLUMNS,
+        school_column="school",
+        allowed={"role": {"skater", "goalie"}},
+    ),
+)
+
+
 def validate_ice_hockey_data(
     standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
 ):
     """Validate ice hockey data using exact test data column expectations"""
-
-    if standings_df is not None and not standings_df.empty:
-        validate_columns(standings_df, EXPECTED_ICE_HOCKEY_STANDINGS_COLUMNS, "Ice Hockey Standings")
-        validate_school_column(standings_df, "team_name")
-        log.debug("✅ Ice hockey standings validation passed")
-
-    if team_stats_df is not None and not team_stats_df.empty:
-        validate_columns(team_stats_df, EXPECTED_ICE_HOCKEY_TEAM_STATS_COLUMNS, "Ice Hockey Team Stats")
-        validate_school_column(team_stats_df, "team_name")
-        log.debug("✅ Ice hockey team stats validation passed")
-
-    if player_stats_df is not None and not player_stats_df.empty:
-        validate_columns(player_stats_df, EXPECTED_ICE_HOCKEY_PLAYERS_COLUMNS, "Ice Hockey Player Stats")
-        validate_school_column(player_stats_df, "school")
-
-        # Ice hockey specific validation - role should be 'skater' or 'goalie'
-        if "role" in player_stats_df.columns:
-            valid_roles = {"skater", "goalie"}
-            invalid_roles = player_stats_df[~player_stats_df["role"].isin(valid_roles)]
-            if not invalid_roles.empty:
-                bad_roles = invalid_roles["role"].unique()
-                raise ValueError(f"Ice hockey players have invalid roles: {bad_roles}")
-
-        log.debug("✅ Ice hockey player stats validation passed")
+    ICE_HOCKEY_SCHEMA.validate(standings_df, team_stats_df, player_stats_df)
@@ -2,8 +2,8 @@ from typing import Optional
 
 import pandas as pd
 
-from src.utils.logger import log
-from src.validations.common_validations import validate_columns, validate_school_column
+from src.database.models.usports.soccer import SoccerPlayerStats, SoccerStandings, SoccerTeamStats
+from src.validations.schema import FrameSchema, SportSchema
 
 EXPECTED_SOCCER_STANDINGS_COLUMNS = [
     "team_name",
@@ -67,31 +67,25 @@ EXPECTED_SOCCER_PLAYERS_COLUMNS = [
 ]
 
 
+SOCCER_SCHEMA = SportSchema(
+    standings=FrameSchema.from_model(
+        "Soccer Standings", SoccerStandings, EXPECTED_SOCCER_STANDINGS_COLUMNS, school_column="team_name"
+    ),
+    team_stats=FrameSchema.from_model(
+        "Soccer Team Stats", SoccerTeamStats, EXPECTED_SOCCER_TEAM_STATS_COLUMNS, school_column="team_name"
+    ),
+    player_stats=FrameSchema.from_model(
+        "Soccer Player Stats",
+        SoccerPlayerStats,
+        EXPECTED_SOCCER_PLAYERS_COLUMNS,
+        school_column="school",
+        allowed={"position": {"goalie", "field"}},
+    ),
+)
+
+
 def validate_soccer_data(
     standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
 ):
     """Validate soccer data using exact test data column expectations"""
-
-    if standings_df is not None and not standings_df.empty:
-        validate_columns(standings_df, EXPECTED_SOCCER_STANDINGS_COLUMNS, "Soccer Standings")
-        validate_school_column(standings_df, "team_name")
-        log.debug("✅ Soccer standings validation passed")
-
-    if team_stats_df is not None and not team_stats_df.empty:
-        validate_columns(team_stats_df, EXPECTED_SOCCER_TEAM_STATS_COLUMNS, "Soccer Team Stats")
-        validate_school_column(team_stats_df, "team_name")
-        log.debug("✅ Soccer team stats validation passed")
-
-    if player_stats_df is not None and not player_stats_df.empty:
-        validate_columns(player_stats_df, EXPECTED_SOCCER_PLAYERS_COLUMNS, "Soccer Player Stats")
-        validate_school_column(player_stats_df, "school")
-
-        # Soccer specific validation - position should be 'goalie' or 'field'
-        if "position" in player_stats_df.columns:
-            valid_positions = {"goalie", "field"}
-            invalid_positions = player_stats_df[~player_stats_df["position"].isin(valid_positions)]
-            if not invalid_positions.empty:
-                bad_positions = invalid_positions["position"].unique()
-                raise ValueError(f"Soccer players have invalid positions: {bad_positions}")
-
-        log.debug("✅ Soccer player stats validation passed")
+    SOCCER_SCHEMA.validate(standings_df, team_stats_df, player_stats_df)
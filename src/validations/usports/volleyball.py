@@ -2,8 +2,9 @@ from typing import Optional
 
 import pandas as pd
 
+from src.database.models.usports.volleyball import VolleyballPlayerStats, VolleyballStandings, VolleyballTeamStats
 from src.utils.logger import log
-from src.validations.common_validations import validate_columns, validate_school_column
+from src.validations.schema import FrameSchema, SportSchema
 
 EXPECTED_VOLLEYBALL_STANDINGS_COLUMNS = [
     "team_name",
@@ -75,36 +76,39 @@ EXPECTED_VOLLEYBALL_PLAYERS_COLUMNS = [
 ]
 
 
+# (kills - errors) / attempts goes negative when a hitter errs more often than they score
+HITTING_PERCENTAGE_RANGE = {"hitting_percentage": (-100.0, 100.0)}
+
+VOLLEYBALL_SCHEMA = SportSchema(
+    standings=FrameSchema.from_model(
+        "Volleyball Standings", VolleyballStandings, EXPECTED_VOLLEYBALL_STANDINGS_COLUMNS, school_column="team_name"
+    ),
+    team_stats=FrameSchema.from_model(
+        "Volleyball Team Stats",
+        VolleyballTeamStats,
+        EXPECTED_VOLLEYBALL_TEAM_STATS_COLUMNS,
+        school_column="team_name",
+        ranges=HITTING_PERCENTAGE_RANGE,
+    ),
+    player_stats=FrameSchema.from_model(
+        "Volleyball Player Stats",
+        VolleyballPlayerStats,
+        EXPECTED_VOLLEYBALL_PLAYERS_COLUMNS,
+        school_column="school",
+        ranges=HITTING_PERCENTAGE_RANGE,
+    ),
+)
+
+
 def validate_volleyball_data(
     standings_df: Optional[pd.DataFrame], team_stats_df: pd.DataFrame, player_stats_df: pd.DataFrame
 ):
     """Validate volleyball data using exact test data column expectations"""
+    VOLLEYBALL_SCHEMA.validate(standings_df, team_stats_df, player_stats_df)
 
-    if standings_df is not None and not standings_df.empty:
-        validate_columns(standings_df, EXPECTED_VOLLEYBALL_STANDINGS_COLUMNS, "Volleyball Standings")
-        validate_school_column(standings_df, "team_name")
-        log.debug("✅ Volleyball standings validation passed")
-
-    if team_stats_df is not None and not team_stats_df.empty:
-        validate_columns(team_stats_df, EXPECTED_VOLLEYBALL_TEAM_STATS_COLUMNS, "Volleyball Team Stats")
-        validate_school_column(team_stats_df, "team_name")
-
-        # Volleyball specific validation - sets should be >= matches
-        if "matches_played" in team_stats_df.columns and "sets_played" in team_stats_df.columns:
-            invalid_data = team_stats_df[team_stats_df["sets_played"] < team_stats_df["matches_played"]]
+    # Volleyball specific sanity check - sets should be >= matches
+    for name, df in (("teams", team_stats_df), ("players", player_stats_df)):
+        if df is not None and {"matches_played", "sets_played"} <= set(df.columns):
+            invalid_data = df[df["sets_played"] < df["matches_played"]]
             if not invalid_data.empty:
-                log.warning(f"Found {len(invalid_data)} teams where sets_played < matches_played")
-
-        log.debug("✅ Volleyball team stats validation passed")
-
-    if player_stats_df is not None and not player_stats_df.empty:
-        validate_columns(player_stats_df, EXPECTED_VOLLEYBALL_PLAYERS_COLUMNS, "Volleyball Player Stats")
-        validate_school_column(player_stats_df, "school")
-
-        # Volleyball specific validation - sets should be >= matches for players too
-        if "matches_played" in player_stats_df.columns and "sets_played" in player_stats_df.columns:
-            invalid_data = player_stats_df[player_stats_df["sets_played"] < player_stats_df["matches_played"]]
-            if not invalid_data.empty:
-                log.warning(f"Found {len(invalid_data)} players where sets_played < matches_played")
-
-        log.debug("✅ Volleyball player stats validation passed")
+                log.warning(f"Found {len(invalid_data)} {name} where sets_played < matches_played")
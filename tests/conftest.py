@@ -0,0 +1,35 @@
+"""Shared fixtures: a throwaway SQLite database per test and no on-disk fetch cache"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+import src.database.models.ccaa  # noqa: F401  (registers the tables on Base)
+import src.database.models.fingerprints  # noqa: F401
+import src.database.models.usports  # noqa: F401
+from src.database.db import Base
+from src.pipelines.cache import frame_cache
+from src.pipelines.validation import validation_cache
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch):
+    """No test reads or writes .cache/, and no validation result leaks between tests"""
+    monkeypatch.setattr(frame_cache, "enabled", False)
+    validation_cache.clear()
+    yield
+    validation_cache.clear()
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'northscore.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    with Session(engine) as session:
+        yield session
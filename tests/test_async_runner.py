@@ -0,0 +1,141 @@
+"""Async runner: failures isolated per job, no hang when a writer dies; loads on PostgreSQL need TEST_POSTGRES_URL"""
+
+import asyncio
+import os
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.database.db import Base, async_url
+from src.pipelines.async_runner import AsyncPipelineAdapter, run_jobs
+from src.pipelines.registry import registry
+from src.pipelines.runner import PipelineJob
+from src.utils.constants import TEAM_STATS
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+CCAA_FIXTURES = Path(__file__).parent / "fixtures" / "ccaa"
+
+
+@pytest.fixture
+def schema_url():
+    """Connect options pointing every connection at a scratch schema with the tables created"""
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    schema = f"async_test_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(POSTGRES_URL)
+    with admin.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    options = {"options": f"-c search_path={schema}"}
+    engine = create_engine(POSTGRES_URL, connect_args=options)
+    Base.metadata.create_all(engine)
+    try:
+        yield engine, options
+    finally:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin.dispose()
+
+
+def ccaa_job(sport: str, league: str, season_option: str, threads: list[str]) -> PipelineJob:
+    """A CCAA job on the recorded fixtures that notes which thread normalizes and validates"""
+    pipeline = registry.get(sport).load()(str(CCAA_FIXTURES))
+    for stage in ("prepare", "validate"):
+        original = getattr(pipeline, stage)
+
+        def traced(*args, original=original):
+            threads.append(threading.current_thread().name)
+            return original(*args)
+
+        setattr(pipeline, stage, traced)
+    return PipelineJob(sport, league, season_option, pipeline)  # type: ignore[arg-type]
+
+
+def run(jobs: list[PipelineJob], options: dict, db_workers: int = 2, url: str = "", **kwargs) -> list[PipelineJob]:
+    async def main():
+        engine = create_async_engine(async_url(url or POSTGRES_URL), connect_args=options)
+        try:
+            run = run_jobs(jobs, 2, db_workers, session_factory=async_sessionmaker(engine), cpu_workers=2, **kwargs)
+            # Bounded, so a regression fails the test instead of hanging it
+            return await asyncio.wait_for(run, timeout=30)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(main())
+
+
+def test_cpu_stages_run_off_the_event_loop(schema_url):
+    engine, options = schema_url
+    threads: list[str] = []
+    jobs = [ccaa_job("ccaa_basketball", league, "regular", threads) for league in ("m", "w")]
+
+    assert run(jobs, options) == []
+
+    assert len(threads) == 4 and all(name.startswith("cpu") for name in threads)
+    table = next(spec.table for spec in jobs[0].pipeline.tables if spec.frame == TEAM_STATS)
+    with engine.connect() as connection:
+        assert connection.scalar(select(func.count()).select_from(table)) == 16
+
+
+def test_failed_fetch_leaves_other_jobs_running(schema_url):
+    _, options = schema_url
+    missing = ccaa_job("ccaa_football", "m", "playoffs", [])
+    loaded = ccaa_job("ccaa_soccer", "w", "regular", [])
+
+    assert run([missing, loaded], options) == [missing]
+
+
+def test_unexpected_load_error_fails_only_its_job(schema_url):
+    _, options = schema_url
+    broken = ccaa_job("ccaa_volleyball", "m", "regular", [])
+    loaded = [ccaa_job("ccaa_volleyball", "w", "regular", []), ccaa_job("ccaa_soccer", "m", "regular", [])]
+
+    def write(*args):
+        raise TypeError("unsupported operand")
+
+    broken.pipeline.write = write
+
+    assert run([broken, *loaded], options, db_workers=1) == [broken]
+
+
+# Never connected to: these tests replace the load
+UNREACHABLE = "postgresql+psycopg://nobody@invalid.localdomain:1/none"
+
+
+def test_any_fetch_error_fails_only_its_job(monkeypatch):
+    async def load(self, session, league, season_option, frames, executor=None):
+        pass
+
+    monkeypatch.setattr(AsyncPipelineAdapter, "load", load)
+    jobs = [
+        ccaa_job("ccaa_basketball", league, season_option, [])
+        for league in ("m", "w")
+        for season_option in ("regular", "playoffs")
+    ]
+    errors = {jobs[0]: AttributeError("'NoneType' object has no attribute 'find_all'"), jobs[1]: IndexError("row")}
+
+    def fetch(job):
+        if job in errors:
+            raise errors[job]
+        return None, None, None
+
+    assert run(jobs, {}, db_workers=1, url=UNREACHABLE, fetch=fetch) == jobs[:2]
+
+
+def test_dead_writer_stops_the_run_instead_of_hanging(monkeypatch):
+    class Abort(BaseException):
+        pass
+
+    async def load(self, session, league, season_option, frames, executor=None):
+        raise Abort()
+
+    monkeypatch.setattr(AsyncPipelineAdapter, "load", load)
+    jobs = [ccaa_job(sport, "m", "regular", []) for sport in ("ccaa_basketball", "ccaa_soccer", "ccaa_volleyball")]
+
+    with pytest.raises(BaseExceptionGroup) as error:
+        run(jobs, {}, db_workers=1, url=UNREACHABLE, fetch=lambda job: (None, None, None))
+    assert error.value.subgroup(Abort) is not None
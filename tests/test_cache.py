@@ -0,0 +1,43 @@
+"""On-disk frame cache: hits within the TTL, and unreadable entries are discarded instead of crashing"""
+
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.pipelines.cache import FrameCache
+
+
+def frame(value: int) -> pd.DataFrame:
+    return pd.DataFrame({"value": [value]})
+
+
+@pytest.fixture
+def cache(tmp_path) -> FrameCache:
+    return FrameCache(tmp_path, ttl_seconds=60, max_bytes=1 << 20)
+
+
+def test_fresh_entries_are_reused(cache):
+    assert cache.fetch(partial(frame, 1))["value"].item() == 1
+    calls = []
+    cached = cache.fetch(partial(frame, 1), invoke=lambda call: calls.append(call) or call())
+    assert cached["value"].item() == 1 and not calls
+
+
+def test_refresh_ignores_entries(cache):
+    cache.fetch(partial(frame, 1))
+    cache.configure(refresh=True)
+    calls = []
+    cache.fetch(partial(frame, 1), invoke=lambda call: calls.append(call) or call())
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("content", [b"not a pickle", b"\x80\x04\x95", b"\x80\x04c__main__\nMissing\n."])
+def test_unreadable_entries_are_discarded(cache, content):
+    call = partial(frame, 2)
+    path = cache.path_for(call)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+    assert cache.fetch(call)["value"].item() == 2
+    assert pd.read_pickle(path)["value"].item() == 2
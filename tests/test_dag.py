@@ -0,0 +1,112 @@
+"""DAG executor: dependencies, retries with deterministic errors excluded, skipped downstream nodes"""
+
+import threading
+import time
+
+import pytest
+
+from src.database.dtypes import DtypeError
+from src.pipelines.dag import CPU, DB, IO, Dag
+from src.pipelines.runner import NOT_RETRYABLE
+from src.validations.schema import SchemaValidationError
+
+WORKERS = {IO: 2, CPU: 2}
+
+
+def flaky(error: BaseException, failures: int, calls: list[int]):
+    """Raises `error` on the first `failures` calls, then returns the call count"""
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error
+        return len(calls)
+
+    return func
+
+
+def test_results_flow_along_dependencies():
+    dag = Dag()
+    a = dag.add("a", lambda: 2, pool=IO)
+    b = dag.add("b", lambda x: x * 3, deps=(a,))
+    dag.add("c", lambda x, y: x + y, deps=(a, b))
+
+    result = dag.run(WORKERS)
+
+    assert result.ok and result.results == {"a": 2, "b": 6, "c": 8}
+
+
+def test_transient_errors_are_retried():
+    calls: list[int] = []
+    dag = Dag(no_retry=NOT_RETRYABLE)
+    dag.add("load", flaky(ConnectionError("reset"), 2, calls), retries=2)
+
+    result = dag.run(WORKERS, retry_delay=0)
+
+    assert result.ok and result.results["load"] == 3
+
+
+@pytest.mark.parametrize("error", [DtypeError("t", ["wins: 1 fractional values"]), SchemaValidationError(["bad"])])
+def test_deterministic_errors_fail_on_the_first_attempt(error):
+    calls: list[int] = []
+    dag = Dag(no_retry=NOT_RETRYABLE)
+    dag.add("load", flaky(error, 5, calls), retries=3)
+
+    result = dag.run(WORKERS, retry_delay=0)
+
+    assert len(calls) == 1 and result.errors["load"] is error
+
+
+def test_failure_skips_downstream_only():
+    dag = Dag()
+    failed = dag.add("fetch/a", flaky(OSError("down"), 1, []), pool=IO)
+    dag.add("load/a", lambda _: None, deps=(failed,))
+    dag.add("after/a", lambda _: None, deps=("load/a",))
+    dag.add("fetch/b", lambda: "ok", pool=IO)
+
+    result = dag.run(WORKERS)
+
+    assert set(result.errors) == {"fetch/a"}
+    assert sorted(result.skipped) == ["after/a", "load/a"]
+    assert result.results["fetch/b"] == "ok"
+
+
+def test_nodes_sharing_a_resource_never_overlap():
+    active, overlaps = [], []
+    lock = threading.Lock()
+
+    def write():
+        with lock:
+            active.append(1)
+            overlaps.append(len(active) > 1)
+        time.sleep(0.05)
+        with lock:
+            active.pop()
+
+    dag = Dag()
+    for name in ("m", "w"):
+        dag.add(name, write, resources=("basketball_player_stats",))
+
+    assert dag.run({CPU: 2}).ok and overlaps == [False, False]
+
+
+def test_queued_nodes_do_not_hold_resources():
+    # "first" fills the single DB worker until "unblock" runs; "queued" must not claim the table "unblock" needs
+    released = threading.Event()
+    dag = Dag()
+    dag.add("first", lambda: released.wait(timeout=5), pool=DB, resources=("football_team_stats",))
+    dag.add("queued", lambda: None, pool=DB, resources=("football_standings",))
+    dag.add("unblock", released.set, pool=CPU, resources=("football_standings",))
+
+    result = dag.run({DB: 1, CPU: 1})
+
+    assert result.ok and result.results["first"] is True
+
+
+def test_nodes_are_validated_on_add():
+    dag = Dag()
+    dag.add("a", lambda: None)
+    with pytest.raises(ValueError, match="Duplicate"):
+        dag.add("a", lambda: None)
+    with pytest.raises(ValueError, match="unknown nodes"):
+        dag.add("b", lambda _: None, deps=("missing",))
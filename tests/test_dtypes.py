@@ -0,0 +1,86 @@
+"""Dtype normalization: tight casts, rounded fractional integers, rejected values instead of silent coercion, and no change to the caller's frame"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import Column, Float, Integer, MetaData, SmallInteger, String, Table
+
+from src.database.dtypes import DtypeError, normalize_dtypes
+
+TABLE = Table(
+    "dtype_check",
+    MetaData(),
+    Column("id", Integer, primary_key=True),
+    Column("team_name", String(10)),
+    Column("league", String(1)),
+    Column("wins", SmallInteger),
+    Column("points", Integer),
+    Column("rating", Float),
+)
+
+
+def frame(**overrides) -> pd.DataFrame:
+    columns = {
+        "team_name": ["Carleton", "UBC"],
+        "league": ["m", "m"],
+        "wins": [10.0, 4.0],
+        "points": ["812", None],
+        "rating": ["1.5", "2"],
+    }
+    return pd.DataFrame({**columns, **overrides})
+
+
+def test_columns_are_cast_to_the_table_dtypes():
+    df = normalize_dtypes(frame(), TABLE)
+
+    assert df["wins"].dtype == "Int16" and df["wins"].tolist() == [10, 4]
+    assert df["points"].dtype == "Int32" and df["points"].isna().tolist() == [False, True]
+    assert df["rating"].dtype == "float64"
+    assert isinstance(df["league"].dtype, pd.CategoricalDtype)
+    assert df["team_name"].dtype == object
+
+
+def test_callers_frame_is_not_modified():
+    original = frame()
+    before = original.copy()
+
+    normalize_dtypes(original, TABLE)
+
+    pd.testing.assert_frame_equal(original, before)
+
+
+def test_fractional_integers_are_rounded_half_to_even():
+    df = normalize_dtypes(frame(wins=[10.5, 3.6], points=["1234.5", None]), TABLE)
+
+    assert df["wins"].tolist() == [10, 4]
+    assert df["points"].dtype == "Int32" and df["points"].tolist()[0] == 1234
+
+
+def test_rounding_can_overflow():
+    with pytest.raises(DtypeError, match="wins: 1 values overflow Int16"):
+        normalize_dtypes(frame(wins=[32767.6, 4.0]), TABLE)
+
+
+def test_missing_and_extra_columns_are_left_alone():
+    df = normalize_dtypes(frame().drop(columns="rating").assign(note=["a", "b"]), TABLE)
+    assert "rating" not in df.columns and df["note"].tolist() == ["a", "b"]
+
+
+@pytest.mark.parametrize(
+    ("overrides", "problem"),
+    [
+        ({"wins": [40000, 4]}, "wins: 1 values overflow Int16"),
+        ({"points": ["812", "n/a"]}, "points: non-numeric values"),
+        ({"rating": ["1.5", "high"]}, "rating: non-numeric values"),
+        ({"team_name": ["Carleton", "Memorial University"]}, "team_name: 1 values longer than 10"),
+    ],
+)
+def test_values_that_do_not_fit_are_rejected(overrides, problem):
+    with pytest.raises(DtypeError, match=problem):
+        normalize_dtypes(frame(**overrides), TABLE)
+
+
+def test_every_problem_is_reported():
+    with pytest.raises(DtypeError) as error:
+        normalize_dtypes(frame(wins=[40000, np.nan], rating=["x", "1"]), TABLE)
+    assert error.value.problems == ["wins: 1 values overflow Int16 (e.g. 40000)", "rating: non-numeric values"]
@@ -0,0 +1,102 @@
+"""Content fingerprints: stable across incidental differences, and unchanged slices skip validation and writes"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.pipelines.fingerprint import fingerprints_unchanged, frame_fingerprint, frame_fingerprints, store_fingerprints
+from src.pipelines.registry import registry
+from src.utils.constants import PLAYER_STATS, TEAM_STATS
+
+CCAA_FIXTURES = Path(__file__).parent / "fixtures" / "ccaa"
+FRAME = pd.DataFrame({"team_name": ["Acadia", "UPEI", None], "wins": [5, 3, 1], "pct": [0.5, 0.3, 0.1]})
+
+
+def test_fingerprint_ignores_column_order_row_order_and_dtype_width():
+    reordered = FRAME[["pct", "wins", "team_name"]].iloc[::-1].reset_index(drop=True)
+    widened = FRAME.astype({"wins": "float64"})
+
+    assert frame_fingerprint(reordered) == frame_fingerprint(FRAME) == frame_fingerprint(widened)
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        FRAME.assign(wins=[5, 3, 2]),
+        FRAME.assign(team_name=["Acadia", "UPEI", "StFX"]),
+        FRAME.rename(columns={"pct": "win_percentage"}),
+        FRAME.iloc[:2],
+    ],
+)
+def test_fingerprint_changes_with_content(changed):
+    assert frame_fingerprint(changed) != frame_fingerprint(FRAME)
+
+
+def test_stored_fingerprints_match_only_their_slice(session):
+    fingerprints = frame_fingerprints({TEAM_STATS: FRAME, PLAYER_STATS: FRAME.iloc[:1], "standings": None})
+    assert set(fingerprints) == {TEAM_STATS, PLAYER_STATS}
+
+    assert not fingerprints_unchanged(session, "basketball", "m", "regular", fingerprints)
+    store_fingerprints(session, "basketball", "m", "regular", fingerprints)
+    session.commit()
+
+    assert fingerprints_unchanged(session, "basketball", "m", "regular", fingerprints)
+    assert not fingerprints_unchanged(session, "basketball", "w", "regular", fingerprints)
+    assert not fingerprints_unchanged(session, "basketball", "m", "regular", {})
+
+    changed = {**fingerprints, TEAM_STATS: (frame_fingerprint(FRAME.iloc[:2]), 2)}
+    assert not fingerprints_unchanged(session, "basketball", "m", "regular", changed)
+    store_fingerprints(session, "basketball", "m", "regular", changed)
+    session.commit()
+    assert fingerprints_unchanged(session, "basketball", "m", "regular", changed)
+
+
+@pytest.fixture
+def pipeline():
+    """CCAA basketball reading the recorded fixtures"""
+    pipeline = registry.get("ccaa_basketball").create()
+    pipeline.fixtures_dir = str(CCAA_FIXTURES)
+    return pipeline
+
+
+def load(pipeline, session, calls: list[str]):
+    """Fetch, normalize, validate and save m/regular, noting in `calls` whether it validated and wrote"""
+    validate = type(pipeline).validate_data.__get__(pipeline)
+    write = type(pipeline).save_to_database.__get__(pipeline)
+    pipeline.validate_data = lambda *args: calls.append("validate") or validate(*args)
+    pipeline.save_to_database = lambda *args: calls.append("write") or write(*args)
+    pipeline.load(session, "m", "regular", *pipeline.fetch("m", "regular"))
+    session.commit()
+
+
+def test_unchanged_slice_is_skipped(session, pipeline):
+    first, second = [], []
+    load(pipeline, session, first)
+    load(pipeline, session, second)
+
+    assert first == ["validate", "write"] and second == []
+
+
+def test_force_reloads_unchanged_slice(session, pipeline):
+    load(pipeline, session, [])
+    pipeline.skip_unchanged = False
+    calls: list[str] = []
+    # Validation is cached for the run, so only the write repeats
+    load(pipeline, session, calls)
+
+    assert calls == ["write"]
+
+
+def test_rolled_back_load_is_not_remembered(session, pipeline):
+    def fail(*args):
+        raise RuntimeError("database went away")
+
+    pipeline.save_to_database = fail
+    with pytest.raises(RuntimeError):
+        pipeline.load(session, "m", "regular", *pipeline.fetch("m", "regular"))
+    session.rollback()
+
+    calls: list[str] = []
+    load(pipeline, session, calls)
+    assert "write" in calls
@@ -0,0 +1,114 @@
+"""Incremental loads write only the differences: keyed upserts keep ids, keyless tables diff on row content"""
+
+import pandas as pd
+from sqlalchemy import select
+
+from src.database.incremental import incremental_upsert
+from src.database.models.usports import BasketballPlayerStats, BasketballStandings
+from src.pipelines.usports.basketball import BasketballPipeline
+from src.utils.constants import INCREMENTAL
+
+STANDINGS = BasketballStandings.__table__
+PLAYERS = BasketballPlayerStats.__table__
+SCOPE = {"league": "m"}
+
+
+def standings(wins: dict[str, int]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "team_name": list(wins),
+            "conference": "OUA",
+            "games_played": 10,
+            "total_wins": list(wins.values()),
+            "total_losses": [10 - w for w in wins.values()],
+            "win_percentage": [w / 10 for w in wins.values()],
+            "total_points": 700,
+            "total_points_against": 690,
+        }
+    )
+
+
+def players(points: list[int]) -> pd.DataFrame:
+    """One Carleton player per entry of `points`; every other stat is 1"""
+    stats = {column.name: 1 for column in PLAYERS.c if column.name not in ("id", "league", "season_option")}
+    return pd.DataFrame(
+        {
+            **stats,
+            "lastname_initials": [f"P{i}" for i in range(len(points))],
+            "first_name": "Sam",
+            "school": "Carleton",
+            "total_points": points,
+        }
+    )
+
+
+def stored(session, table, **scope) -> dict:
+    rows = session.execute(select(table).where(*(table.c[k] == v for k, v in scope.items()))).mappings()
+    return {row["team_name"]: (row["id"], row["total_wins"]) for row in rows}
+
+
+def test_identical_reload_writes_nothing(session):
+    first = incremental_upsert(session, STANDINGS, standings({"Acadia": 5, "UPEI": 3}), SCOPE)
+    before = stored(session, STANDINGS, **SCOPE)
+
+    again = incremental_upsert(session, STANDINGS, standings({"Acadia": 5, "UPEI": 3}), SCOPE)
+
+    assert str(first) == "+2 ~0 -0" and str(again) == "+0 ~0 -0"
+    assert stored(session, STANDINGS, **SCOPE) == before
+
+
+def test_keyed_rows_are_updated_in_place(session):
+    incremental_upsert(session, STANDINGS, standings({"Acadia": 5, "UPEI": 3, "Dalhousie": 1}), SCOPE)
+    before = stored(session, STANDINGS, **SCOPE)
+
+    result = incremental_upsert(session, STANDINGS, standings({"Acadia": 6, "UPEI": 3, "StFX": 2}), SCOPE)
+
+    after = stored(session, STANDINGS, **SCOPE)
+    assert (result.inserted, result.updated, result.deleted) == (1, 1, 1)
+    assert after["Acadia"] == (before["Acadia"][0], 6)
+    assert after["UPEI"] == before["UPEI"]
+    assert set(after) == {"Acadia", "UPEI", "StFX"}
+
+
+def test_other_slices_are_untouched(session):
+    incremental_upsert(session, STANDINGS, standings({"Acadia": 5}), {"league": "w"})
+    incremental_upsert(session, STANDINGS, standings({"Acadia": 5}), SCOPE)
+
+    incremental_upsert(session, STANDINGS, standings({"UPEI": 4}), SCOPE)
+
+    assert stored(session, STANDINGS, league="w") == {"Acadia": (1, 5)}
+    assert set(stored(session, STANDINGS, **SCOPE)) == {"UPEI"}
+
+
+def test_keyless_tables_diff_on_row_content(session):
+    scope = {"league": "m", "season_option": "regular"}
+    incremental_upsert(session, PLAYERS, players([10, 20, 20]), scope)
+    ids = set(session.scalars(select(PLAYERS.c.id)))
+
+    # P1 scores more; P0 and P2 are unchanged
+    result = incremental_upsert(session, PLAYERS, players([10, 25, 20]), scope)
+
+    assert (result.inserted, result.updated, result.deleted) == (1, 0, 1)
+    points = dict(session.execute(select(PLAYERS.c.lastname_initials, PLAYERS.c.total_points)).all())
+    assert points == {"P0": 10, "P1": 25, "P2": 20}
+    assert len(ids & set(session.scalars(select(PLAYERS.c.id)))) == 2
+
+
+def test_duplicate_rows_are_matched_one_to_one(session):
+    scope = {"league": "m", "season_option": "regular"}
+    duplicated = pd.concat([players([10]), players([10])], ignore_index=True)
+    incremental_upsert(session, PLAYERS, duplicated, scope)
+
+    result = incremental_upsert(session, PLAYERS, players([10]), scope)
+
+    assert (result.inserted, result.deleted) == (0, 1)
+
+
+def test_pipeline_incremental_write_mode(session):
+    pipeline = BasketballPipeline()
+    pipeline.write_mode = INCREMENTAL
+
+    pipeline.save_table(session, BasketballStandings, standings({"Acadia": 5, "UPEI": 3}), league="m")
+    result = pipeline.save_table(session, BasketballStandings, standings({"Acadia": 5, "UPEI": 4}), league="m")
+
+    assert str(result) == "+0 ~1 -0"
@@ -0,0 +1,120 @@
+"""Retries, timeouts and the per-host circuit breaker around upstream calls"""
+
+import time
+import urllib.error
+from functools import partial
+
+import pandas as pd
+import pytest
+
+from src.pipelines.resilience import CircuitOpenError, FetchTimeoutError, ResilientFetcher, host_of, is_transient
+
+
+def fetcher(**options) -> ResilientFetcher:
+    defaults = dict(timeout=1, attempts=3, backoff=0, max_backoff=0, breaker_threshold=3, breaker_reset=60)
+    return ResilientFetcher(**{**defaults, **options})
+
+
+class Flaky:
+    """Raises the queued errors in order, then returns a frame"""
+
+    def __init__(self, *errors: BaseException):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> pd.DataFrame:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return pd.DataFrame({"a": [1]})
+
+
+def test_transient_errors_are_retried():
+    call = Flaky(ConnectionError("reset"), TimeoutError("slow"))
+    assert len(fetcher()(call)) == 1
+    assert call.calls == 3
+
+
+def test_deterministic_errors_fail_at_once_and_spare_the_breaker():
+    upstream = fetcher(breaker_threshold=1)
+    call = Flaky(KeyError("Team"))
+    with pytest.raises(KeyError):
+        upstream(call)
+    assert call.calls == 1
+
+    breaker = upstream.breaker(host_of(call))
+    assert breaker.failures == 0 and not breaker.is_open
+
+
+def test_breaker_opens_after_threshold_and_rejects_calls():
+    upstream = fetcher(attempts=1, breaker_threshold=2)
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            upstream(Flaky(ConnectionError("down")))
+
+    call = Flaky()
+    with pytest.raises(CircuitOpenError):
+        upstream(call)
+    assert call.calls == 0
+
+
+def test_half_open_trial_closes_the_breaker():
+    upstream = fetcher(attempts=1, breaker_threshold=1, breaker_reset=0.05)
+    with pytest.raises(ConnectionError):
+        upstream(Flaky(ConnectionError("down")))
+    time.sleep(0.1)
+
+    call = Flaky()
+    assert len(upstream(call)) == 1
+    assert not upstream.breaker(host_of(call)).is_open
+
+
+def test_slow_calls_time_out():
+    upstream = fetcher(timeout=0.05, attempts=1)
+    with pytest.raises(FetchTimeoutError):
+        upstream(partial(time.sleep, 1))
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (TimeoutError(), True),
+        (ConnectionResetError(), True),
+        (urllib.error.URLError("dns"), True),
+        (urllib.error.HTTPError("url", 503, "unavailable", {}, None), True),
+        (urllib.error.HTTPError("url", 404, "missing", {}, None), False),
+        (ValueError("No tables found"), False),
+        (FileNotFoundError("snapshot"), False),
+    ],
+)
+def test_is_transient(error, transient):
+    assert is_transient(error) is transient
+
+
+def test_httpx_transport_errors_are_retried_and_trip_the_breaker():
+    httpx = pytest.importorskip("httpx")
+    request = httpx.Request("GET", "https://universitysport.prestosports.com/sports/mbkb")
+    errors = [
+        httpx.ConnectError("refused", request=request),
+        httpx.ReadTimeout("slow", request=request),
+        httpx.ConnectTimeout("slow", request=request),
+        httpx.RemoteProtocolError("peer closed connection", request=request),
+    ]
+    assert all(is_transient(error) for error in errors)
+
+    call = Flaky(*errors[:2])
+    assert len(fetcher()(call)) == 1 and call.calls == 3
+
+    upstream = fetcher(attempts=1, breaker_threshold=1)
+    with pytest.raises(httpx.ConnectError):
+        upstream(Flaky(errors[0]))
+    assert upstream.breaker(host_of(call)).is_open
+
+
+def test_httpx_status_errors_are_transient_only_for_5xx():
+    httpx = pytest.importorskip("httpx")
+    request = httpx.Request("GET", "https://universitysport.prestosports.com/sports/mbkb")
+    for status, transient in ((502, True), (404, False)):
+        response = httpx.Response(status, request=request)
+        error = httpx.HTTPStatusError(f"{status}", request=request, response=response)
+        assert is_transient(error) is transient
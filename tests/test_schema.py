@@ -0,0 +1,157 @@
+"""Schema rules derived from the models reject what the per-sport checks used to reject"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.validations.schema import FrameSchema, SchemaValidationError, SportSchema
+from src.validations.usports.basketball import BASKETBALL_SCHEMA
+from src.validations.usports.football import FOOTBALL_SCHEMA
+from src.validations.usports.ice_hockey import ICE_HOCKEY_SCHEMA
+from src.validations.usports.soccer import SOCCER_SCHEMA
+from src.validations.usports.volleyball import VOLLEYBALL_SCHEMA
+
+SCHEMAS = {
+    "basketball": BASKETBALL_SCHEMA,
+    "football": FOOTBALL_SCHEMA,
+    "ice_hockey": ICE_HOCKEY_SCHEMA,
+    "soccer": SOCCER_SCHEMA,
+    "volleyball": VOLLEYBALL_SCHEMA,
+}
+SCHOOLS = ["Acadia", "Carleton", "UBC"]
+
+
+def valid_frame(schema: FrameSchema, rows: int = 3) -> pd.DataFrame:
+    """Rows that satisfy every rule of `schema`: in-range numbers, known schools, allowed values"""
+    data = {}
+    for column in schema.columns:
+        if column == schema.school_column:
+            data[column] = SCHOOLS[:rows]
+        elif column in schema.allowed:
+            data[column] = [sorted(schema.allowed[column])[0]] * rows
+        elif column in schema.numeric:
+            data[column] = [50.0] * rows
+        else:
+            data[column] = [f"{column} {i}" for i in range(rows)]
+    return pd.DataFrame(data)
+
+
+def valid_frames(schema: SportSchema) -> dict[str, pd.DataFrame]:
+    return {
+        "standings_df": valid_frame(schema.standings),
+        "team_stats_df": valid_frame(schema.team_stats),
+        "player_stats_df": valid_frame(schema.player_stats),
+    }
+
+
+def violations(schema: SportSchema, **frames: pd.DataFrame) -> list[str]:
+    try:
+        schema.validate(**{**valid_frames(schema), **frames})
+    except SchemaValidationError as error:
+        return [str(violation) for violation in error.violations]
+    return []
+
+
+@pytest.mark.parametrize("sport", SCHEMAS)
+def test_valid_frames_pass(sport):
+    assert violations(SCHEMAS[sport]) == []
+
+
+@pytest.mark.parametrize("value", [100.5, -0.1])
+def test_percentages_outside_0_100_are_rejected(value):
+    teams = valid_frame(BASKETBALL_SCHEMA.team_stats)
+    teams.loc[0, "field_goal_percentage"] = value
+
+    assert violations(BASKETBALL_SCHEMA, team_stats_df=teams) == [
+        f"Basketball Team Stats.field_goal_percentage: outside [0, 100] (1 rows, e.g. [{value}])"
+    ]
+
+
+def test_negative_counts_are_rejected():
+    players = valid_frame(BASKETBALL_SCHEMA.player_stats)
+    players.loc[1, "total_points"] = -3
+
+    assert violations(BASKETBALL_SCHEMA, player_stats_df=players) == [
+        "Basketball Player Stats.total_points: outside [0, inf] (1 rows, e.g. [-3.0])"
+    ]
+
+
+def test_signed_stats_may_be_negative():
+    players = valid_frame(FOOTBALL_SCHEMA.player_stats)
+    players.loc[0, ["rushing_yards", "longest_rush"]] = -4
+
+    assert violations(FOOTBALL_SCHEMA, player_stats_df=players) == []
+
+
+def test_nulls_in_non_nullable_columns_are_rejected():
+    standings = valid_frame(BASKETBALL_SCHEMA.standings)
+    standings.loc[[0, 2], "total_wins"] = np.nan
+
+    assert violations(BASKETBALL_SCHEMA, standings_df=standings) == [
+        "Basketball Standings.total_wins: null in non-nullable column (2 rows)"
+    ]
+
+
+def test_non_numeric_values_are_rejected():
+    teams = valid_frame(SOCCER_SCHEMA.team_stats)
+    column = SOCCER_SCHEMA.team_stats.numeric[0]
+    teams[column] = teams[column].astype(object)
+    teams.loc[0, column] = "n/a"
+
+    assert violations(SOCCER_SCHEMA, team_stats_df=teams) == [
+        f"Soccer Team Stats.{column}: not numeric (1 rows, e.g. ['n/a'])"
+    ]
+
+
+def test_missing_columns_are_rejected():
+    teams = valid_frame(ICE_HOCKEY_SCHEMA.team_stats).drop(columns="conference")
+
+    assert violations(ICE_HOCKEY_SCHEMA, team_stats_df=teams) == [
+        "Ice Hockey Team Stats.conference: missing column (3 rows)"
+    ]
+
+
+def test_players_from_schools_missing_in_team_stats_are_rejected():
+    teams = valid_frame(BASKETBALL_SCHEMA.team_stats, rows=2)
+
+    assert violations(BASKETBALL_SCHEMA, team_stats_df=teams) == [
+        "Basketball Player Stats.school: not in Basketball Team Stats.team_name (1 rows, e.g. ['UBC'])"
+    ]
+
+
+def test_unknown_schools_are_rejected():
+    players = valid_frame(BASKETBALL_SCHEMA.player_stats)
+    teams = valid_frame(BASKETBALL_SCHEMA.team_stats)
+    players.loc[2, "school"] = teams.loc[2, "team_name"] = "Hogwarts"
+
+    assert violations(BASKETBALL_SCHEMA, team_stats_df=teams, player_stats_df=players) == [
+        "Basketball Team Stats.team_name: unknown U SPORTS school (1 rows, e.g. ['Hogwarts'])",
+        "Basketball Player Stats.school: unknown U SPORTS school (1 rows, e.g. ['Hogwarts'])",
+    ]
+
+
+@pytest.mark.parametrize("frame", ["team_stats", "player_stats"])
+def test_volleyball_hitting_percentage_is_signed(frame):
+    df = valid_frame(getattr(VOLLEYBALL_SCHEMA, frame))
+    df.loc[0, "hitting_percentage"] = -25.0
+    assert violations(VOLLEYBALL_SCHEMA, **{f"{frame}_df": df}) == []
+
+    df.loc[1, "hitting_percentage"] = -150.0
+    name = getattr(VOLLEYBALL_SCHEMA, frame).name
+    assert violations(VOLLEYBALL_SCHEMA, **{f"{frame}_df": df}) == [
+        f"{name}.hitting_percentage: outside [-100, 100] (1 rows, e.g. [-150.0])"
+    ]
+
+
+def test_every_violation_is_reported_at_once():
+    standings = valid_frame(BASKETBALL_SCHEMA.standings)
+    standings.loc[0, "win_percentage"] = 120
+    standings.loc[1, "team_name"] = None
+
+    with pytest.raises(SchemaValidationError) as error:
+        BASKETBALL_SCHEMA.validate(standings, None, None)
+    assert [(violation.column, violation.rule) for violation in error.value.violations] == [
+        ("team_name", "null in non-nullable column"),
+        ("win_percentage", "outside [0, 100]"),
+        ("team_name", "unknown U SPORTS school"),
+    ]
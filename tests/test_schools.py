@@ -0,0 +1,48 @@
+"""School-name normalization: aliases and spelling variants resolve, stored names stay as they are"""
+
+import pandas as pd
+import pytest
+
+from src.utils.constants import VALID_USPORTS_SCHOOLS
+from src.utils.schools import CCAA_COLLEGES, USPORTS_SCHOOLS, SchoolIndex
+
+
+def test_every_canonical_name_maps_to_itself():
+    names = pd.Series(VALID_USPORTS_SCHOOLS)
+    assert USPORTS_SCHOOLS.normalize(names).tolist() == VALID_USPORTS_SCHOOLS
+
+
+@pytest.mark.parametrize(
+    "spelling, canonical",
+    [
+        ("Ryerson", "Toronto Metropolitan"),
+        ("TMU", "Toronto Metropolitan"),
+        ("Montréal", "Montreal"),
+        ("queens", "Queen's"),
+        ("  St. Francis   Xavier ", "StFX"),
+    ],
+)
+def test_aliases_and_variants_resolve(spelling, canonical):
+    assert USPORTS_SCHOOLS.normalize(pd.Series([spelling])).iloc[0] == canonical
+
+
+def test_stored_names_are_not_rewritten():
+    # Both are stored upstream names; folding one into the other would relabel existing rows
+    names = pd.Series(["UBCO", "UBC Okanagan"])
+    assert USPORTS_SCHOOLS.normalize(names).tolist() == ["UBCO", "UBC Okanagan"]
+
+
+def test_unknown_names_pass_through_and_are_flagged():
+    names = pd.Series(["Acadia", "Nowhere U", None])
+    assert USPORTS_SCHOOLS.normalize(names).tolist()[:2] == ["Acadia", "Nowhere U"]
+    assert USPORTS_SCHOOLS.is_known(names).tolist() == [True, False, False]
+
+
+def test_organizations_are_separate():
+    assert not USPORTS_SCHOOLS.is_known(pd.Series(["Ambrose"]))[0]
+    assert not CCAA_COLLEGES.is_known(pd.Series(["Acadia"]))[0]
+
+
+def test_alias_to_unknown_school_is_rejected():
+    with pytest.raises(ValueError, match="unknown schools"):
+        SchoolIndex(["Acadia"], {"AU": "Athabasca"})
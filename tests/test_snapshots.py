@@ -0,0 +1,31 @@
+"""Snapshot round trips in every supported format and layout, and compressions CSV cannot write"""
+
+import pandas as pd
+import pytest
+
+from src.pipelines.snapshots import CSV, PARQUET, discover_snapshots, read_snapshot, write_snapshot
+
+FRAME = pd.DataFrame({"team_name": ["Acadia", "UPEI"], "wins": [5, 3]})
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+@pytest.mark.parametrize("partitioned", [False, True])
+def test_csv_round_trip(tmp_path, compression, partitioned):
+    write_snapshot(FRAME, tmp_path, "basketball", "m", "regular", "teams", CSV, compression, partitioned)
+
+    pd.testing.assert_frame_equal(read_snapshot(tmp_path, "basketball", "m", "regular", "teams"), FRAME)
+    assert discover_snapshots(tmp_path) == [("basketball", "m", "regular")]
+
+
+@pytest.mark.parametrize("compression", ["zstd", "snappy"])
+def test_csv_rejects_compressions_it_cannot_write(tmp_path, compression):
+    with pytest.raises(ValueError, match="gzip"):
+        write_snapshot(FRAME, tmp_path, "basketball", "m", "regular", "teams", CSV, compression)
+
+
+@pytest.mark.parametrize("compression", [None, "zstd"])
+def test_parquet_round_trip(tmp_path, compression):
+    pytest.importorskip("pyarrow")
+    write_snapshot(FRAME, tmp_path, "basketball", "m", "regular", "teams", PARQUET, compression, partitioned=True)
+
+    pd.testing.assert_frame_equal(read_snapshot(tmp_path, "basketball", "m", "regular", "teams"), FRAME)
@@ -0,0 +1,29 @@
+"""Runs with nothing to do finish without importing usports, pandas or SQLAlchemy"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs the script given as its first argument, then prints the heavy packages it imported on the last line
+PROBE = """
+import runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name="__main__")
+except SystemExit:
+    pass
+print(" ".join(sorted({name.split(".")[0] for name in sys.modules} & {"usports", "pandas", "sqlalchemy"})))
+"""
+
+
+@pytest.mark.parametrize("args", [["--help"], ["--only", "sport=none"]])
+def test_update_script_skips_heavy_imports(args):
+    script = str(ROOT / "scripts" / "update_all_usports_db.py")
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, script, *args], capture_output=True, text=True, cwd=ROOT, check=True
+    )
+    assert result.stdout.splitlines()[-1] == ""
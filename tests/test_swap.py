@@ -0,0 +1,128 @@
+"""Standings shadow-table swap: PostgreSQL behaviour (needs TEST_POSTGRES_URL) and the fallback elsewhere"""
+
+import os
+import uuid
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.orm import Session
+
+from src.database.models.usports import BasketballStandings
+from src.database.swap import swap_replace_rows
+from src.pipelines.usports.basketball import BasketballPipeline
+from src.utils.constants import SWAP
+
+POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+TABLE = BasketballStandings.__table__
+
+
+def standings(teams: list[str], wins: int = 5) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "team_name": teams,
+            "conference": "OUA",
+            "games_played": 10,
+            "total_wins": wins,
+            "total_losses": 10 - wins,
+            "win_percentage": wins / 10,
+            "total_points": 700,
+            "total_points_against": 690,
+        }
+    )
+
+
+def test_sqlite_falls_back_to_delete_and_insert(session):
+    pipeline = BasketballPipeline()
+    for wins in (5, 7):
+        pipeline.save_table(
+            session, BasketballStandings, standings(["Acadia", "UPEI"], wins), load_mode=SWAP, league="m"
+        )
+    session.commit()
+    assert {wins for _, wins in rows(session, "m").values()} == {7}
+
+
+@pytest.fixture
+def pg_session():
+    if not POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL not set")
+    schema = f"swap_test_{uuid.uuid4().hex[:8]}"
+    admin = create_engine(POSTGRES_URL)
+    with admin.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    engine = create_engine(POSTGRES_URL, connect_args={"options": f"-c search_path={schema}"})
+    TABLE.create(engine)
+    try:
+        with Session(engine) as session:
+            yield session
+    finally:
+        engine.dispose()
+        with admin.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        admin.dispose()
+
+
+def rows(session: Session, league: str) -> dict[str, tuple[int, int]]:
+    result = session.execute(select(TABLE.c.team_name, TABLE.c.id, TABLE.c.total_wins).where(TABLE.c.league == league))
+    return {team: (row_id, wins) for team, row_id, wins in result}
+
+
+def catalog(session: Session) -> dict:
+    return {
+        "indexes": sorted(
+            session.scalars(text("SELECT indexname FROM pg_indexes WHERE tablename = :t"), {"t": TABLE.name})
+        ),
+        "constraints": sorted(
+            session.scalars(
+                text("SELECT conname FROM pg_constraint WHERE conrelid = CAST(:t AS regclass)"), {"t": TABLE.name}
+            )
+        ),
+        "sequence": session.scalar(text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": TABLE.name}),
+    }
+
+
+def test_swap_replaces_one_league_and_keeps_the_rest(pg_session):
+    before = catalog(pg_session)
+    pg_session.execute(text(f"GRANT SELECT ON {TABLE.name} TO PUBLIC"))
+    swap_replace_rows(pg_session, TABLE, standings(["Acadia", "UPEI"]), {"league": "m"})
+    swap_replace_rows(pg_session, TABLE, standings(["Carleton", "Ottawa"]), {"league": "w"})
+    pg_session.commit()
+    women = rows(pg_session, "w")
+
+    result = swap_replace_rows(pg_session, TABLE, standings(["Acadia", "UPEI", "StFX"], wins=7), {"league": "m"})
+    pg_session.commit()
+
+    assert (result.inserted, result.deleted) == (3, 2)
+    assert rows(pg_session, "w") == women
+    men = rows(pg_session, "m")
+    assert sorted(men) == ["Acadia", "StFX", "UPEI"] and {wins for _, wins in men.values()} == {7}
+    # New rows draw ids from the same sequence, after every id handed out before
+    assert min(row_id for row_id, _ in men.values()) > max(row_id for row_id, _ in women.values())
+    assert catalog(pg_session) == before
+    assert pg_session.scalar(text("SELECT has_table_privilege('public', :t, 'SELECT')"), {"t": TABLE.name})
+    leftovers = "SELECT count(*) FROM pg_class WHERE relname LIKE :t || '\\_\\_%'"
+    assert pg_session.scalar(text(leftovers), {"t": TABLE.name}) == 0
+
+
+def test_swap_is_rolled_back_with_the_transaction(pg_session):
+    swap_replace_rows(pg_session, TABLE, standings(["Acadia"]), {"league": "m"})
+    pg_session.commit()
+    oid = pg_session.scalar(text("SELECT CAST(:t AS regclass)::oid"), {"t": TABLE.name})
+
+    swap_replace_rows(pg_session, TABLE, standings(["UPEI"]), {"league": "m"})
+    pg_session.rollback()
+
+    assert pg_session.scalar(text("SELECT CAST(:t AS regclass)::oid"), {"t": TABLE.name}) == oid
+    assert list(rows(pg_session, "m")) == ["Acadia"]
+
+
+def test_tables_with_views_are_not_swapped(pg_session):
+    pg_session.execute(text(f"CREATE VIEW standings_view AS SELECT * FROM {TABLE.name}"))
+    pg_session.commit()
+    oid = pg_session.scalar(text("SELECT CAST(:t AS regclass)::oid"), {"t": TABLE.name})
+
+    swap_replace_rows(pg_session, TABLE, standings(["Acadia"]), {"league": "m"})
+    pg_session.commit()
+
+    assert pg_session.scalar(text("SELECT CAST(:t AS regclass)::oid"), {"t": TABLE.name}) == oid
+    assert pg_session.scalar(text("SELECT count(*) FROM standings_view")) == 1
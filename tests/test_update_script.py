@@ -0,0 +1,31 @@
+"""The update script overrides a pipeline's load and write modes only when they are given"""
+
+from scripts.update_all_usports_db import configure_pipelines
+from src.config.settings import PLAYER_LOAD_MODE, WRITE_MODE
+from src.pipelines.usports.basketball import BasketballPipeline
+from src.utils.constants import COPY_BINARY, INCREMENTAL, INSERT, REPLACE, SWAP
+
+
+class CustomPipeline(BasketballPipeline):
+    player_load_mode = COPY_BINARY
+    write_mode = INCREMENTAL
+
+
+def test_modes_not_given_keep_the_pipelines_own():
+    default, custom = BasketballPipeline(), CustomPipeline()
+
+    configure_pipelines([default, custom])
+
+    assert (default.player_load_mode, default.write_mode) == (PLAYER_LOAD_MODE, WRITE_MODE)
+    assert (custom.player_load_mode, custom.write_mode) == (COPY_BINARY, INCREMENTAL)
+    assert custom.skip_unchanged
+
+
+def test_given_modes_override_every_pipeline():
+    pipelines = [BasketballPipeline(), CustomPipeline()]
+
+    configure_pipelines(pipelines, player_load_mode=INSERT, standings_load_mode=SWAP, write_mode=REPLACE, force=True)
+
+    for pipeline in pipelines:
+        assert (pipeline.player_load_mode, pipeline.standings_load_mode, pipeline.write_mode) == (INSERT, SWAP, REPLACE)
+        assert not pipeline.skip_unchanged
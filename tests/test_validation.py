@@ -0,0 +1,45 @@
+"""ValidatedFrames only come out of a passed validation, and passed content is not validated twice"""
+
+import pandas as pd
+import pytest
+
+from src.pipelines.usports.basketball import BasketballPipeline
+from src.pipelines.validation import PreparedFrames, ValidatedFrames, validation_cache
+from src.validations.schema import SchemaValidationError
+
+FINGERPRINTS = {"teams": ("abc", 1), "players": ("def", 1)}
+
+
+def prepared() -> PreparedFrames:
+    return PreparedFrames(None, pd.DataFrame(), pd.DataFrame(), FINGERPRINTS)
+
+
+def test_validated_frames_cannot_be_constructed_directly():
+    with pytest.raises(TypeError):
+        ValidatedFrames(None, pd.DataFrame(), pd.DataFrame(), FINGERPRINTS)
+
+
+def test_validate_returns_validated_frames(monkeypatch):
+    pipeline = BasketballPipeline()
+    calls = []
+    monkeypatch.setattr(pipeline, "validate_data", lambda *frames: calls.append(frames))
+
+    first = pipeline.validate("m", "regular", prepared())
+    pipeline.validate("w", "regular", prepared())
+
+    assert isinstance(first, ValidatedFrames) and first.fingerprints == FINGERPRINTS
+    # Same content: validated once per run, whatever league it arrives with
+    assert len(calls) == 1 and validation_cache.passed(pipeline.sport_name, FINGERPRINTS)
+
+
+def test_failed_validation_is_not_cached(monkeypatch):
+    pipeline = BasketballPipeline()
+
+    def reject(*frames):
+        raise SchemaValidationError(["teams.team_name: not null (1 rows)"])
+
+    monkeypatch.setattr(pipeline, "validate_data", reject)
+
+    with pytest.raises(SchemaValidationError):
+        pipeline.validate("m", "regular", prepared())
+    assert not validation_cache.passed(pipeline.sport_name, FINGERPRINTS)